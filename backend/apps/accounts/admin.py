@@ -1,7 +1,30 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
+from apps.tech.pagination import EstimatedCountPaginator
 from .models import Profile, User, EmailVerificationCode
 
-admin.site.register(User)
-admin.site.register(Profile)
-admin.site.register(EmailVerificationCode)
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Profile)
+class ProfileAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "type", "phone_number"]
+    # __str__ of the profile shows the username
+    list_select_related = ["user"]
+    list_filter = ["type"]
+    search_fields = ["user__username", "phone_number"]
+    raw_id_fields = ["user"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(EmailVerificationCode)
+class EmailVerificationCodeAdmin(admin.ModelAdmin):
+    list_display = ["__str__"]
+    list_select_related = ["user"]
+    raw_id_fields = ["user"]
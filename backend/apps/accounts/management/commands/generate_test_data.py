@@ -275,6 +275,8 @@ class Command(BaseCommand):
                 )
 
         self.Part.objects.bulk_create(parts_to_create)
+        # bulk_create skips post_save, which fills the typeahead search text
+        self.Part.objects.filter(search_text="").refresh_search()
         self.stdout.write(self.style.SUCCESS(f"{len(parts_to_create)} new parts generated."))
 
     def generate_locations(self):
@@ -301,6 +303,7 @@ class Command(BaseCommand):
                     )
                 )
         self.StockItem.objects.bulk_create(stock_items)
+        self.StockItem.objects.record_receipts(stock_items)
 
     def generate_store_orders(self):
         suppliers = list(self.Supplier.objects.all())
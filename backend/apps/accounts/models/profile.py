@@ -25,3 +25,15 @@ class Profile(models.Model):
 
     def __str__(self):
         return f"{self.user.username} Profile"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Phone number as loaded, so saves that keep it do not refresh the client's repair list entries
+        instance._loaded_phone_number = instance.__dict__.get("phone_number")
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the previous phone number, the saved one is now current
+        self._loaded_phone_number = self.phone_number
@@ -2,6 +2,8 @@ import logging
 
 from rest_framework import serializers
 
+from apps.tech.serializers.image_derivatives import ImageDerivativesField
+
 from ..models import Profile
 
 logger = logging.getLogger(__name__)
@@ -10,6 +12,7 @@ logger = logging.getLogger(__name__)
 class ProfileSerializer(serializers.ModelSerializer):
     phone_number = serializers.CharField(required=False, allow_blank=True)
     profile_picture = serializers.ImageField(required=False, allow_null=True)
+    profile_picture_derivatives = ImageDerivativesField(source="profile_picture")
 
     class Meta:
         model = Profile
@@ -19,6 +22,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             "address",
             "date_of_birth",
             "profile_picture",
+            "profile_picture_derivatives",
             "type",
         )
 
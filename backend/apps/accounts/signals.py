@@ -2,6 +2,8 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.apps import apps
 
+from apps.tech.images import schedule_derivatives
+
 import secrets
 import string
 
@@ -16,3 +18,8 @@ def create_user_profile(sender, instance, created, **kwargs):
 def save_user_profile(sender, instance, **kwargs):
     instance.profile.save()
 
+
+@receiver(post_save, sender=apps.get_model('accounts', 'Profile'))
+def render_profile_picture_derivatives(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_derivatives(instance.profile_picture)
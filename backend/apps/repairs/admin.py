@@ -1,8 +1,94 @@
 from django.contrib import admin
-from .models import Issue, Repair, PartQualityTier, ServicePricing, RepairIssue
+from apps.tech.admin import LargeTableAdmin
+from .models import Issue, Repair, PartQualityTier, ServicePricing, RepairIssue, RepricingJob, StockReservation
 
-admin.site.register(Repair)
-admin.site.register(Issue)
-admin.site.register(PartQualityTier)
-admin.site.register(ServicePricing)
-admin.site.register(RepairIssue)
\ No newline at end of file
+
+class RepairIssueInline(admin.TabularInline):
+    model = RepairIssue
+    extra = 0
+    autocomplete_fields = ["issue", "quality_tier"]
+
+
+@admin.register(Repair)
+class RepairAdmin(LargeTableAdmin):
+    list_display = ["uid", "date", "client", "product_model", "status", "device_category", "price"]
+    # __str__ of the repair shows the client, the one of the product model its brand
+    list_select_related = ["client", "product_model__brand"]
+    list_filter = ["status", "device_category"]
+    search_fields = ["uid"]
+    # Clients are picked by id, the user table is too large for a dropdown
+    raw_id_fields = ["client"]
+    autocomplete_fields = ["product_model"]
+    readonly_fields = ["price"]
+    ordering = ["-date", "id"]
+    inlines = [RepairIssueInline]
+
+    def get_search_results(self, request, queryset, search_term):
+        # Same indexed full-text and trigram search as the repairs API
+        if not search_term:
+            return queryset, False
+        return queryset.search([search_term]), False
+
+
+@admin.register(Issue)
+class IssueAdmin(admin.ModelAdmin):
+    list_display = ["name", "category_type", "base_price", "associated_part", "requires_part"]
+    list_select_related = ["associated_part"]
+    list_filter = ["category_type", "device_types"]
+    search_fields = ["name"]
+    autocomplete_fields = ["associated_part"]
+    filter_horizontal = ["device_types"]
+
+
+@admin.register(PartQualityTier)
+class PartQualityTierAdmin(LargeTableAdmin):
+    list_display = ["__str__", "quality_tier", "price", "warranty_days", "availability_status"]
+    # __str__ of the tier shows its part
+    list_select_related = ["part"]
+    list_filter = ["quality_tier", "availability_status"]
+    search_fields = ["=part__sku", "=part__ean13", "part__name"]
+    autocomplete_fields = ["part"]
+    ordering = ["id"]
+
+
+@admin.register(ServicePricing)
+class ServicePricingAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "pricing_type", "base_price", "complexity_level"]
+    # __str__ of the service pricing shows its issue
+    list_select_related = ["issue"]
+    list_filter = ["pricing_type", "complexity_level"]
+    search_fields = ["issue__name"]
+    autocomplete_fields = ["issue"]
+
+
+@admin.register(RepairIssue)
+class RepairIssueAdmin(LargeTableAdmin):
+    list_display = ["__str__", "quality_tier", "custom_price"]
+    # __str__ of the repair issue shows the repair and the issue, the one of the tier its part
+    list_select_related = ["repair", "issue", "quality_tier__part"]
+    search_fields = ["=repair__uid"]
+    raw_id_fields = ["repair"]
+    autocomplete_fields = ["issue", "quality_tier"]
+
+
+@admin.register(RepricingJob)
+class RepricingJobAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "status", "all_open_repairs", "created_at", "finished_at"]
+    list_filter = ["status"]
+    readonly_fields = [field.name for field in RepricingJob._meta.fields]
+
+
+@admin.register(StockReservation)
+class StockReservationAdmin(LargeTableAdmin):
+    list_display = ["created_at", "part", "location", "quantity", "status", "repair_issue"]
+    list_select_related = ["part", "location", "repair_issue__repair", "repair_issue__issue"]
+    list_filter = ["status", "location"]
+    search_fields = ["=part__sku", "=part__ean13", "=repair_issue__repair__uid"]
+    ordering = ["-created_at", "id"]
+
+    # Reservations change stock levels, they are made and released by StockReservation.objects
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -7,3 +7,6 @@ class RepairsConfig(AppConfig):
 
     class Meta:
         app_label = "repairs"
+
+    def ready(self):
+        import apps.repairs.signals  # noqa
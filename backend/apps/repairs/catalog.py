@@ -0,0 +1,35 @@
+"""
+Cached issue catalog.
+
+The serialized issue list is cached under a version number that signals bump
+whenever an issue, its pricing or its part changes (see apps.tech.versioned_cache),
+and clients revalidating with the ETag of the current version get a 304
+without touching the database.
+"""
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.http import urlencode
+
+from apps.tech.versioned_cache import bump_cache_version, cache_version, content_etag
+
+CATALOG_NAME = 'issue-catalog'
+
+
+def catalog_version():
+    return cache_version(CATALOG_NAME)
+
+
+def bump_catalog_version():
+    bump_cache_version(CATALOG_NAME)
+
+
+def catalog_key(version, query_params):
+    query = urlencode(sorted(query_params.lists()), doseq=True)
+    return f'{CATALOG_NAME}:{version}:{hashlib.sha256(query.encode()).hexdigest()}'
+
+
+def catalog_etag(data):
+    content = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(',', ':'))
+    return content_etag(content.encode())
@@ -0,0 +1,94 @@
+"""
+Live repair events.
+
+Repair writes publish a small JSON payload with PostgreSQL NOTIFY; it is only
+delivered once the writing transaction commits. Each ASGI worker holds a single
+LISTEN connection and fans the payloads out to its connected event streams.
+"""
+import asyncio
+import json
+import logging
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'repair_events'
+
+# Payloads buffered per subscriber before the oldest are dropped
+SUBSCRIBER_BUFFER = 100
+# Seconds to wait before reconnecting a lost LISTEN connection
+RECONNECT_DELAY = 5
+
+
+def notify_repair_event(repair, event, using='default', previous_status=None):
+    payload = {
+        'event': event,
+        'id': repair.pk,
+        'uid': repair.uid,
+        'status': repair.status,
+        'previous_status': previous_status,
+        'date': repair.date,
+        'updated_at': repair.updated_at,
+    }
+    with connections[using].cursor() as cursor:
+        cursor.execute('SELECT pg_notify(%s, %s)', [CHANNEL, json.dumps(payload, cls=DjangoJSONEncoder)])
+
+
+def listen_conninfo(using='default'):
+    params = connections[using].get_connection_params()
+    # Django-specific connection arguments, not part of a libpq conninfo
+    for key in ('cursor_factory', 'context', 'prepare_threshold'):
+        params.pop(key, None)
+    return make_conninfo(**params)
+
+
+class RepairEventBroker:
+    """
+    Shares one LISTEN connection between the event streams of the process.
+    The listener starts with the first subscriber and stops with the last one.
+    """
+
+    def __init__(self, channel=CHANNEL, using='default'):
+        self.channel = channel
+        self.using = using
+        self.subscribers = set()
+        self.listener = None
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_BUFFER)
+        self.subscribers.add(queue)
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen(listen_conninfo(self.using)))
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers and self.listener is not None:
+            self.listener.cancel()
+            self.listener = None
+
+    def publish(self, payload):
+        for queue in self.subscribers:
+            if queue.full():
+                # A stalled screen loses its oldest events rather than holding up the others
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    async def listen(self, conninfo):
+        while True:
+            try:
+                connection = await psycopg.AsyncConnection.connect(conninfo, autocommit=True)
+                async with connection:
+                    await connection.execute(f'LISTEN {self.channel}')
+                    async for notify in connection.notifies():
+                        self.publish(notify.payload)
+            except psycopg.OperationalError:
+                logger.exception('Repair events listener lost its connection, reconnecting')
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+broker = RepairEventBroker()
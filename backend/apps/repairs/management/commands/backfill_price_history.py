@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.repairs.models import (
+    PartQualityTier,
+    PartQualityTierPriceHistory,
+    ServicePricing,
+    ServicePricingHistory,
+)
+
+
+class Command(BaseCommand):
+    help = 'Opens a price history period, from their creation day, for quality tiers and service pricing without history.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of history rows created per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        sources = (
+            (PartQualityTier, PartQualityTierPriceHistory, 'price'),
+            (ServicePricing, ServicePricingHistory, 'base_price'),
+        )
+        for model, history_model, price_field in sources:
+            rows = model.objects.filter(price_history__isnull=True).values_list('pk', price_field, 'created_at')
+            history = [
+                history_model(
+                    **{f'{history_model.PRICED_FIELD}_id': pk},
+                    price=price,
+                    valid_from=timezone.localdate(created_at),
+                )
+                for pk, price, created_at in rows.iterator()
+            ]
+            history_model.objects.bulk_create(history, batch_size=options['batch_size'])
+            self.stdout.write(f'{model._meta.verbose_name_plural}: {len(history)} periods opened')
+
+        self.stdout.write(self.style.SUCCESS('Price history backfill complete.'))
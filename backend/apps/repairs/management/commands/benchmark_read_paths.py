@@ -0,0 +1,91 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+# Sync endpoint -> its async counterpart
+READ_PATHS = [
+    ('/api/repairs/repairs/', '/api/repairs/async/repairs/'),
+    ('/api/repairs/issues/', '/api/repairs/async/issues/'),
+    ('/api/tech/brands/', '/api/tech/async/brands/'),
+    ('/api/tech/product-models/', '/api/tech/async/product-models/'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compares throughput and latency of the sync and async read endpoints of a running server under concurrent load.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--base-url',
+            type=str,
+            default='http://localhost:8000',
+            help='Server to benchmark, e.g. the uvicorn instance (default: http://localhost:8000)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Number of requests in flight (default: 32)'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=500,
+            help='Number of requests per endpoint (default: 500)'
+        )
+        parser.add_argument(
+            '--query',
+            type=str,
+            default='',
+            help='Query string appended to every endpoint, e.g. "page=2"'
+        )
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        query = f"?{options['query']}" if options['query'] else ''
+
+        self.stdout.write(f"{'endpoint':<40} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for sync_path, async_path in READ_PATHS:
+            for path in (sync_path, async_path):
+                result = self.run(f'{base_url}{path}{query}', options['concurrency'], options['requests'])
+                self.stdout.write(
+                    f"{path:<40} {result['throughput']:>8.1f} {result['p50']:>8.1f} "
+                    f"{result['p99']:>8.1f} {result['errors']:>7}"
+                )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete.'))
+
+    def run(self, url, concurrency, count):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        def fetch(_):
+            started = time.perf_counter()
+            try:
+                ok = session.get(url, headers={'Accept': 'application/json'}, timeout=30).status_code == 200
+            except requests.RequestException:
+                ok = False
+            return ok, (time.perf_counter() - started) * 1000
+
+        try:
+            session.get(url, timeout=30)  # warm-up, and fail fast when the server is down
+        except requests.RequestException as exc:
+            raise CommandError(f'Cannot reach {url}: {exc}')
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(fetch, range(count)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for _, latency in results)
+        return {
+            'throughput': count / elapsed,
+            'p50': statistics.median(latencies),
+            'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+            'errors': sum(1 for ok, _ in results if not ok),
+        }
@@ -1,8 +1,12 @@
 import csv
+import json
 import os
-from django.core.management.base import BaseCommand
+import time
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from apps.repairs.models.repair import Repair
+from apps.repairs.projections import schedule_repair_refresh
 from apps.tech.models import ProductModel
 from datetime import datetime
 from decimal import Decimal
@@ -10,9 +14,43 @@ import re
 
 User = get_user_model()
 
+# Lookup map value of a key shared by several rows
+MULTIPLE = object()
+
+# Repair fields written by the importer, besides uid
+IMPORTED_FIELDS = [
+    'date', 'client', 'product_model', 'description', 'password', 'price',
+    'card_payment', 'cash_payment', 'comment', 'device_photo', 'file',
+]
+
+
 class Command(BaseCommand):
     help = 'Loads reparation data from reparations_raw.csv into Repair model.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Resolve clients and models from in-memory maps and upsert repairs in batches'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows upserted and committed per batch in bulk mode (default: 1000)'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='In bulk mode, skip the rows committed by a previous interrupted run'
+        )
+        parser.add_argument(
+            '--checkpoint-file',
+            type=str,
+            default=os.path.join('source_data', 'reparations_raw.checkpoint.json'),
+            help='Where bulk mode records the number of committed rows'
+        )
+
     def handle(self, *args, **options):
         csv_file_path = os.path.join('source_data', 'reparations_raw.csv')
 
@@ -20,125 +58,278 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(f'CSV file not found at {csv_file_path}'))
             return
 
+        if options['bulk']:
+            self.handle_bulk(csv_file_path, options)
+        else:
+            self.handle_rows(csv_file_path)
+
+        self.stdout.write(self.style.SUCCESS('Reparation data loading complete.'))
+
+    def handle_rows(self, csv_file_path):
         with open(csv_file_path, mode='r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             for row in reader:
-                uid = row.get('UID', '').strip()
-                date_str = row.get('Date', '').strip()
-                client_name = row.get('Client', '').strip()
-                model_name = row.get('Model', '').strip()
-                description = row.get('Description de la Panne', '').strip()
-                password = row.get('Mot de Pass', '').strip()
-                price_str = row.get('Prix', '0.00').strip().replace('$', '')
-                card_payment_str = row.get('Carte', '0.00').strip().replace('$', '')
-                cash_payment_str = row.get('Espèce', '0.00').strip().replace('$', '')
-                comment = row.get('Commentaire', '').strip()
-                device_photo_path = row.get("Photo de l'appareil", '').strip()
-                file_path = row.get('File', '').strip()
-
-                if not uid:
-                    self.stderr.write(self.style.WARNING(f'Skipping row due to missing UID: {row}'))
+                data = self.parse_row(row, self.find_client, self.find_product_model)
+                if data is None:
                     continue
-
-                # Date parsing
-                repair_date = None
-                try:
-                    # Assuming date format is M/D/YY or M/D/YYYY
-                    repair_date = datetime.strptime(date_str, '%m/%d/%y').date()
-                except ValueError:
-                    try:
-                        repair_date = datetime.strptime(date_str, '%m/%d/%Y').date()
-                    except ValueError:
-                        self.stderr.write(self.style.WARNING(f'Could not parse date "{date_str}" for UID {uid}. Skipping date.'))
-
-                # Client matching
-                client_user = None
-                if client_name:
-                    # Try to match by full name (first_name + last_name) or username
-                    name_parts = client_name.split(' ', 1)
-                    first_name = name_parts[0] if name_parts else ''
-                    last_name = name_parts[1] if len(name_parts) > 1 else ''
-
-                    # Attempt to find user by first_name and last_name
-                    try:
-                        client_user = User.objects.get(first_name=first_name, last_name=last_name)
-                    except User.DoesNotExist:
-                        # If not found, try by username (e.g., client_ID)
-                        try:
-                            client_user = User.objects.get(username=f'client_{client_name}') # This might not work if client_name is not the ID
-                        except User.DoesNotExist:
-                            self.stderr.write(self.style.WARNING(f'Client "{client_name}" not found for UID {uid}. Skipping client association.'))
-                    except User.MultipleObjectsReturned:
-                        self.stderr.write(self.style.WARNING(f'Multiple clients found for "{client_name}" for UID {uid}. Skipping client association.'))
-                
-                if not client_user:
-                    self.stderr.write(self.style.WARNING(f'No client user found or associated for UID {uid}. Repair will be created without a client.'))
-
-
-                # ProductModel matching
-                product_model_obj = None
-                if model_name:
-                    try:
-                        # Case-insensitive search for product model name
-                        product_model_obj = ProductModel.objects.get(name__iexact=model_name)
-                    except ProductModel.DoesNotExist:
-                        self.stderr.write(self.style.WARNING(f'Product model "{model_name}" not found for UID {uid}. Skipping product model association.'))
-                    except ProductModel.MultipleObjectsReturned:
-                        self.stderr.write(self.style.WARNING(f'Multiple product models found for "{model_name}" for UID {uid}. Skipping product model association.'))
-
-                # Decimal conversions
-                try:
-                    price = Decimal(price_str)
-                except Exception:
-                    price = Decimal('0.00')
-                    self.stderr.write(self.style.WARNING(f'Could not parse price "{price_str}" for UID {uid}. Defaulting to 0.00.'))
-
-                try:
-                    card_payment = Decimal(card_payment_str)
-                except Exception:
-                    card_payment = Decimal('0.00')
-                    self.stderr.write(self.style.WARNING(f'Could not parse card payment "{card_payment_str}" for UID {uid}. Defaulting to 0.00.'))
-
-                try:
-                    cash_payment = Decimal(cash_payment_str)
-                except Exception:
-                    cash_payment = Decimal('0.00')
-                    self.stderr.write(self.style.WARNING(f'Could not parse cash payment "{cash_payment_str}" for UID {uid}. Defaulting to 0.00.'))
+                uid = data.pop('uid')
 
                 # Create or update Repair
-                repair, created = Repair.objects.get_or_create(
-                    uid=uid,
-                    defaults={
-                        'date': repair_date,
-                        'client': client_user,
-                        'product_model': product_model_obj,
-                        'description': description,
-                        'password': password,
-                        'price': price,
-                        'card_payment': card_payment,
-                        'cash_payment': cash_payment,
-                        'comment': comment,
-                        # For device_photo and file, we'll just store the path string for now.
-                        # Actual file handling (uploading, saving) is more complex and out of scope for a simple loader.
-                        'device_photo': device_photo_path,
-                        'file': file_path,
-                    }
-                )
+                repair, created = Repair.objects.get_or_create(uid=uid, defaults=data)
                 if not created:
                     # Update existing repair
-                    repair.date = repair_date
-                    repair.client = client_user
-                    repair.product_model = product_model_obj
-                    repair.description = description
-                    repair.password = password
-                    repair.price = price
-                    repair.card_payment = card_payment
-                    repair.cash_payment = cash_payment
-                    repair.comment = comment
-                    repair.device_photo = device_photo_path
-                    repair.file = file_path
+                    for field, value in data.items():
+                        setattr(repair, field, value)
                     repair.save()
 
                 self.stdout.write(self.style.SUCCESS(f'Successfully processed repair: {uid}'))
 
-        self.stdout.write(self.style.SUCCESS('Reparation data loading complete.'))
+    def handle_bulk(self, csv_file_path, options):
+        batch_size = options['batch_size']
+        checkpoint_path = options['checkpoint_file']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+
+        skip_rows = 0
+        if options['resume']:
+            skip_rows = self.read_checkpoint(checkpoint_path, csv_file_path)
+            if skip_rows:
+                self.stdout.write(f'Resuming after {skip_rows} committed rows')
+
+        clients_by_name, clients_by_username = self.build_client_maps()
+        product_models = self.build_product_model_map()
+
+        def find_client(client_name, uid):
+            name_parts = client_name.split(' ', 1)
+            first_name = name_parts[0] if name_parts else ''
+            last_name = name_parts[1] if len(name_parts) > 1 else ''
+            pk = clients_by_name.get((first_name, last_name))
+            if pk is MULTIPLE:
+                self.stderr.write(self.style.WARNING(f'Multiple clients found for "{client_name}" for UID {uid}. Skipping client association.'))
+                return None
+            if pk is None:
+                pk = clients_by_username.get(f'client_{client_name}')
+            if pk is None:
+                self.stderr.write(self.style.WARNING(f'Client "{client_name}" not found for UID {uid}. Skipping client association.'))
+                return None
+            return User(pk=pk)
+
+        def find_product_model(model_name, uid):
+            pk = product_models.get(model_name.lower())
+            if pk is MULTIPLE:
+                self.stderr.write(self.style.WARNING(f'Multiple product models found for "{model_name}" for UID {uid}. Skipping product model association.'))
+                return None
+            if pk is None:
+                self.stderr.write(self.style.WARNING(f'Product model "{model_name}" not found for UID {uid}. Skipping product model association.'))
+                return None
+            return ProductModel(pk=pk)
+
+        started = time.monotonic()
+        processed = skip_rows
+        with open(csv_file_path, mode='r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            batch = []
+            for row_number, row in enumerate(reader, start=1):
+                if row_number <= skip_rows:
+                    continue
+                batch.append(row)
+                if len(batch) == batch_size:
+                    self.import_batch(batch, find_client, find_product_model)
+                    processed += len(batch)
+                    self.write_checkpoint(checkpoint_path, csv_file_path, processed)
+                    self.report_throughput(processed - skip_rows, started)
+                    batch = []
+            if batch:
+                self.import_batch(batch, find_client, find_product_model)
+                processed += len(batch)
+                self.report_throughput(processed - skip_rows, started)
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    def import_batch(self, rows, find_client, find_product_model):
+        repairs = {}
+        processed_uids = []
+        for row in rows:
+            data = self.parse_row(row, find_client, find_product_model)
+            if data is None:
+                continue
+            # Rows without a client or a date cannot be stored: both columns are required
+            if data['client'] is None or data['date'] is None:
+                self.stderr.write(self.style.WARNING(f'Skipping repair {data["uid"]}: a client and a date are required.'))
+                continue
+            # A uid repeated in the file keeps its last row, as the row-by-row import does
+            repairs[data['uid']] = Repair(**data)
+            processed_uids.append(data['uid'])
+
+        with transaction.atomic():
+            # Previous days of updated repairs, for the dashboard rollups
+            previous_days = Repair.objects.filter(uid__in=repairs).values_list('date', flat=True)
+            saved = Repair.objects.bulk_create(
+                repairs.values(),
+                update_conflicts=True,
+                unique_fields=['uid'],
+                update_fields=IMPORTED_FIELDS + ['updated_at'],
+            )
+            # bulk_create sends no signals: refresh the repair projections explicitly
+            schedule_repair_refresh([repair.pk for repair in saved], days=set(previous_days))
+
+        for uid in processed_uids:
+            self.stdout.write(self.style.SUCCESS(f'Successfully processed repair: {uid}'))
+
+    def report_throughput(self, count, started):
+        elapsed = time.monotonic() - started
+        rate = count / elapsed if elapsed else count
+        self.stdout.write(f'Committed {count} rows in {elapsed:.1f}s ({rate:.0f} rows/s)')
+
+    def read_checkpoint(self, checkpoint_path, csv_file_path):
+        if not os.path.exists(checkpoint_path):
+            return 0
+        with open(checkpoint_path, encoding='utf-8') as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint.get('csv_file') != os.path.abspath(csv_file_path):
+            raise CommandError(f'Checkpoint {checkpoint_path} belongs to another file: {checkpoint.get("csv_file")}')
+        return checkpoint['rows']
+
+    def write_checkpoint(self, checkpoint_path, csv_file_path, rows):
+        # Written to a temporary file first so a crash never leaves a truncated checkpoint
+        temporary_path = f'{checkpoint_path}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump({'csv_file': os.path.abspath(csv_file_path), 'rows': rows}, checkpoint_file)
+        os.replace(temporary_path, checkpoint_path)
+
+    def build_client_maps(self):
+        """
+        User ids by (first_name, last_name) and by username, loaded in one query.
+        Names shared by several users map to MULTIPLE, as User.objects.get would fail on them.
+        """
+        by_name = {}
+        by_username = {}
+        for pk, username, first_name, last_name in User.objects.values_list(
+            'pk', 'username', 'first_name', 'last_name'
+        ).iterator():
+            key = (first_name, last_name)
+            by_name[key] = MULTIPLE if key in by_name else pk
+            by_username[username] = pk
+        return by_name, by_username
+
+    def build_product_model_map(self):
+        """
+        ProductModel ids by lower-cased name, the in-memory form of name__iexact.
+        """
+        product_models = {}
+        for pk, name in ProductModel.objects.values_list('pk', 'name').iterator():
+            key = name.lower()
+            product_models[key] = MULTIPLE if key in product_models else pk
+        return product_models
+
+    def find_client(self, client_name, uid):
+        # Try to match by full name (first_name + last_name) or username
+        name_parts = client_name.split(' ', 1)
+        first_name = name_parts[0] if name_parts else ''
+        last_name = name_parts[1] if len(name_parts) > 1 else ''
+
+        # Attempt to find user by first_name and last_name
+        try:
+            return User.objects.get(first_name=first_name, last_name=last_name)
+        except User.DoesNotExist:
+            # If not found, try by username (e.g., client_ID)
+            try:
+                return User.objects.get(username=f'client_{client_name}') # This might not work if client_name is not the ID
+            except User.DoesNotExist:
+                self.stderr.write(self.style.WARNING(f'Client "{client_name}" not found for UID {uid}. Skipping client association.'))
+        except User.MultipleObjectsReturned:
+            self.stderr.write(self.style.WARNING(f'Multiple clients found for "{client_name}" for UID {uid}. Skipping client association.'))
+        return None
+
+    def find_product_model(self, model_name, uid):
+        try:
+            # Case-insensitive search for product model name
+            return ProductModel.objects.get(name__iexact=model_name)
+        except ProductModel.DoesNotExist:
+            self.stderr.write(self.style.WARNING(f'Product model "{model_name}" not found for UID {uid}. Skipping product model association.'))
+        except ProductModel.MultipleObjectsReturned:
+            self.stderr.write(self.style.WARNING(f'Multiple product models found for "{model_name}" for UID {uid}. Skipping product model association.'))
+        return None
+
+    def parse_row(self, row, find_client, find_product_model):
+        """
+        Clean a CSV row into Repair field values, or None when the row is skipped.
+        Clients and product models are resolved by the given callables.
+        """
+        uid = row.get('UID', '').strip()
+        date_str = row.get('Date', '').strip()
+        client_name = row.get('Client', '').strip()
+        model_name = row.get('Model', '').strip()
+        description = row.get('Description de la Panne', '').strip()
+        password = row.get('Mot de Pass', '').strip()
+        price_str = row.get('Prix', '0.00').strip().replace('$', '')
+        card_payment_str = row.get('Carte', '0.00').strip().replace('$', '')
+        cash_payment_str = row.get('Espèce', '0.00').strip().replace('$', '')
+        comment = row.get('Commentaire', '').strip()
+        device_photo_path = row.get("Photo de l'appareil", '').strip()
+        file_path = row.get('File', '').strip()
+
+        if not uid:
+            self.stderr.write(self.style.WARNING(f'Skipping row due to missing UID: {row}'))
+            return None
+
+        # Date parsing
+        repair_date = None
+        try:
+            # Assuming date format is M/D/YY or M/D/YYYY
+            repair_date = datetime.strptime(date_str, '%m/%d/%y').date()
+        except ValueError:
+            try:
+                repair_date = datetime.strptime(date_str, '%m/%d/%Y').date()
+            except ValueError:
+                self.stderr.write(self.style.WARNING(f'Could not parse date "{date_str}" for UID {uid}. Skipping date.'))
+
+        # Client matching
+        client_user = None
+        if client_name:
+            client_user = find_client(client_name, uid)
+
+        if not client_user:
+            self.stderr.write(self.style.WARNING(f'No client user found or associated for UID {uid}. Repair will be created without a client.'))
+
+        # ProductModel matching
+        product_model_obj = None
+        if model_name:
+            product_model_obj = find_product_model(model_name, uid)
+
+        # Decimal conversions
+        try:
+            price = Decimal(price_str)
+        except Exception:
+            price = Decimal('0.00')
+            self.stderr.write(self.style.WARNING(f'Could not parse price "{price_str}" for UID {uid}. Defaulting to 0.00.'))
+
+        try:
+            card_payment = Decimal(card_payment_str)
+        except Exception:
+            card_payment = Decimal('0.00')
+            self.stderr.write(self.style.WARNING(f'Could not parse card payment "{card_payment_str}" for UID {uid}. Defaulting to 0.00.'))
+
+        try:
+            cash_payment = Decimal(cash_payment_str)
+        except Exception:
+            cash_payment = Decimal('0.00')
+            self.stderr.write(self.style.WARNING(f'Could not parse cash payment "{cash_payment_str}" for UID {uid}. Defaulting to 0.00.'))
+
+        return {
+            'uid': uid,
+            'date': repair_date,
+            'client': client_user,
+            'product_model': product_model_obj,
+            'description': description,
+            'password': password,
+            'price': price,
+            'card_payment': card_payment,
+            'cash_payment': cash_payment,
+            'comment': comment,
+            # For device_photo and file, we'll just store the path string for now.
+            # Actual file handling (uploading, saving) is more complex and out of scope for a simple loader.
+            'device_photo': device_photo_path,
+            'file': file_path,
+        }
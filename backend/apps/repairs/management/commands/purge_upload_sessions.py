@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.repairs.models import UploadSession
+
+
+class Command(BaseCommand):
+    help = 'Deletes upload sessions, and their partial files, that saw no activity for a while.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=48,
+            help='Age in hours of the last chunk of the sessions to delete (default: 48)'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        sessions = UploadSession.objects.filter(updated_at__lt=cutoff)
+
+        deleted_count = 0
+        for session in sessions.iterator():
+            session.delete_part()
+            deleted_count += 1
+        sessions.delete()
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted_count} upload sessions.'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from apps.repairs.models import Repair
+from apps.repairs.projections import refresh_repairs
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the repair read models: board list entries and search documents.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of repairs refreshed per batch (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        repair_ids = list(Repair.objects.order_by('pk').values_list('pk', flat=True))
+
+        for start in range(0, len(repair_ids), batch_size):
+            refresh_repairs(repair_ids[start:start + batch_size])
+            self.stdout.write(f'Refreshed {min(start + batch_size, len(repair_ids))}/{len(repair_ids)} repairs')
+
+        self.stdout.write(self.style.SUCCESS('Repair read models rebuild complete.'))
@@ -0,0 +1,50 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.repairs.models import Repair, RepairDailyRollup
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the daily repair rollups read by the repairs dashboard.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            type=str,
+            help='First day to rebuild, YYYY-MM-DD (default: the first repair day)'
+        )
+        parser.add_argument(
+            '--until',
+            type=str,
+            help='Last day to rebuild, YYYY-MM-DD (default: the last repair day)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=31,
+            help='Number of days rebuilt per batch (default: 31)'
+        )
+
+    def handle(self, *args, **options):
+        repairs = Repair.objects.order_by()
+        rollups = RepairDailyRollup.objects.all()
+        for option, lookup in (('since', 'gte'), ('until', 'lte')):
+            if options[option]:
+                try:
+                    day = date.fromisoformat(options[option])
+                except ValueError:
+                    raise CommandError(f'Invalid --{option} date: {options[option]}')
+                repairs = repairs.filter(**{f'date__{lookup}': day})
+                rollups = rollups.filter(**{f'day__{lookup}': day})
+
+        # Days with repairs, plus days whose rollups no longer have any
+        days = set(repairs.values_list('date', flat=True).distinct())
+        days.update(rollups.values_list('day', flat=True).distinct())
+        days = sorted(days)
+
+        batch_size = options['batch_size']
+        for start in range(0, len(days), batch_size):
+            RepairDailyRollup.objects.rebuild(days[start:start + batch_size], batch_size=batch_size)
+            self.stdout.write(f'Rebuilt {min(start + batch_size, len(days))}/{len(days)} days')
+
+        self.stdout.write(self.style.SUCCESS('Repair rollups rebuild complete.'))
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.repairs.models import RepricingJob
+from apps.repairs.repricing import REPRICING_BATCH_SIZE, run_repricing_job
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the stored price of open repairs, e.g. after prices were changed by bulk updates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--issues',
+            type=int,
+            nargs='+',
+            default=[],
+            help='Only reprice repairs using the base price of these issues'
+        )
+        parser.add_argument(
+            '--quality-tiers',
+            type=int,
+            nargs='+',
+            default=[],
+            help='Only reprice repairs using the price of these quality tiers'
+        )
+        parser.add_argument(
+            '--job',
+            type=int,
+            help='Run an existing repricing job again, e.g. one that failed'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REPRICING_BATCH_SIZE,
+            help=f'Number of repairs repriced per transaction (default: {REPRICING_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        if options['job']:
+            job = RepricingJob.objects.filter(pk=options['job']).first()
+            if job is None:
+                raise CommandError(f"Repricing job {options['job']} does not exist.")
+            job.processed_repairs = 0
+            job.error = ''
+            job.save(update_fields=['processed_repairs', 'error'])
+        else:
+            job = RepricingJob.objects.create(
+                issue_ids=options['issues'],
+                quality_tier_ids=options['quality_tiers'],
+                all_open_repairs=not options['issues'] and not options['quality_tiers'],
+            )
+
+        def progress(job):
+            self.stdout.write(f'Repriced {job.processed_repairs}/{job.total_repairs} repairs')
+
+        job = run_repricing_job(job.pk, batch_size=options['batch_size'], progress=progress)
+        if job.status == 'failed':
+            raise CommandError(f'Repricing job {job.pk} failed: {job.error}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Repricing job {job.pk} complete. Repriced: {job.processed_repairs} repairs')
+        )
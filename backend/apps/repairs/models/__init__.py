@@ -2,4 +2,10 @@ from .repair import Repair
 from .issue import Issue
 from .part_quality_tier import PartQualityTier
 from .service_pricing import ServicePricing
-from .repair import RepairIssue
\ No newline at end of file
+from .price_history import PartQualityTierPriceHistory, ServicePricingHistory
+from .repair import RepairIssue
+from .repair_list_entry import RepairListEntry
+from .repair_daily_rollup import RepairDailyRollup
+from .upload_session import UploadSession
+from .repricing_job import RepricingJob
+from .stock_reservation import StockReservation
@@ -30,4 +30,16 @@ class Issue(models.Model):
     )
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Base price as loaded, so saves that change it can reprice open repairs
+        instance._loaded_base_price = instance.__dict__.get('base_price')
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the previous price, the saved one is now current
+        self._loaded_base_price = self.base_price
@@ -41,3 +41,15 @@ class PartQualityTier(models.Model):
 
     def __str__(self):
         return f"{self.part.name} - {self.get_quality_tier_display()}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Price as loaded, so saves that change it reprice open repairs and extend the price history
+        instance._loaded_price = instance.__dict__.get('price')
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the previous price, the saved one is now current
+        self._loaded_price = self.price
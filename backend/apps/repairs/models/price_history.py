@@ -0,0 +1,83 @@
+from django.db import models, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .part_quality_tier import PartQualityTier
+from .service_pricing import ServicePricing
+
+
+class PriceHistoryQuerySet(models.QuerySet):
+    def valid_on(self, day):
+        """
+        Periods in effect on day. Periods opened and closed on the same day
+        (valid_to == valid_from) are never in effect: the last price of a day wins.
+        """
+        return self.filter(Q(valid_to__isnull=True) | Q(valid_to__gt=day), valid_from__lte=day)
+
+    def price_as_of(self, day, priced=OuterRef('pk')):
+        """
+        Subquery of the price of the priced row in effect on day, both usually
+        references to the outer query such as OuterRef('repair__date').
+        """
+        periods = self.filter(**{self.model.PRICED_FIELD: priced}).valid_on(day)
+        return Subquery(periods.order_by('-valid_from', '-pk').values('price')[:1])
+
+    def record(self, priced, price, day=None):
+        """
+        Close the open period of priced and open one at price, from day (default: today).
+        Rows are only ever appended or closed, never rewritten.
+        """
+        day = day or timezone.localdate()
+        with transaction.atomic(using=self.db):
+            self.filter(**{self.model.PRICED_FIELD: priced}, valid_to__isnull=True).update(valid_to=day)
+            return self.create(**{self.model.PRICED_FIELD: priced}, price=price, valid_from=day)
+
+
+class PriceHistory(models.Model):
+    """
+    Append-only history of a price: one row per period, valid from valid_from
+    (included) to valid_to (excluded, null while the price is current).
+    """
+    # Foreign key to the priced row, set by subclasses
+    PRICED_FIELD = None
+
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    valid_from = models.DateField()
+    valid_to = models.DateField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = PriceHistoryQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        ordering = ['-valid_from', '-pk']
+
+    def __str__(self):
+        return f"{getattr(self, f'{self.PRICED_FIELD}_id')}: {self.price} from {self.valid_from} to {self.valid_to or '-'}"
+
+
+class PartQualityTierPriceHistory(PriceHistory):
+    PRICED_FIELD = 'quality_tier'
+
+    quality_tier = models.ForeignKey(PartQualityTier, on_delete=models.CASCADE, related_name='price_history')
+
+    class Meta(PriceHistory.Meta):
+        verbose_name = "Part Quality Tier Price History"
+        verbose_name_plural = "Part Quality Tier Price History"
+        indexes = [
+            # Price as of a date: the last period of the tier starting on or before it
+            models.Index(fields=['quality_tier', '-valid_from'], name='tier_price_as_of_idx'),
+        ]
+
+
+class ServicePricingHistory(PriceHistory):
+    PRICED_FIELD = 'service_pricing'
+
+    service_pricing = models.ForeignKey(ServicePricing, on_delete=models.CASCADE, related_name='price_history')
+
+    class Meta(PriceHistory.Meta):
+        verbose_name = "Service Pricing History"
+        verbose_name_plural = "Service Pricing History"
+        indexes = [
+            models.Index(fields=['service_pricing', '-valid_from'], name='service_price_as_of_idx'),
+        ]
@@ -1,8 +1,45 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
+from django.db import models, transaction
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Lower, NullIf
 from django.conf import settings
-from apps.tech.models import ProductModel
+from apps.tech.models import DeviceType, ProductModel
 from decimal import Decimal
 from apps.repairs.models.part_quality_tier import PartQualityTier
+from apps.repairs.models.price_history import PartQualityTierPriceHistory
+
+# RepairIssue fields that take part in the price of a repair
+PRICE_FIELDS = {'issue', 'issue_id', 'quality_tier', 'quality_tier_id', 'custom_price', 'repair', 'repair_id'}
+
+# Repair fields whose loaded values are kept by Repair.from_db
+TRACKED_FIELDS = ('date', 'status')
+
+# Text search configuration of Repair.search_vector: no stemming, names and uids are matched as typed
+SEARCH_CONFIG = 'simple'
+
+
+class RepairIssueQuerySet(models.QuerySet):
+    def with_prices_as_of(self):
+        """
+        Annotate price_as_of, the price of each repair issue with the quality tier
+        price in effect on the date of its repair, in the same query as the rows.
+        Tiers without history for that date fall back to their current price.
+        """
+        tier_price = PartQualityTierPriceHistory.objects.price_as_of(
+            OuterRef('repair__date'), priced=OuterRef('quality_tier_id')
+        )
+        return self.annotate(
+            price_as_of=RepairIssue.price_expression(Coalesce(tier_price, F('quality_tier__price')))
+        )
 
 
 class RepairIssue(models.Model):
@@ -26,6 +63,8 @@ class RepairIssue(models.Model):
         help_text="Custom price if different from standard pricing"
     )
     notes = models.TextField(blank=True, null=True)
+
+    objects = RepairIssueQuerySet.as_manager()
     
     def get_price(self):
         """
@@ -39,11 +78,125 @@ class RepairIssue(models.Model):
         elif self.issue.base_price:
             return self.issue.base_price
         return Decimal('0.00')
+
+    @staticmethod
+    def price_expression(quality_tier_price=F('quality_tier__price')):
+        """
+        SQL counterpart of get_price, usable in annotations and aggregates.
+        """
+        return Coalesce(
+            NullIf(F('custom_price'), Value(Decimal('0.00'))),
+            quality_tier_price,
+            F('issue__base_price'),
+            Value(Decimal('0.00')),
+            output_field=DecimalField(max_digits=10, decimal_places=2),
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Repair as loaded, so moving an issue also refreshes the total of the repair it left
+        instance._loaded_repair_id = instance.__dict__.get('repair_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # The post_save handler refreshing the repair totals runs in the same transaction
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+        # post_save handlers have seen the previous repair, the saved one is now current
+        self._loaded_repair_id = self.repair_id
     
     def __str__(self):
         return f"{self.repair.uid} - {self.issue.name}"
 
 
+class RepairQuerySet(models.QuerySet):
+    def refresh_prices(self):
+        """
+        Recompute the stored price of the selected repairs in a single UPDATE.
+        The repair rows are locked first so that concurrent issue edits are
+        totalled one after the other instead of overwriting each other.
+        Saves and deletes of repair issues, cascades included, call it from
+        signals; bulk_create, bulk_update and update() of repair issues do not,
+        so their callers must.
+        """
+        with transaction.atomic(using=self.db):
+            repair_ids = list(
+                self.order_by('pk').select_for_update(of=('self',)).values_list('pk', flat=True)
+            )
+            totals = RepairIssue.objects.filter(repair=OuterRef('pk')).values('repair').annotate(
+                total=Sum(RepairIssue.price_expression())
+            ).values('total')
+            self.model.objects.filter(pk__in=repair_ids).update(
+                price=Coalesce(Subquery(totals), Value(Decimal('0.00')))
+            )
+        return repair_ids
+
+    def refresh_device_categories(self):
+        """
+        Copy the category of their device type onto the selected repairs in one UPDATE.
+        """
+        categories = ProductModel.objects.filter(pk=OuterRef('product_model_id')).values(
+            'series__device_type__category'
+        )[:1]
+        return self.update(device_category=Coalesce(Subquery(categories), Value('')))
+
+    def refresh_search(self):
+        """
+        Rebuild search_vector and search_document of the selected repairs in one UPDATE,
+        pulling the client and brand/model names through subqueries.
+        """
+        client_model = self.model._meta.get_field('client').related_model
+        client_name = Subquery(
+            client_model.objects.filter(pk=OuterRef('client_id')).values(
+                full_name=Concat('first_name', Value(' '), 'last_name', Value(' '), 'username', output_field=TextField())
+            )[:1],
+            output_field=TextField(),
+        )
+        product_name = Subquery(
+            ProductModel.objects.filter(pk=OuterRef('product_model_id')).values(
+                full_name=Concat('brand__name', Value(' '), 'name', output_field=TextField())
+            )[:1],
+            output_field=TextField(),
+        )
+        return self.update(
+            search_vector=(
+                SearchVector('uid', weight='A', config=SEARCH_CONFIG)
+                + SearchVector(client_name, weight='A', config=SEARCH_CONFIG)
+                + SearchVector(product_name, weight='B', config=SEARCH_CONFIG)
+                + SearchVector('description', weight='C', config=SEARCH_CONFIG)
+            ),
+            search_document=Lower(Concat(
+                'uid', Value(' '),
+                Coalesce(client_name, Value(''), output_field=TextField()), Value(' '),
+                Coalesce(product_name, Value(''), output_field=TextField()), Value(' '),
+                'description',
+                output_field=TextField(),
+            )),
+        )
+
+    def search(self, terms):
+        """
+        Match search terms against the indexed search_vector (prefix full-text)
+        and the trigram-indexed search_document (substrings and typos), ranked by relevance.
+        """
+        words = [word for term in terms for word in re.findall(r'\w+', term)]
+        if not words:
+            return self
+
+        text = ' '.join(terms).lower()
+        query = SearchQuery(
+            ' & '.join(f'{word}:*' for word in words), config=SEARCH_CONFIG, search_type='raw'
+        )
+        return self.filter(
+            Q(search_vector=query)
+            | Q(search_document__contains=text)
+            | Q(search_document__trigram_word_similar=text)
+        ).annotate(
+            search_rank=SearchRank(F('search_vector'), query) + TrigramWordSimilarity(text, 'search_document')
+        ).order_by('-search_rank', '-date', 'pk')
+
+
 class Repair(models.Model):
     uid = models.CharField(max_length=255, unique=True, verbose_name="Repair UID")
     date = models.DateField(verbose_name="Repair Date")  # Date repair was registered
@@ -84,26 +237,56 @@ class Repair(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Category of the product model's device type, maintained by RepairQuerySet.refresh_device_categories
+    device_category = models.CharField(
+        max_length=20,
+        choices=DeviceType.CATEGORY_CHOICES,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Device Category",
+    )
+
+    # Maintained by RepairQuerySet.refresh_search for the repairs search filter
+    search_vector = SearchVectorField(null=True, editable=False)
+    search_document = models.TextField(blank=True, default="", editable=False)
+
+    objects = RepairQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Repair"
         verbose_name_plural = "Repairs"
         ordering = ["-date", "client"]
+        indexes = [
+            # Keyset pagination order of the repairs list
+            models.Index(fields=["-date", "id"], name="repair_date_id_idx"),
+            models.Index(fields=["device_category", "-date"], name="repair_category_date_idx"),
+            models.Index(fields=["status", "-date"], name="repair_status_date_idx"),
+            GinIndex(fields=["search_vector"], name="repair_search_vector_idx"),
+            GinIndex(fields=["search_document"], name="repair_search_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
 
     def __str__(self):
         return f"Repair {self.uid} for {self.client.username}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Values as loaded, so signal handlers can tell what a save changed:
+        # the previous day of the rollups and the previous status of repair events
+        instance._loaded_values = {field: instance.__dict__.get(field) for field in TRACKED_FIELDS}
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the previous values, the saved ones are now current
+        self._loaded_values = {field: self.__dict__.get(field) for field in TRACKED_FIELDS}
     
     def calculate_total_price(self):
         """
-        Calculate the total price for this repair based on all associated issues
+        Calculate the total price for this repair based on all associated issues.
+        The stored price is kept up to date on RepairIssue writes (see refresh_prices),
+        so saving a repair never needs this.
         """
-        total = Decimal('0.00')
-        for repair_issue in self.repair_issues.all():
-            total += repair_issue.get_price()
-        return total
-    
-    def save(self, *args, **kwargs):
-        # Update the price field when saving, but only if the object already exists
-        # (related objects like repair_issues can't be accessed before the first save)
-        if self.pk:
-            self.price = self.calculate_total_price()
-        super().save(*args, **kwargs)
+        total = self.repair_issues.aggregate(total=Sum(RepairIssue.price_expression()))['total']
+        return total if total is not None else Decimal('0.00')
@@ -0,0 +1,106 @@
+from decimal import Decimal
+
+from django.db import connections, models, transaction
+from django.db.models import Count, Sum
+
+from apps.tech.models import Brand, DeviceType
+from .repair import Repair
+
+# First key of the advisory locks taken on the days being rebuilt, the second is the day
+ROLLUP_LOCK_NAMESPACE = 7301
+
+
+class RepairDailyRollupManager(models.Manager):
+    def rebuild(self, days, batch_size=31):
+        """
+        Recompute the rollup rows of the given days from the repairs table:
+        one aggregate SELECT, one DELETE and one INSERT per batch of days.
+        Concurrent rebuilds of a day are serialized by a transaction-level
+        advisory lock on it, taken in day order, and the repairs are read under
+        the lock, so the last rebuild to run sees every committed write.
+        """
+        days = sorted(set(day for day in days if day is not None))
+        for start in range(0, len(days), batch_size):
+            batch = days[start:start + batch_size]
+            with transaction.atomic(using=self.db):
+                self._lock_days(batch)
+                self._rebuild_days(batch)
+
+    def _lock_days(self, days):
+        with connections[self.db].cursor() as cursor:
+            for day in days:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s, %s)', [ROLLUP_LOCK_NAMESPACE, day.toordinal()])
+
+    def _rebuild_days(self, batch):
+        totals = Repair.objects.using(self.db).filter(date__in=batch).order_by().values(
+            'date', 'status', 'product_model__brand', 'product_model__series__device_type'
+        ).annotate(
+            repair_count=Count('pk'),
+            revenue=Sum('price'),
+            card_total=Sum('card_payment'),
+            cash_total=Sum('cash_payment'),
+        )
+        rollups = [
+            self.model(
+                day=row['date'],
+                status=row['status'],
+                brand_id=row['product_model__brand'],
+                device_type_id=row['product_model__series__device_type'],
+                repair_count=row['repair_count'],
+                revenue=row['revenue'] or Decimal('0.00'),
+                card_total=row['card_total'] or Decimal('0.00'),
+                cash_total=row['cash_total'] or Decimal('0.00'),
+            )
+            for row in totals
+        ]
+        self.filter(day__in=batch).delete()
+        self.bulk_create(rollups)
+
+
+class RepairDailyRollup(models.Model):
+    """
+    Repair counts and takings per day, status, brand and device type, read by the
+    repairs dashboard. Days touched by repair writes are rebuilt once the writing
+    transaction commits (see apps.repairs.projections).
+    """
+    # Repair.date: the day the repair was registered, in the shop's local time zone
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Repair.STATUS_CHOICES)
+    brand = models.ForeignKey(
+        Brand,
+        # Rows are rebuilt from the repairs, deleting a brand or device type must not touch them
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name='+',
+        db_constraint=False,
+    )
+    device_type = models.ForeignKey(
+        DeviceType,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name='+',
+        db_constraint=False,
+    )
+    repair_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    card_total = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+    cash_total = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
+
+    objects = RepairDailyRollupManager()
+
+    class Meta:
+        verbose_name = "Repair Daily Rollup"
+        verbose_name_plural = "Repair Daily Rollups"
+        ordering = ["-day", "status"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "status", "brand", "device_type"],
+                name="repair_rollup_unique_key",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status}: {self.repair_count}"
@@ -0,0 +1,120 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from .repair import Repair
+
+
+class RepairListEntryManager(models.Manager):
+    def refresh(self, repair_ids, batch_size=500):
+        """
+        Rebuild the list entries of the given repairs from their source rows.
+        Costs three queries per batch whatever the number of issues per repair.
+        """
+        repair_ids = sorted(set(repair_ids))
+        for start in range(0, len(repair_ids), batch_size):
+            batch = repair_ids[start:start + batch_size]
+            repairs = Repair.objects.filter(pk__in=batch).select_related(
+                'client__profile', 'product_model__brand', 'product_model__series__device_type'
+            ).prefetch_related('repair_issues__issue')
+            entries = [self.model.from_repair(repair) for repair in repairs]
+            if entries:
+                self.bulk_create(
+                    entries,
+                    update_conflicts=True,
+                    unique_fields=['repair'],
+                    update_fields=self.model.refreshed_fields(),
+                )
+
+
+class RepairListEntry(models.Model):
+    """
+    Denormalized, read-only projection of a Repair as shown on the repairs board.
+    Kept up to date from Repair and RepairIssue writes (see apps.repairs.signals).
+    """
+    repair = models.OneToOneField(
+        Repair,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='list_entry',
+    )
+    uid = models.CharField(max_length=255)
+    date = models.DateField()
+    scheduled_date = models.DateField(null=True, blank=True)
+    status = models.CharField(max_length=20, choices=Repair.STATUS_CHOICES)
+    client = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    client_name = models.CharField(max_length=301, blank=True)
+    client_phone = models.CharField(max_length=20, blank=True)
+    brand_name = models.CharField(max_length=100, blank=True)
+    model_name = models.CharField(max_length=100, blank=True)
+    device_type_name = models.CharField(max_length=50, blank=True)
+    description = models.TextField(blank=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+    card_payment = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+    cash_payment = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
+    issue_count = models.PositiveIntegerField(default=0)
+    issue_names = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    objects = RepairListEntryManager()
+
+    class Meta:
+        verbose_name = "Repair List Entry"
+        verbose_name_plural = "Repair List Entries"
+        ordering = ["-date", "repair"]
+        indexes = [
+            models.Index(fields=["-date", "repair"], name="repairlist_date_idx"),
+            models.Index(fields=["status", "-date"], name="repairlist_status_date_idx"),
+            models.Index(fields=["client", "-date"], name="repairlist_client_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.uid} - {self.client_name}"
+
+    @classmethod
+    def refreshed_fields(cls):
+        return [field.name for field in cls._meta.concrete_fields if not field.primary_key]
+
+    @classmethod
+    def from_repair(cls, repair):
+        """
+        Build an entry from a repair loaded with the relations used by the manager's refresh.
+        """
+        client = repair.client
+        try:
+            client_phone = client.profile.phone_number or ''
+        except ObjectDoesNotExist:
+            client_phone = ''
+
+        product_model = repair.product_model
+        series = product_model.series if product_model else None
+        issue_names = [repair_issue.issue.name for repair_issue in repair.repair_issues.all()]
+
+        return cls(
+            repair=repair,
+            uid=repair.uid,
+            date=repair.date,
+            scheduled_date=repair.scheduled_date,
+            status=repair.status,
+            client=client,
+            client_name=f"{client.first_name} {client.last_name}".strip() or client.username,
+            client_phone=client_phone,
+            brand_name=product_model.brand.name if product_model else '',
+            model_name=product_model.name if product_model else '',
+            device_type_name=series.device_type.name if series else '',
+            description=repair.description,
+            price=repair.price,
+            card_payment=repair.card_payment,
+            cash_payment=repair.cash_payment,
+            issue_count=len(issue_names),
+            issue_names=issue_names,
+            created_at=repair.created_at,
+            updated_at=repair.updated_at,
+        )
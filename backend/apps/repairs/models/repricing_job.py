@@ -0,0 +1,66 @@
+from django.db import models
+from django.db.models import Q
+
+from .repair import Repair, RepairIssue
+
+# Repairs handed back to the client keep the price they were charged
+CLOSED_STATUSES = ("prete",)
+
+
+class RepricingJob(models.Model):
+    """
+    Recomputation of the stored price of the open repairs affected by a change
+    of issue base prices or quality tier prices. Jobs are run in the background
+    by apps.repairs.repricing and report their progress here.
+    """
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    issue_ids = models.JSONField(default=list, blank=True, help_text="Issues whose base price changed")
+    quality_tier_ids = models.JSONField(default=list, blank=True, help_text="Quality tiers whose price changed")
+    all_open_repairs = models.BooleanField(default=False, help_text="Reprice every open repair")
+    total_repairs = models.PositiveIntegerField(default=0)
+    processed_repairs = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Repricing Job"
+        verbose_name_plural = "Repricing Jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Repricing job {self.pk} ({self.processed_repairs}/{self.total_repairs})"
+
+    @property
+    def progress(self):
+        if not self.total_repairs:
+            return 1.0 if self.status == "done" else 0.0
+        return self.processed_repairs / self.total_repairs
+
+    def affected_repair_ids(self):
+        """
+        Open repairs whose price depends on the changed prices, found from the
+        indexed foreign keys of their repair issues. A custom price overrides
+        the tier price, and a tier price overrides the issue base price.
+        """
+        repairs = Repair.objects.exclude(status__in=CLOSED_STATUSES)
+        if self.all_open_repairs:
+            return repairs.order_by("pk").values_list("pk", flat=True)
+
+        uses_standard_price = Q(custom_price__isnull=True) | Q(custom_price=0)
+        repair_issues = RepairIssue.objects.filter(
+            uses_standard_price
+            & (
+                Q(quality_tier_id__in=self.quality_tier_ids)
+                | Q(issue_id__in=self.issue_ids, quality_tier__isnull=True)
+            )
+        )
+        return repairs.filter(pk__in=repair_issues.values("repair_id")).order_by("pk").values_list("pk", flat=True)
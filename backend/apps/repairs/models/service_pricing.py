@@ -31,4 +31,16 @@ class ServicePricing(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.issue.name} - {self.get_pricing_type_display()}"
\ No newline at end of file
+        return f"{self.issue.name} - {self.get_pricing_type_display()}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Base price as loaded, so saves that change it are recorded in the price history
+        instance._loaded_base_price = instance.__dict__.get('base_price')
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save handlers have seen the previous price, the saved one is now current
+        self._loaded_base_price = self.base_price
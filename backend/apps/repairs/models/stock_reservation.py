@@ -0,0 +1,184 @@
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Now
+
+from apps.tech.models import InsufficientStock, Location, Part, StockLevel, StockMovement
+
+from .repair import RepairIssue
+from .repricing_job import CLOSED_STATUSES
+
+
+class StockReservationManager(models.Manager):
+    def allocate(self, repair_issue, part, quantity=1):
+        """
+        Reserve quantity units of part for a repair issue from the stock levels
+        of its locations, most available first. Levels locked by a concurrent
+        allocation are skipped (FOR UPDATE SKIP LOCKED), so technicians booking
+        the same part do not queue behind each other. They are only waited for,
+        in a fixed order, when the unlocked levels cannot cover the request.
+        Raises InsufficientStock, reserving nothing, when the part is short.
+        """
+        with transaction.atomic(using=self.db):
+            try:
+                with transaction.atomic(using=self.db):
+                    return self._allocate(repair_issue, part, quantity, skip_locked=True)
+            except InsufficientStock:
+                # The savepoint rollback released the levels locked so far, so waiting cannot deadlock
+                return self._allocate(repair_issue, part, quantity, skip_locked=False)
+
+    def _allocate(self, repair_issue, part, quantity, skip_locked):
+        levels = StockLevel.objects.using(self.db).filter(part=part, on_hand__gt=F("reserved"))
+        levels = levels.select_for_update(skip_locked=skip_locked)
+        levels = levels.order_by(F("reserved") - F("on_hand"), "pk") if skip_locked else levels.order_by("pk")
+
+        reservations = []
+        remaining = quantity
+        while remaining:
+            # One level at a time, so levels this allocation does not need stay unlocked
+            level = levels.exclude(pk__in=[reservation.stock_level_id for reservation in reservations]).first()
+            if level is None:
+                part_id = getattr(part, "pk", part)
+                raise InsufficientStock(f"Only {quantity - remaining} of {quantity} units of part {part_id} are available.")
+            take = min(remaining, level.available)
+            StockLevel.objects.using(self.db).filter(pk=level.pk).update(reserved=F("reserved") + take, updated_at=Now())
+            reservations.append(self.create(
+                repair_issue=repair_issue, part_id=level.part_id, location_id=level.location_id,
+                stock_level=level, quantity=take,
+            ))
+            remaining -= take
+        return reservations
+
+    def release(self, reservations):
+        """
+        Return the units of active reservations to the available stock, in one
+        UPDATE of the reservations and one of their stock levels.
+        """
+        reservations = list(reservations)
+        if not reservations:
+            return
+        with transaction.atomic(using=self.db):
+            active_ids = set(
+                self.filter(pk__in=[reservation.pk for reservation in reservations], status="active")
+                .select_for_update().values_list("pk", flat=True)
+            )
+            if not active_ids:
+                return
+            self.filter(pk__in=active_ids).update(status="released", updated_at=Now())
+            released = defaultdict(int)
+            for reservation in reservations:
+                if reservation.pk in active_ids:
+                    reservation.status = "released"
+                    released[reservation.stock_level_id] += reservation.quantity
+            StockLevel.objects.using(self.db).filter(pk__in=released).update(
+                reserved=F("reserved") - Case(
+                    *[When(pk=level_id, then=Value(quantity)) for level_id, quantity in released.items()]
+                ),
+                updated_at=Now(),
+            )
+
+    def consume(self, reservations, reference=""):
+        """
+        Take the units of active reservations out of stock, as repair movements.
+        """
+        with transaction.atomic(using=self.db):
+            for reservation in reservations:
+                if self.filter(pk=reservation.pk, status="active").update(status="consumed", updated_at=Now()):
+                    reservation.status = "consumed"
+                    StockMovement.objects.db_manager(self.db).record(
+                        reservation.part, -reservation.quantity, "repair",
+                        location=reservation.location, reference=reference, reserved=reservation.quantity,
+                    )
+
+    def reserve_for(self, repair_issue):
+        """
+        Bring the active reservations of a repair issue in line with the part it
+        needs: kept when unchanged, otherwise released and allocated again.
+        When the new part is short, InsufficientStock is raised and the issue
+        is left without reservations.
+        """
+        return self._reserve(repair_issue, list(self.filter(repair_issue=repair_issue, status="active")))
+
+    def _reserve(self, repair_issue, active):
+        part_id = StockReservation.part_needed(repair_issue)
+        if part_id and {reservation.part_id for reservation in active} == {part_id}:
+            return active
+        self.release(active)
+        return self.allocate(repair_issue, part_id) if part_id else []
+
+    def sync(self, repair_issues):
+        """
+        reserve_for each repair issue of an open repair. Issues whose part is
+        short are left without reservations, so the repair can still be taken
+        in; they are returned, and can be reserved again once stock is received.
+        The active reservations of all the issues are read in one query, so
+        only the issues that take a new part from stock cost further queries.
+        """
+        # Parts of ready repairs have been taken out of stock already
+        repair_issues = [
+            repair_issue for repair_issue in repair_issues if repair_issue.repair.status not in CLOSED_STATUSES
+        ]
+        if not repair_issues:
+            return []
+        active = defaultdict(list)
+        for reservation in self.filter(repair_issue__in=repair_issues, status="active"):
+            active[reservation.repair_issue_id].append(reservation)
+
+        short = []
+        for repair_issue in repair_issues:
+            try:
+                self._reserve(repair_issue, active[repair_issue.pk])
+            except InsufficientStock:
+                short.append(repair_issue)
+        return short
+
+
+class StockReservation(models.Model):
+    """
+    Units of a part promised to a part-based repair issue, held on a stock
+    level until its repair is ready (consumed) or the issue changes or goes
+    away (released).
+    """
+    STATUS_CHOICES = [
+        ("active", "Active"),
+        ("consumed", "Consumed"),
+        ("released", "Released"),
+    ]
+
+    repair_issue = models.ForeignKey(RepairIssue, on_delete=models.CASCADE, related_name="stock_reservations")
+    part = models.ForeignKey(Part, on_delete=models.PROTECT, related_name="stock_reservations")
+    location = models.ForeignKey(
+        Location, on_delete=models.PROTECT, null=True, blank=True, related_name="stock_reservations"
+    )
+    stock_level = models.ForeignKey(StockLevel, on_delete=models.PROTECT, related_name="reservations")
+    quantity = models.PositiveIntegerField(default=1)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="active")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = StockReservationManager()
+
+    class Meta:
+        verbose_name = "Stock Reservation"
+        verbose_name_plural = "Stock Reservations"
+        ordering = ["-created_at"]
+        indexes = [
+            # Active reservations of a repair issue, read on every save of the issue
+            models.Index(
+                fields=["repair_issue"], name="reservation_active_issue_idx", condition=models.Q(status="active")
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.quantity} x part {self.part_id} for repair issue {self.repair_issue_id} ({self.status})"
+
+    @staticmethod
+    def part_needed(repair_issue):
+        """
+        Id of the part a repair issue takes from stock: the part of its quality
+        tier for part-based issues, None otherwise.
+        """
+        if repair_issue.issue.category_type != "part_based" or repair_issue.quality_tier is None:
+            return None
+        return repair_issue.quality_tier.part_id
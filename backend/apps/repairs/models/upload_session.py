@@ -0,0 +1,62 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from .repair import Repair
+
+
+def upload_sessions_dir():
+    return getattr(settings, 'UPLOAD_SESSIONS_DIR', os.path.join(settings.MEDIA_ROOT, 'upload_sessions'))
+
+
+class UploadSession(models.Model):
+    """
+    A repair attachment uploaded in chunks. Chunks are appended to a part file
+    at the session's offset; completing the session moves the file into the
+    chosen field of a repair.
+    """
+    FIELD_CHOICES = [
+        ("file", "Attached File"),
+        ("device_photo", "Device Photo"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveBigIntegerField(help_text="Total size of the file in bytes")
+    offset = models.PositiveBigIntegerField(default=0, help_text="Bytes received so far")
+    repair = models.ForeignKey(
+        Repair,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="upload_sessions",
+    )
+    field = models.CharField(max_length=20, choices=FIELD_CHOICES, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Upload Session"
+        verbose_name_plural = "Upload Sessions"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+    @property
+    def part_path(self):
+        return os.path.join(upload_sessions_dir(), f"{self.pk}.part")
+
+    @property
+    def is_complete(self):
+        return self.offset == self.size
+
+    def delete_part(self):
+        try:
+            os.remove(self.part_path)
+        except FileNotFoundError:
+            pass
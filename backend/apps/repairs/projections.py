@@ -0,0 +1,57 @@
+"""
+Read models derived from repairs.
+
+Writes only schedule a refresh; the projections are rebuilt once the writing
+transaction commits so they never observe half-saved repairs.
+"""
+from django.db import transaction
+
+from apps.repairs.models import Repair, RepairDailyRollup, RepairListEntry
+
+
+def refresh_repairs(repair_ids):
+    RepairListEntry.objects.refresh(repair_ids)
+    repairs = Repair.objects.filter(pk__in=repair_ids)
+    repairs.refresh_device_categories()
+    repairs.refresh_search()
+
+
+class RepairRefresh:
+    """
+    on_commit callback shared by every write of a transaction, so a repair
+    saved together with its issues is refreshed once.
+    """
+
+    def __init__(self, repair_ids, days=()):
+        self.repair_ids = set(repair_ids)
+        # Rollup days to rebuild besides the current days of the repairs,
+        # e.g. the previous date of a moved repair or the date of a deleted one
+        self.days = set(days)
+        # Named by Django when it logs a failed robust callback
+        self.__qualname__ = type(self).__qualname__
+
+    def __call__(self):
+        if self.repair_ids:
+            refresh_repairs(self.repair_ids)
+            self.days.update(
+                Repair.objects.filter(pk__in=self.repair_ids).values_list('date', flat=True)
+            )
+        RepairDailyRollup.objects.rebuild(self.days)
+
+
+def schedule_repair_refresh(repair_ids, days=()):
+    repair_ids = set(repair_ids)
+    days = set(days)
+    if not repair_ids and not days:
+        return
+
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        for _, callback, _ in connection.run_on_commit:
+            if isinstance(callback, RepairRefresh):
+                callback.repair_ids |= repair_ids
+                callback.days |= days
+                return
+
+    # The write has committed already: a failed refresh is logged, not raised to the client
+    transaction.on_commit(RepairRefresh(repair_ids, days), robust=True)
@@ -0,0 +1,109 @@
+"""
+Background repricing of open repairs.
+
+Price changes of issues and quality tiers are collected per transaction into a
+single RepricingJob. Once the transaction commits, the job runs in a worker
+thread: the affected repairs are repriced with RepairQuerySet.refresh_prices in
+chunks, each chunk in its own short transaction, and the job's progress is
+saved after every chunk.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.repairs.models import Repair, RepricingJob
+from apps.repairs.projections import schedule_repair_refresh
+
+logger = logging.getLogger(__name__)
+
+# Repairs repriced, and locked, per transaction
+REPRICING_BATCH_SIZE = getattr(settings, 'REPRICING_BATCH_SIZE', 500)
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        # A single worker runs the jobs one after the other
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='repricing')
+    return _executor
+
+
+def run_repricing_job(job_id, batch_size=REPRICING_BATCH_SIZE, progress=None):
+    job = RepricingJob.objects.get(pk=job_id)
+    job.status = 'running'
+    job.started_at = timezone.now()
+    job.save(update_fields=['status', 'started_at'])
+
+    try:
+        repair_ids = list(job.affected_repair_ids())
+        job.total_repairs = len(repair_ids)
+        job.save(update_fields=['total_repairs'])
+
+        for start in range(0, len(repair_ids), batch_size):
+            chunk = repair_ids[start:start + batch_size]
+            with transaction.atomic():
+                Repair.objects.filter(pk__in=chunk).refresh_prices()
+                schedule_repair_refresh(chunk)
+            job.processed_repairs += len(chunk)
+            job.save(update_fields=['processed_repairs'])
+            if progress is not None:
+                progress(job)
+
+        job.status = 'done'
+    except Exception as e:
+        logger.exception('Repricing job %s failed', job.pk)
+        job.status = 'failed'
+        job.error = str(e)
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error', 'finished_at'])
+    return job
+
+
+def _run_in_background(job_id):
+    try:
+        run_repricing_job(job_id)
+    finally:
+        # Worker threads open their own connections, never reused by requests
+        connections.close_all()
+
+
+class RepricingRequest:
+    """
+    on_commit callback shared by the price changes of a transaction, so a
+    supplier price list updating many tiers at once starts a single job.
+    """
+
+    def __init__(self, issue_ids=(), quality_tier_ids=()):
+        self.issue_ids = set(issue_ids)
+        self.quality_tier_ids = set(quality_tier_ids)
+        # Named by Django when it logs a failed robust callback
+        self.__qualname__ = type(self).__qualname__
+
+    def __call__(self):
+        job = RepricingJob.objects.create(
+            issue_ids=sorted(self.issue_ids), quality_tier_ids=sorted(self.quality_tier_ids)
+        )
+        get_executor().submit(_run_in_background, job.pk)
+
+
+def schedule_repricing(issue_ids=(), quality_tier_ids=()):
+    issue_ids = set(issue_ids)
+    quality_tier_ids = set(quality_tier_ids)
+    if not issue_ids and not quality_tier_ids:
+        return
+
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        for _, callback, _ in connection.run_on_commit:
+            if isinstance(callback, RepricingRequest):
+                callback.issue_ids |= issue_ids
+                callback.quality_tier_ids |= quality_tier_ids
+                return
+
+    # The price change has committed already: a job that cannot start is logged, not raised to the client
+    transaction.on_commit(RepricingRequest(issue_ids, quality_tier_ids), robust=True)
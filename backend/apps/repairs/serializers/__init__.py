@@ -1,3 +1,8 @@
 from .repair_serializer import RepairSerializer
+from .repair_list_entry import RepairListEntrySerializer
+from .upload_session import UploadSessionSerializer, UploadSessionCompleteSerializer
+from .quote import QuoteSerializer
+from .repricing_job import RepricingJobSerializer
+from .stock_reservation import StockReservationSerializer
 
-__all__ = ["RepairSerializer"]
+__all__ = ["RepairSerializer", "RepairListEntrySerializer", "UploadSessionSerializer", "UploadSessionCompleteSerializer", "QuoteSerializer", "RepricingJobSerializer", "StockReservationSerializer"]
@@ -0,0 +1,97 @@
+from decimal import Decimal
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+from apps.repairs.models import Issue, PartQualityTier
+from apps.repairs.models.repair import RepairIssue
+from apps.repairs.serializers.issue import ServicePricingSerializer
+from apps.repairs.serializers.part_quality_tier import PartQualityTierSerializer
+from apps.tech.models import ProductModel
+
+
+class QuoteItemSerializer(serializers.Serializer):
+    issue_id = serializers.IntegerField()
+    quality_tier_id = serializers.IntegerField(required=False, allow_null=True)
+    custom_price = serializers.DecimalField(max_digits=10, decimal_places=2, required=False, allow_null=True)
+
+    def to_internal_value(self, data):
+        # A bare issue id quotes the issue with its default price
+        if isinstance(data, int):
+            data = {'issue_id': data}
+        return super().to_internal_value(data)
+
+
+class QuoteSerializer(serializers.Serializer):
+    """
+    Prices a set of issues for a product model in a fixed number of queries:
+    the product model, then the issues with their device types, service pricing
+    and part quality tiers. Each issue is priced like RepairIssue.get_price.
+    """
+    product_model = serializers.PrimaryKeyRelatedField(
+        queryset=ProductModel.objects.select_related('series'), required=False, allow_null=True
+    )
+    issues = QuoteItemSerializer(many=True, allow_empty=False)
+
+    def validate(self, attrs):
+        issue_ids = {item['issue_id'] for item in attrs['issues']}
+        issues = Issue.objects.select_related('associated_part').prefetch_related(
+            'device_types',
+            'service_pricing',
+            Prefetch('associated_part__quality_tiers', queryset=PartQualityTier.objects.order_by('price')),
+        ).in_bulk(issue_ids)
+
+        missing_issues = sorted(issue_ids - issues.keys())
+        if missing_issues:
+            raise serializers.ValidationError({"issues": f"Issue with ID {missing_issues} does not exist."})
+
+        for item in attrs['issues']:
+            issue = issues[item['issue_id']]
+            quality_tiers = self.quality_tiers(issue)
+            quality_tier_id = item.get('quality_tier_id')
+            if quality_tier_id and quality_tier_id not in {tier.pk for tier in quality_tiers}:
+                raise serializers.ValidationError(
+                    {"issues": f"Quality tier with ID {quality_tier_id} is not an option of issue {issue.pk}."}
+                )
+            item['issue'] = issue
+        return attrs
+
+    @staticmethod
+    def quality_tiers(issue):
+        if issue.category_type == 'part_based' and issue.associated_part:
+            return list(issue.associated_part.quality_tiers.all())
+        return []
+
+    def quote(self):
+        product_model = self.validated_data.get('product_model')
+        device_type_id = product_model.series.device_type_id if product_model and product_model.series else None
+
+        items = []
+        total = Decimal('0.00')
+        for item in self.validated_data['issues']:
+            issue = item['issue']
+            quality_tiers = self.quality_tiers(issue)
+            selected_tier = next((tier for tier in quality_tiers if tier.pk == item.get('quality_tier_id')), None)
+            # Same precedence as a saved repair issue: custom price, quality tier, issue base price
+            price = RepairIssue(
+                issue=issue, quality_tier=selected_tier, custom_price=item.get('custom_price')
+            ).get_price()
+            device_type_ids = {device_type.pk for device_type in issue.device_types.all()}
+            total += price
+            items.append({
+                'issue_id': issue.pk,
+                'name': issue.name,
+                'category_type': issue.category_type,
+                # Issues without device types apply to every device
+                'applicable': not device_type_ids or device_type_id is None or device_type_id in device_type_ids,
+                'quality_tier_id': selected_tier.pk if selected_tier else None,
+                'custom_price': item.get('custom_price'),
+                'price': price,
+                'quality_tiers': PartQualityTierSerializer(quality_tiers, many=True).data,
+                'service_pricing': ServicePricingSerializer(issue.service_pricing.all(), many=True).data,
+            })
+
+        return {
+            'product_model': product_model.pk if product_model else None,
+            'items': items,
+            'total': total,
+        }
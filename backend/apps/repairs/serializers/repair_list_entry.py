@@ -0,0 +1,21 @@
+from rest_framework import serializers
+from apps.repairs.models import RepairListEntry
+
+
+class RepairListEntrySerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source='repair_id', read_only=True)
+    client_id = serializers.IntegerField(read_only=True)
+    scheduledDate = serializers.DateField(source='scheduled_date', read_only=True)
+    brand = serializers.CharField(source='brand_name', read_only=True)
+    model = serializers.CharField(source='model_name', read_only=True)
+    deviceType = serializers.CharField(source='device_type_name', read_only=True)
+    totalCost = serializers.DecimalField(source='price', max_digits=10, decimal_places=2, read_only=True)
+
+    class Meta:
+        model = RepairListEntry
+        fields = [
+            'id', 'uid', 'date', 'scheduledDate', 'status', 'client_id', 'client_name', 'client_phone',
+            'brand', 'model', 'deviceType', 'description', 'price', 'totalCost', 'card_payment',
+            'cash_payment', 'issue_count', 'issue_names', 'created_at', 'updated_at',
+        ]
+        read_only_fields = fields
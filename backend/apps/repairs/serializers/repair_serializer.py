@@ -1,9 +1,11 @@
+from django.db import transaction
 from rest_framework import serializers
-from apps.repairs.models import Repair
+from apps.repairs.models import Issue, PartQualityTier, Repair, StockReservation
 from apps.repairs.models.repair import RepairIssue
 from apps.repairs.serializers.repair_issue import RepairIssueSerializer
 from apps.accounts.serializers.account_user_details import AccountUserDetailsSerializer
 from apps.tech.serializers.product_model import ProductModelSerializer
+from apps.tech.serializers.image_derivatives import ImageDerivativesField
 from apps.repairs.serializers.issue import IssueSerializer
 
 
@@ -29,99 +31,120 @@ class RepairSerializer(serializers.ModelSerializer):
     # Make status field writable to allow status updates
     status = serializers.ChoiceField(choices=Repair.STATUS_CHOICES, required=False)
     totalCost = serializers.DecimalField(source='price', max_digits=10, decimal_places=2, read_only=True)
+    device_photo_derivatives = ImageDerivativesField(source='device_photo')
     
     class Meta:
         model = Repair
         fields = [
             'id', 'uid', 'date', 'scheduledDate', 'accessories', 'client', 'client_id', 'product_model', 'product_model_id',
             'description', 'password', 'price', 'totalCost', 'card_payment', 'cash_payment',
-            'comment', 'device_photo', 'file', 'created_at', 'updated_at',
+            'comment', 'device_photo', 'device_photo_derivatives', 'file', 'created_at', 'updated_at',
             'repair_issues', 'repair_issue_data', 'brand', 'model', 'deviceType', 'status',
         ]
+        # The price is derived from the repair issues (see Repair.objects.refresh_prices)
+        read_only_fields = ['price']
 
+    def validate_repair_issue_data(self, value):
+        serializer = RepairIssueSerializer(data=value, many=True)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    @transaction.atomic
     def create(self, validated_data):
         repair_issue_data = validated_data.pop('repair_issue_data', [])
-        
+
         # Create the repair
         repair = Repair.objects.create(**validated_data)
-        
-        # Create repair issues
-        for issue_data in repair_issue_data:
-            from apps.repairs.models import Issue
-            from apps.repairs.models.part_quality_tier import PartQualityTier
-            
-            issue_id = issue_data.get('issue_id')
-            quality_tier_id = issue_data.get('quality_tier_id')
-            custom_price = issue_data.get('custom_price')
-            notes = issue_data.get('notes')
-            
-            try:
-                issue = Issue.objects.get(id=issue_id)
-                
-                # Prepare the data for RepairIssue
-                repair_issue_data_obj = {
-                    'issue': issue,
-                    'custom_price': custom_price,
-                    'notes': notes
-                }
-                
-                if quality_tier_id:
-                    quality_tier = PartQualityTier.objects.get(id=quality_tier_id)
-                    repair_issue_data_obj['quality_tier'] = quality_tier
-                
-                RepairIssue.objects.create(repair=repair, **repair_issue_data_obj)
-                
-            except (Issue.DoesNotExist, PartQualityTier.DoesNotExist) as e:
-                raise serializers.ValidationError(f"Invalid data: {str(e)}")
-        
-        # Recalculate the total price
-        repair.price = repair.calculate_total_price()
-        repair.save()
-        
+
+        self._sync_repair_issues(repair, repair_issue_data)
+
         return repair
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         repair_issue_data = validated_data.pop('repair_issue_data', None)
-        
-        # Update repair fields
-        repair = super().update(instance, validated_data)
-        
-        # Update repair issues if provided
+
+        # Update repair issues if provided, before a new status consumes their reservations
         if repair_issue_data is not None:
-            # Clear existing repair issues
-            repair.repair_issues.all().delete()
-            
-            # Create new repair issues
-            for issue_data in repair_issue_data:
-                from apps.repairs.models import Issue
-                from apps.repairs.models.part_quality_tier import PartQualityTier
-                
-                issue_id = issue_data.get('issue_id')
-                quality_tier_id = issue_data.get('quality_tier_id')
-                custom_price = issue_data.get('custom_price')
-                notes = issue_data.get('notes')
-                
-                try:
-                    issue = Issue.objects.get(id=issue_id)
-                    
-                    # Prepare the data for RepairIssue
-                    repair_issue_data_obj = {
-                        'issue': issue,
-                        'custom_price': custom_price,
-                        'notes': notes
-                    }
-                    
-                    if quality_tier_id:
-                        quality_tier = PartQualityTier.objects.get(id=quality_tier_id)
-                        repair_issue_data_obj['quality_tier'] = quality_tier
-                    
-                    RepairIssue.objects.create(repair=repair, **repair_issue_data_obj)
-                    
-                except (Issue.DoesNotExist, PartQualityTier.DoesNotExist) as e:
-                    raise serializers.ValidationError(f"Invalid data: {str(e)}")
-        
-        # Recalculate the total price
-        repair.price = repair.calculate_total_price()
-        repair.save()
-        
-        return repair
+            self._sync_repair_issues(instance, repair_issue_data)
+
+        # Update repair fields
+        return super().update(instance, validated_data)
+
+    def _sync_repair_issues(self, repair, repair_issue_data):
+        """
+        Make the repair's issues match the payload with a fixed number of queries:
+        one lookup per referenced table, then bulk insert, update and delete of
+        only the rows that changed. The total price is refreshed once at the end.
+        Bulk writes send no signals, so the stock reservations of new rows and
+        of rows whose quality tier changed are brought in line here, and those
+        of deleted rows are released before the delete. Only allocating a part
+        from stock costs queries per row (see StockReservationManager.allocate).
+        """
+        issue_ids = {item['issue_id'] for item in repair_issue_data}
+        quality_tier_ids = {item['quality_tier_id'] for item in repair_issue_data if item.get('quality_tier_id')}
+
+        issues = Issue.objects.in_bulk(issue_ids)
+        quality_tiers = PartQualityTier.objects.in_bulk(quality_tier_ids) if quality_tier_ids else {}
+
+        missing_issues = sorted(issue_ids - issues.keys())
+        if missing_issues:
+            raise serializers.ValidationError(
+                {"repair_issue_data": f"Issue with ID {missing_issues} does not exist."}
+            )
+        missing_quality_tiers = sorted(quality_tier_ids - quality_tiers.keys())
+        if missing_quality_tiers:
+            raise serializers.ValidationError(
+                {"repair_issue_data": f"Quality tier with ID {missing_quality_tiers} does not exist."}
+            )
+
+        # Existing rows are matched to the payload by issue, in order
+        unmatched = {}
+        for repair_issue in repair.repair_issues.all():
+            unmatched.setdefault(repair_issue.issue_id, []).append(repair_issue)
+
+        to_create, to_update, to_reserve = [], [], []
+        for item in repair_issue_data:
+            quality_tier_id = item.get('quality_tier_id') or None
+            values = {
+                'issue': issues[item['issue_id']],
+                'quality_tier': quality_tiers.get(quality_tier_id),
+                'custom_price': item.get('custom_price'),
+                'notes': item.get('notes'),
+            }
+            candidates = unmatched.get(item['issue_id'])
+            if not candidates:
+                to_create.append(RepairIssue(repair=repair, **values))
+                continue
+
+            repair_issue = candidates.pop(0)
+            tier_changed = repair_issue.quality_tier_id != quality_tier_id
+            changed = (
+                tier_changed
+                or repair_issue.custom_price != values['custom_price']
+                or repair_issue.notes != values['notes']
+            )
+            for attr, value in values.items():
+                setattr(repair_issue, attr, value)
+            if changed:
+                to_update.append(repair_issue)
+            if tier_changed:
+                to_reserve.append(repair_issue)
+
+        stale_ids = [repair_issue.pk for candidates in unmatched.values() for repair_issue in candidates]
+        if stale_ids:
+            # Released together rather than one by one as the rows are deleted
+            StockReservation.objects.release(StockReservation.objects.filter(repair_issue__in=stale_ids, status='active'))
+            RepairIssue.objects.filter(pk__in=stale_ids).delete()
+        if to_update:
+            RepairIssue.objects.bulk_update(to_update, ['quality_tier', 'custom_price', 'notes'])
+        if to_create:
+            RepairIssue.objects.bulk_create(to_create)
+        StockReservation.objects.sync(to_reserve + to_create)
+
+        # Recalculate the total price once, under the repair's row lock
+        Repair.objects.filter(pk=repair.pk).refresh_prices()
+        repair.refresh_from_db(fields=['price'])
+
+        if hasattr(repair, '_prefetched_objects_cache'):
+            repair._prefetched_objects_cache.pop('repair_issues', None)
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+from apps.repairs.models import RepricingJob
+
+
+class RepricingJobSerializer(serializers.ModelSerializer):
+    progress = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = RepricingJob
+        fields = [
+            'id', 'status', 'issue_ids', 'quality_tier_ids', 'all_open_repairs',
+            'total_repairs', 'processed_repairs', 'progress', 'error',
+            'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = fields
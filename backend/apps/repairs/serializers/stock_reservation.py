@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from apps.repairs.models import StockReservation
+
+
+class StockReservationSerializer(serializers.ModelSerializer):
+    location_name = serializers.CharField(source='location.name', read_only=True, default=None)
+
+    class Meta:
+        model = StockReservation
+        fields = [
+            'id', 'repair_issue', 'part', 'location', 'location_name',
+            'quantity', 'status', 'created_at', 'updated_at',
+        ]
+        read_only_fields = fields
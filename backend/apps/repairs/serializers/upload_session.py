@@ -0,0 +1,30 @@
+from django.conf import settings
+from rest_framework import serializers
+from apps.repairs.models import Repair, UploadSession
+
+# Largest attachment accepted by chunked uploads, in bytes
+MAX_UPLOAD_SIZE = getattr(settings, 'UPLOAD_SESSION_MAX_SIZE', 2 * 1024 ** 3)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id', 'filename', 'content_type', 'size', 'offset', 'repair', 'field',
+            'completed_at', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['offset', 'repair', 'field', 'completed_at', 'created_at', 'updated_at']
+
+    def validate_filename(self, value):
+        # Only the base name is kept, the storage chooses the directory
+        return value.replace('\\', '/').rsplit('/', 1)[-1]
+
+    def validate_size(self, value):
+        if value > MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError(f"Uploads are limited to {MAX_UPLOAD_SIZE} bytes.")
+        return value
+
+
+class UploadSessionCompleteSerializer(serializers.Serializer):
+    repair = serializers.PrimaryKeyRelatedField(queryset=Repair.objects.all())
+    field = serializers.ChoiceField(choices=UploadSession.FIELD_CHOICES)
@@ -0,0 +1,232 @@
+from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.accounts.models import Profile
+from apps.repairs.catalog import bump_catalog_version
+from apps.repairs.events import notify_repair_event
+from apps.repairs.models import (
+    Issue,
+    PartQualityTier,
+    PartQualityTierPriceHistory,
+    Repair,
+    RepairIssue,
+    ServicePricing,
+    ServicePricingHistory,
+    StockReservation,
+)
+from apps.repairs.models.repair import PRICE_FIELDS
+from apps.repairs.models.repricing_job import CLOSED_STATUSES
+from apps.repairs.projections import schedule_repair_refresh
+from apps.repairs.repricing import schedule_repricing
+from apps.tech.images import schedule_derivatives
+from apps.tech.models import Brand, DeviceType, Part, ProductModel, Series, StockLevel
+
+# Fields of related rows that are copied into the repair projections
+CLIENT_FIELDS = {"username", "first_name", "last_name"}
+PROFILE_FIELDS = {"phone_number"}
+# Previous price of instances that were not loaded from the database
+UNKNOWN_PRICE = object()
+# Previous phone number of profiles that were not loaded from the database
+UNKNOWN_PHONE_NUMBER = object()
+# Models serialized in the issue catalog; brand and product model names appear in its parts
+CATALOG_MODELS = [Issue, PartQualityTier, ServicePricing, Part, Brand, ProductModel]
+# RepairIssue fields that decide the part reserved for it
+RESERVATION_FIELDS = {"issue", "issue_id", "quality_tier", "quality_tier_id"}
+
+
+@receiver(post_save, sender=Repair)
+def refresh_saved_repair(sender, instance, raw=False, **kwargs):
+    if not raw:
+        loaded_date = getattr(instance, "_loaded_values", {}).get("date")
+        schedule_repair_refresh([instance.pk], days=[loaded_date] if loaded_date else [])
+
+
+@receiver(post_delete, sender=Repair)
+def refresh_deleted_repair_day(sender, instance, **kwargs):
+    schedule_repair_refresh([], days=[instance.date])
+
+
+@receiver(post_save, sender=Repair)
+def publish_saved_repair(sender, instance, created, raw=False, using="default", **kwargs):
+    if raw:
+        return
+    if created:
+        notify_repair_event(instance, "created", using=using)
+        return
+    previous_status = getattr(instance, "_loaded_values", {}).get("status")
+    if previous_status is not None and previous_status != instance.status:
+        notify_repair_event(instance, "status_changed", using=using, previous_status=previous_status)
+    else:
+        notify_repair_event(instance, "updated", using=using)
+
+
+@receiver(post_save, sender=Repair)
+def render_device_photo_derivatives(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_derivatives(instance.device_photo)
+
+
+@receiver(post_delete, sender=Repair)
+def publish_deleted_repair(sender, instance, using="default", **kwargs):
+    notify_repair_event(instance, "deleted", using=using)
+
+
+def refresh_repair_prices(repair_ids, origin=None):
+    if origin is not None:
+        # post_delete is sent once all the rows of a delete are gone, so one refresh per repair covers them
+        refreshed = origin.__dict__.setdefault("_refreshed_repair_ids", set())
+        repair_ids = set(repair_ids) - refreshed
+        refreshed |= repair_ids
+    if repair_ids:
+        Repair.objects.filter(pk__in=repair_ids).refresh_prices()
+
+
+@receiver(post_save, sender=RepairIssue)
+@receiver(post_delete, sender=RepairIssue)
+def refresh_repair_of_issue(sender, instance, raw=False, update_fields=None, origin=None, **kwargs):
+    if raw:
+        return
+    # Cascades from issues and repairs and queryset deletes come through here too
+    repair_ids = {instance.repair_id, getattr(instance, "_loaded_repair_id", None)} - {None}
+    if update_fields is None or PRICE_FIELDS & set(update_fields):
+        refresh_repair_prices(repair_ids, origin)
+    schedule_repair_refresh(repair_ids)
+
+
+@receiver(pre_delete, sender=PartQualityTier)
+def collect_quality_tier_repairs(sender, instance, **kwargs):
+    # The tier is cleared from its repair issues by an UPDATE, without RepairIssue signals
+    instance._repair_ids = set(
+        RepairIssue.objects.filter(quality_tier=instance).values_list("repair_id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=PartQualityTier)
+def refresh_quality_tier_repairs(sender, instance, **kwargs):
+    repair_ids = getattr(instance, "_repair_ids", set())
+    refresh_repair_prices(repair_ids)
+    schedule_repair_refresh(repair_ids)
+
+
+@receiver(post_save, sender=RepairIssue)
+def reserve_repair_issue_part(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not RESERVATION_FIELDS & set(update_fields)):
+        return
+    StockReservation.objects.sync([instance])
+
+
+@receiver(post_delete, sender=StockReservation)
+def release_deleted_reservation(sender, instance, **kwargs):
+    # Reservations go away with their repair issue or repair
+    if instance.status == "active":
+        StockLevel.objects.filter(pk=instance.stock_level_id).update(reserved=F("reserved") - instance.quantity)
+
+
+@receiver(post_save, sender=Repair)
+def consume_ready_repair_reservations(sender, instance, created, raw=False, **kwargs):
+    if created or raw or instance.status not in CLOSED_STATUSES:
+        return
+    if getattr(instance, "_loaded_values", {}).get("status") not in CLOSED_STATUSES:
+        StockReservation.objects.consume(
+            StockReservation.objects.filter(repair_issue__repair=instance, status="active").select_related(
+                "part", "location"
+            ),
+            reference=instance.uid,
+        )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_client_repairs(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if created or raw or (update_fields is not None and not CLIENT_FIELDS & set(update_fields)):
+        return
+    schedule_repair_refresh(Repair.objects.filter(client=instance).values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Profile)
+def refresh_profile_repairs(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if created or raw or (update_fields is not None and not PROFILE_FIELDS & set(update_fields)):
+        return
+    # The profile is saved again on every save of its user, e.g. at each login
+    if getattr(instance, "_loaded_phone_number", UNKNOWN_PHONE_NUMBER) == instance.phone_number:
+        return
+    schedule_repair_refresh(Repair.objects.filter(client_id=instance.user_id).values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=ProductModel)
+def refresh_product_model_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    schedule_repair_refresh(Repair.objects.filter(product_model=instance).values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Brand)
+def refresh_brand_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    schedule_repair_refresh(
+        Repair.objects.filter(product_model__brand=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=Series)
+def refresh_series_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    schedule_repair_refresh(
+        Repair.objects.filter(product_model__series=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=DeviceType)
+def refresh_device_type_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    schedule_repair_refresh(
+        Repair.objects.filter(product_model__series__device_type=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=Issue)
+def reprice_issue_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    if getattr(instance, "_loaded_base_price", UNKNOWN_PRICE) != instance.base_price:
+        schedule_repricing(issue_ids=[instance.pk])
+
+
+@receiver(post_save, sender=PartQualityTier)
+def reprice_quality_tier_repairs(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    if getattr(instance, "_loaded_price", UNKNOWN_PRICE) != instance.price:
+        schedule_repricing(quality_tier_ids=[instance.pk])
+
+
+@receiver(post_save, sender=PartQualityTier)
+def record_quality_tier_price(sender, instance, created, raw=False, **kwargs):
+    if not raw and (created or getattr(instance, "_loaded_price", UNKNOWN_PRICE) != instance.price):
+        PartQualityTierPriceHistory.objects.record(instance, instance.price)
+
+
+@receiver(post_save, sender=ServicePricing)
+def record_service_price(sender, instance, created, raw=False, **kwargs):
+    if not raw and (created or getattr(instance, "_loaded_base_price", UNKNOWN_PRICE) != instance.base_price):
+        ServicePricingHistory.objects.record(instance, instance.base_price)
+
+
+def invalidate_issue_catalog(sender, raw=False, **kwargs):
+    if not raw:
+        bump_catalog_version()
+
+
+for catalog_model in CATALOG_MODELS:
+    post_save.connect(invalidate_issue_catalog, sender=catalog_model, dispatch_uid=f"catalog_save_{catalog_model.__name__}")
+    post_delete.connect(invalidate_issue_catalog, sender=catalog_model, dispatch_uid=f"catalog_delete_{catalog_model.__name__}")
+
+
+@receiver(m2m_changed, sender=Issue.device_types.through)
+def invalidate_issue_catalog_device_types(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_catalog_version()
@@ -0,0 +1,60 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from apps.accounts.models import User
+from apps.repairs.models import Issue, PartQualityTier, Repair
+from apps.tech.models import Brand, DeviceType, Location, Part, ProductModel, Series
+
+
+@pytest.fixture
+def device_type(db):
+    return DeviceType.objects.create(name="Smartphone", slug="smartphone")
+
+
+@pytest.fixture
+def product_model(device_type):
+    brand = Brand.objects.create(name="Apple")
+    series = Series.objects.create(name="iPhone", brand=brand, device_type=device_type)
+    return ProductModel.objects.create(name="iPhone 14", brand=brand, series=series)
+
+
+@pytest.fixture
+def location(db):
+    return Location.objects.create(name="Boutique")
+
+
+@pytest.fixture
+def client_user(db):
+    return User.objects.create(username="client", first_name="Ali", last_name="Ben")
+
+
+@pytest.fixture
+def make_part_issue(product_model, device_type):
+    """
+    A part-based issue with the quality tiers of its part.
+    """
+    def make_part_issue(n=0, tiers=("standard",)):
+        part = Part.objects.create(
+            name=f"Ecran {n}", sku=f"SKU{n}", ean13=f"{n:013d}", brand=product_model.brand, model=product_model
+        )
+        issue = Issue.objects.create(
+            name=f"Ecran cassé {n}", category_type="part_based", associated_part=part, base_price=Decimal("50")
+        )
+        issue.device_types.add(device_type)
+        for tier in tiers:
+            PartQualityTier.objects.create(part=part, quality_tier=tier, price=Decimal("80"))
+        return issue
+    return make_part_issue
+
+
+@pytest.fixture
+def make_repair(client_user, product_model):
+    def make_repair(n=0, **kwargs):
+        fields = {
+            "uid": f"R{n}", "date": date(2025, 1, 1), "client": client_user, "product_model": product_model,
+            "description": "Ecran fissuré",
+        }
+        return Repair.objects.create(**{**fields, **kwargs})
+    return make_repair
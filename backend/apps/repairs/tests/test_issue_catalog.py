@@ -0,0 +1,31 @@
+"""
+The cached issue catalog follows catalog versions bumped by other processes.
+"""
+from django.db.models import F
+
+from apps.repairs.models import Issue
+from apps.tech.models import CacheVersion
+
+
+def test_list_is_served_from_the_cache(api_client, make_part_issue, django_assert_num_queries):
+    make_part_issue()
+    first = api_client.get("/api/repairs/issues/")
+    # Only the catalog version is read
+    with django_assert_num_queries(1):
+        second = api_client.get("/api/repairs/issues/", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 304
+
+
+def test_bump_from_another_process_is_seen(api_client, make_part_issue, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        issue = make_part_issue()
+    first = api_client.get("/api/repairs/issues/")
+
+    # What a management command does in its own process, whose cache this one never sees
+    Issue.objects.filter(pk=issue.pk).update(name="Ecran OLED")
+    CacheVersion.objects.filter(name="issue-catalog").update(version=F("version") + 1)
+
+    second = api_client.get("/api/repairs/issues/", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 200
+    assert second["ETag"] != first["ETag"]
+    assert second.json()[0]["name"] == "Ecran OLED"
@@ -0,0 +1,39 @@
+import pytest
+from django.utils import timezone
+
+from apps.accounts.models import Profile
+from apps.repairs import signals
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    """
+    Repair ids of the refreshes scheduled by signal handlers.
+    """
+    calls = []
+    monkeypatch.setattr(signals, "schedule_repair_refresh", lambda repair_ids, days=(): calls.append(set(repair_ids)))
+    return calls
+
+
+def test_login_does_not_refresh_client_repairs(make_repair, client_user, scheduled):
+    make_repair()
+    client_user.refresh_from_db()
+    scheduled.clear()
+
+    # What django.contrib.auth.models.update_last_login does; the profile is saved again by the accounts signals
+    client_user.last_login = timezone.now()
+    client_user.save(update_fields=["last_login"])
+
+    assert scheduled == []
+
+
+def test_phone_number_change_refreshes_client_repairs(make_repair, client_user, scheduled):
+    repair = make_repair()
+    profile = Profile.objects.get(user=client_user)
+    scheduled.clear()
+
+    profile.phone_number = "0600000000"
+    profile.save()
+    profile.save()
+
+    assert scheduled == [{repair.pk}]
@@ -0,0 +1,145 @@
+"""
+Issue, tier and pricing endpoints run a fixed number of queries, whatever the
+number of results, and so does syncing the issues of a repair, whatever the
+number of issues sent, except for the parts it allocates from stock.
+"""
+from decimal import Decimal
+
+import pytest
+
+from apps.repairs.models import Issue, PartQualityTier, Repair, RepairIssue, ServicePricing, StockReservation
+from apps.repairs.serializers import RepairSerializer
+from apps.tech.models import StockMovement
+
+# Result sizes compared by every test; four is the number of quality tier choices
+SIZES = [1, 4]
+
+
+@pytest.fixture
+def catalog(make_part_issue, make_repair, device_type):
+    """
+    size part-based issues with a tier and a service pricing each, a repair
+    issue per part-based issue, and a service-based issue with size pricings.
+    """
+    def catalog(size):
+        repair = make_repair()
+        issues = []
+        for n in range(size):
+            issue = make_part_issue(n)
+            ServicePricing.objects.create(issue=issue, base_price=Decimal("60"))
+            RepairIssue.objects.create(repair=repair, issue=issue, quality_tier=issue.associated_part.quality_tiers.get())
+            issues.append(issue)
+        service = Issue.objects.create(name="Batterie", base_price=Decimal("30"))
+        service.device_types.add(device_type)
+        for n in range(size):
+            ServicePricing.objects.create(issue=service, base_price=Decimal(n))
+        return issues, service
+    return catalog
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_issue_list(api_client, catalog, django_assert_num_queries, size):
+    catalog(size)
+    # The catalog version, then issues, their device types and service pricing
+    with django_assert_num_queries(4):
+        response = api_client.get("/api/repairs/issues/")
+    assert len(response.json()) == size + 1
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_issues_by_device_type(api_client, catalog, django_assert_num_queries, size):
+    catalog(size)
+    with django_assert_num_queries(3):
+        response = api_client.get("/api/repairs/issues/by_device_type/?device_type_slug=smartphone")
+    assert len(response.json()) == size + 1
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_part_based_pricing_options(api_client, make_part_issue, django_assert_num_queries, size):
+    issue = make_part_issue(tiers=[tier for tier, _ in PartQualityTier.QUALITY_TIER_CHOICES][:size])
+    # The issue with its prefetches, then its part's tiers
+    with django_assert_num_queries(4):
+        response = api_client.get(f"/api/repairs/issues/{issue.pk}/pricing_options/")
+    assert len(response.json()) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_service_based_pricing_options(api_client, catalog, django_assert_num_queries, size):
+    _, service = catalog(size)
+    # The pricings come with the issue they nest
+    with django_assert_num_queries(3):
+        response = api_client.get(f"/api/repairs/issues/{service.pk}/pricing_options/")
+    assert len(response.json()) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_repair_issue_list(api_client, catalog, django_assert_num_queries, size):
+    catalog(size)
+    # COUNT, the rows with their issue, part and tier, and the issue prefetches
+    with django_assert_num_queries(4):
+        response = api_client.get("/api/repairs/repair-issues/")
+    assert len(response.json()["results"]) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_part_quality_tier_list(api_client, catalog, django_assert_num_queries, size):
+    catalog(size)
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/repairs/part-quality-tiers/")
+    assert len(response.json()["results"]) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_service_pricing_list(api_client, catalog, django_assert_num_queries, size):
+    catalog(size)
+    # COUNT, the rows with their issue and part, and the issue prefetches
+    with django_assert_num_queries(4):
+        response = api_client.get("/api/repairs/service-pricing/")
+    assert len(response.json()["results"]) == size * 2
+
+
+
+def repair_issue_data(issues):
+    return [
+        {"issue_id": issue.pk, "quality_tier_id": tier.pk if (tier := issue.associated_part.quality_tiers.first()) else None}
+        for issue in issues
+    ]
+
+
+def sync_repair_issues(repair, data):
+    serializer = RepairSerializer(Repair.objects.get(pk=repair.pk), data={"repair_issue_data": data}, partial=True)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_repair_issue_sync(make_part_issue, make_repair, django_assert_num_queries, size):
+    # Issues without a quality tier take nothing from stock
+    issues = [make_part_issue(n, tiers=()) for n in range(size * 2)]
+    repair = make_repair()
+    sync_repair_issues(repair, repair_issue_data(issues[:size]))
+    data = repair_issue_data(issues[size:])
+
+    # The repair, issues, rows and reservations, the DELETE of the rows replaced
+    # and the INSERT of the new ones, the totals, then the repair save
+    with django_assert_num_queries(22):
+        sync_repair_issues(repair, data)
+    assert RepairIssue.objects.filter(repair=repair).count() == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_repair_issue_sync_with_reservations(
+    make_part_issue, make_repair, location, django_assert_num_queries, size
+):
+    issues = [make_part_issue(n) for n in range(size * 2)]
+    for issue in issues:
+        StockMovement.objects.record(issue.associated_part, 1, "receipt", location=location)
+    repair = make_repair()
+    sync_repair_issues(repair, repair_issue_data(issues[:size]))
+    data = repair_issue_data(issues[size:])
+
+    # The same with tiers, the replaced reservations released at once, then
+    # a level lock, UPDATE and INSERT in two savepoints per part allocated
+    with django_assert_num_queries(29 + 7 * size):
+        sync_repair_issues(repair, data)
+    assert StockReservation.objects.filter(repair_issue__repair=repair, status="active").count() == size
@@ -0,0 +1,34 @@
+import threading
+from datetime import date
+
+import pytest
+from django.db import connections
+
+from apps.repairs.models import RepairDailyRollup
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_rebuilds_of_a_day(make_repair):
+    for n in range(3):
+        make_repair(n)
+    RepairDailyRollup.objects.all().delete()
+
+    errors = []
+
+    def rebuild():
+        try:
+            RepairDailyRollup.objects.rebuild([date(2025, 1, 1)])
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=rebuild) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    rollup = RepairDailyRollup.objects.get()
+    assert (rollup.day, rollup.repair_count) == (date(2025, 1, 1), 3)
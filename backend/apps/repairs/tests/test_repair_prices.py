@@ -0,0 +1,84 @@
+"""
+Repair.price follows every write of its repair issues, cascades included.
+"""
+from decimal import Decimal
+
+import pytest
+
+from apps.repairs.models import Repair, RepairIssue
+
+
+@pytest.fixture
+def screen(make_part_issue):
+    # Base price 50, standard tier 80
+    return make_part_issue()
+
+
+def price(repair):
+    return Repair.objects.get(pk=repair.pk).price
+
+
+def add_issue(repair, issue, **kwargs):
+    return RepairIssue.objects.create(
+        repair=repair, issue=issue, quality_tier=issue.associated_part.quality_tiers.get(), **kwargs
+    )
+
+
+def test_saving_and_deleting_an_issue(make_repair, screen):
+    repair = make_repair()
+    repair_issue = add_issue(repair, screen)
+    assert price(repair) == Decimal("80")
+
+    repair_issue.custom_price = Decimal("70")
+    repair_issue.save(update_fields=["custom_price"])
+    assert price(repair) == Decimal("70")
+
+    repair_issue.delete()
+    assert price(repair) == Decimal("0")
+
+
+def test_moving_an_issue_refreshes_both_repairs(make_repair, screen):
+    first, second = make_repair(1), make_repair(2)
+    repair_issue = RepairIssue.objects.get(pk=add_issue(first, screen).pk)
+
+    repair_issue.repair = second
+    repair_issue.save()
+
+    assert price(first) == Decimal("0")
+    assert price(second) == Decimal("80")
+
+
+def test_deleting_an_issue_cascades_to_the_repair_total(make_repair, make_part_issue, screen):
+    repair = make_repair()
+    add_issue(repair, screen)
+    add_issue(repair, make_part_issue(1))
+
+    screen.delete()
+
+    assert price(repair) == Decimal("80")
+
+
+def test_deleting_a_quality_tier_falls_back_to_the_base_price(make_repair, screen):
+    repair = make_repair()
+    add_issue(repair, screen)
+
+    screen.associated_part.quality_tiers.get().delete()
+
+    assert price(repair) == Decimal("50")
+
+
+def test_queryset_delete_refreshes_each_repair_once(make_repair, make_part_issue, screen, django_assert_num_queries):
+    first, second = make_repair(1), make_repair(2)
+    for n in range(3):
+        issue = make_part_issue(n + 1)
+        add_issue(first, issue)
+        add_issue(second, issue)
+    kept = add_issue(first, screen)
+
+    with django_assert_num_queries(11):
+        # The repair issues, their reservations and the DELETE, then per repair a
+        # lock and an UPDATE in a savepoint
+        RepairIssue.objects.exclude(pk=kept.pk).delete()
+
+    assert price(first) == Decimal("80")
+    assert price(second) == Decimal("0")
@@ -0,0 +1,85 @@
+"""
+Price changes reprice the open repairs in one background job per transaction.
+"""
+from decimal import Decimal
+
+import pytest
+from django.db import transaction
+
+from apps.repairs import repricing
+from apps.repairs.models import Repair, RepairIssue, RepricingJob
+
+
+class InlineExecutor:
+    """
+    Runs the submitted job at once, in the test's connection.
+    """
+
+    def submit(self, fn, job_id):
+        repricing.run_repricing_job(job_id)
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    monkeypatch.setattr(repricing, "get_executor", InlineExecutor)
+
+
+@pytest.fixture
+def screen(make_part_issue):
+    # Base price 50, standard tier 80
+    return make_part_issue()
+
+
+def add_issue(repair, issue, with_tier=True):
+    RepairIssue.objects.create(
+        repair=repair, issue=issue, quality_tier=issue.associated_part.quality_tiers.get() if with_tier else None
+    )
+
+
+def price(repair):
+    return Repair.objects.get(pk=repair.pk).price
+
+
+def test_price_changes_of_a_transaction_make_one_job(
+    executor, make_repair, make_part_issue, screen, django_capture_on_commit_callbacks
+):
+    battery = make_part_issue(1)
+    open_repair, ready_repair, battery_repair = make_repair(1), make_repair(2), make_repair(3)
+    add_issue(open_repair, screen)
+    add_issue(ready_repair, screen)
+    add_issue(battery_repair, battery, with_tier=False)
+    Repair.objects.filter(pk=ready_repair.pk).update(status="prete")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            tier = screen.associated_part.quality_tiers.get()
+            tier.price = Decimal("100")
+            tier.save()
+            battery.base_price = Decimal("40")
+            battery.save()
+
+    job = RepricingJob.objects.get()
+    assert job.quality_tier_ids == [tier.pk]
+    assert job.issue_ids == [battery.pk]
+    assert job.status == "done"
+    assert job.total_repairs == 2
+    assert price(open_repair) == Decimal("100")
+    assert price(battery_repair) == Decimal("40")
+    # Repairs handed back keep the price they were charged
+    assert price(ready_repair) == Decimal("80")
+
+
+def test_a_job_that_cannot_start_does_not_fail_the_price_change(
+    monkeypatch, make_repair, screen, django_capture_on_commit_callbacks
+):
+    def get_executor():
+        raise RuntimeError("no worker")
+    monkeypatch.setattr(repricing, "get_executor", get_executor)
+    add_issue(make_repair(), screen)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tier = screen.associated_part.quality_tiers.get()
+        tier.price = Decimal("100")
+        tier.save()
+
+    assert RepricingJob.objects.get().status == "pending"
@@ -0,0 +1,81 @@
+"""
+Repair search over the maintained search_vector and search_document columns.
+"""
+from datetime import date
+
+import pytest
+from django.db import connection
+
+from apps.accounts.models import User
+from apps.repairs.models import Repair
+
+
+@pytest.fixture
+def repairs(make_repair):
+    other_client = User.objects.create(username="mgarcia", first_name="Maria", last_name="Garcia")
+    repairs = [
+        make_repair(1, description="Ecran fissuré"),
+        make_repair(2, description="Batterie gonflée", client=other_client),
+        make_repair(3, description="Ne charge plus, connecteur oxydé"),
+    ]
+    Repair.objects.refresh_search()
+    return repairs
+
+
+@pytest.fixture
+def trigrams(db):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT word_similarity('baterie', 'batterie')")
+        if not cursor.fetchone()[0]:
+            pytest.skip("pg_trgm does not compute similarities on this server")
+
+
+def search(*terms):
+    return list(Repair.objects.search(terms).values_list("uid", flat=True))
+
+
+def test_refresh_search_copies_the_related_names(repairs):
+    repair = Repair.objects.get(pk=repairs[0].pk)
+
+    assert repair.search_document == "r1 ali ben client apple iphone 14 ecran fissuré"
+    assert repair.search_vector
+
+
+def test_refresh_search_follows_renamed_clients(repairs):
+    User.objects.filter(username="mgarcia").update(last_name="Lopez")
+
+    Repair.objects.filter(pk=repairs[1].pk).refresh_search()
+
+    assert search("lopez") == ["R2"]
+
+
+def test_words_match_by_prefix(repairs):
+    assert search("batt") == ["R2"]
+    assert search("maria", "garc") == ["R2"]
+
+
+def test_substrings_match(repairs):
+    assert search("nnecteur") == ["R3"]
+
+
+def test_typos_match(repairs, trigrams):
+    assert search("baterie") == ["R2"]
+
+
+def test_best_matches_come_first(repairs):
+    # Every repair is an iPhone; the one whose uid is searched ranks first
+    assert search("iphone", "r3")[0] == "R3"
+
+
+def test_no_words_returns_everything(repairs):
+    assert Repair.objects.search(["--"]).count() == 3
+
+
+def test_ranked_results_keep_page_numbers_with_cursor_pagination(api_client, repairs):
+    # A newer repair mentioning the client of R2 ranks below R2 itself
+    Repair.objects.filter(pk=repairs[0].pk).update(date=date(2025, 2, 1), description="Même panne que Mme Garcia")
+    Repair.objects.refresh_search()
+
+    response = api_client.get("/api/repairs/repairs/", {"search": "garcia", "pagination": "cursor"})
+
+    assert [repair["uid"] for repair in response.json()["results"]][:2] == ["R2", "R1"]
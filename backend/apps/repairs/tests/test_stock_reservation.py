@@ -0,0 +1,99 @@
+import pytest
+
+from apps.repairs.models import StockReservation
+from apps.repairs.serializers import RepairSerializer
+from apps.tech.models import StockLevel, StockMovement
+
+
+@pytest.fixture
+def screens(make_part_issue, location):
+    """
+    Two part-based issues, with two units of each part in stock.
+    """
+    issues = [make_part_issue(1), make_part_issue(2)]
+    for issue in issues:
+        StockMovement.objects.record(issue.associated_part, 2, "receipt", location=location)
+    return issues
+
+
+def reserved(issue):
+    return StockLevel.objects.get(part=issue.associated_part).reserved
+
+
+def save_repair(data, instance=None):
+    serializer = RepairSerializer(instance, data=data, partial=instance is not None)
+    serializer.is_valid(raise_exception=True)
+    return serializer.save()
+
+
+def issue_data(issue):
+    return {"issue_id": issue.pk, "quality_tier_id": issue.associated_part.quality_tiers.get().pk}
+
+
+def test_repair_intake_reserves_parts(screens, client_user):
+    screen, _ = screens
+    repair = save_repair({
+        "uid": "R1", "date": "2025-01-01", "client_id": client_user.pk, "description": "Ecran fissuré",
+        "repair_issue_data": [issue_data(screen)],
+    })
+
+    reservation = StockReservation.objects.get(status="active")
+    assert reservation.repair_issue.repair == repair
+    assert reservation.part == screen.associated_part
+    assert reserved(screen) == 1
+
+
+def test_changing_quality_tier_moves_reservation(screens, client_user):
+    screen, other_screen = screens
+    repair = save_repair({
+        "uid": "R1", "date": "2025-01-01", "client_id": client_user.pk, "description": "Ecran fissuré",
+        "repair_issue_data": [issue_data(screen)],
+    })
+    # Same issue, with the tier of another part
+    data = {"issue_id": screen.pk, "quality_tier_id": other_screen.associated_part.quality_tiers.get().pk}
+    save_repair({"repair_issue_data": [data]}, instance=repair)
+
+    assert reserved(screen) == 0
+    assert reserved(other_screen) == 1
+    assert StockReservation.objects.get(status="active").part == other_screen.associated_part
+
+
+def test_ready_repair_consumes_reserved_parts(screens, client_user):
+    screen, other_screen = screens
+    repair = save_repair({
+        "uid": "R1", "date": "2025-01-01", "client_id": client_user.pk, "description": "Ecran fissuré",
+        "repair_issue_data": [issue_data(screen)],
+    })
+    # The tier change is applied before the status consumes the reservations
+    data = {"issue_id": screen.pk, "quality_tier_id": other_screen.associated_part.quality_tiers.get().pk}
+    save_repair({"status": "prete", "repair_issue_data": [data]}, instance=repair)
+
+    assert StockLevel.objects.get(part=screen.associated_part).on_hand == 2
+    level = StockLevel.objects.get(part=other_screen.associated_part)
+    assert (level.on_hand, level.reserved) == (1, 0)
+    assert StockReservation.objects.get(status="consumed").part == other_screen.associated_part
+
+
+def test_removed_repair_issue_releases_reservation(screens, client_user, make_part_issue):
+    screen, _ = screens
+    service = make_part_issue(3, tiers=())
+    repair = save_repair({
+        "uid": "R1", "date": "2025-01-01", "client_id": client_user.pk, "description": "Ecran fissuré",
+        "repair_issue_data": [issue_data(screen)],
+    })
+    save_repair({"repair_issue_data": [{"issue_id": service.pk}]}, instance=repair)
+
+    assert reserved(screen) == 0
+    assert not StockReservation.objects.exists()
+
+
+def test_short_part_does_not_block_intake(screens, client_user):
+    screen, _ = screens
+    for n in range(3):
+        save_repair({
+            "uid": f"R{n}", "date": "2025-01-01", "client_id": client_user.pk, "description": "Ecran fissuré",
+            "repair_issue_data": [issue_data(screen)],
+        })
+
+    assert reserved(screen) == 2
+    assert StockReservation.objects.filter(status="active").count() == 2
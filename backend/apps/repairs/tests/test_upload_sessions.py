@@ -0,0 +1,127 @@
+"""
+Chunked, resumable uploads of repair attachments.
+"""
+import errno
+import io
+
+import pytest
+from django.http import UnreadablePostError
+
+from apps.repairs.models import UploadSession
+from apps.repairs.views import upload_session
+from apps.repairs.views.upload_session import UploadSessionViewSet
+
+CONTENT = b"0123456789" * 10
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def session(api_client):
+    response = api_client.post(
+        "/api/repairs/uploads/", {"filename": "notes.txt", "size": len(CONTENT), "content_type": "text/plain"}
+    )
+    assert response.status_code == 201
+    return UploadSession.objects.get(pk=response.json()["id"])
+
+
+def send_chunk(api_client, session, offset, data):
+    return api_client.generic(
+        "PATCH", f"/api/repairs/uploads/{session.pk}/chunk/", data,
+        content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET=str(offset),
+    )
+
+
+def test_chunks_are_appended(api_client, session):
+    assert send_chunk(api_client, session, 0, CONTENT[:40]).status_code == 200
+    response = send_chunk(api_client, session, 40, CONTENT[40:])
+
+    assert response.status_code == 200
+    assert response["Upload-Offset"] == str(len(CONTENT))
+    with open(session.part_path, "rb") as part:
+        assert part.read() == CONTENT
+
+
+def test_offset_mismatch_answers_the_offset_to_resume_from(api_client, session):
+    send_chunk(api_client, session, 0, CONTENT[:40])
+
+    response = send_chunk(api_client, session, 60, CONTENT[60:])
+
+    assert response.status_code == 409
+    assert response["Upload-Offset"] == "40"
+    assert response.json()["offset"] == 40
+
+
+def test_resume_drops_bytes_past_the_recorded_offset(api_client, session):
+    send_chunk(api_client, session, 0, CONTENT[:40])
+    # What a write interrupted after the bytes reached the disk leaves behind
+    with open(session.part_path, "ab") as part:
+        part.write(b"garbage")
+
+    send_chunk(api_client, session, 40, CONTENT[40:])
+
+    with open(session.part_path, "rb") as part:
+        assert part.read() == CONTENT
+
+
+class DroppedStream:
+    """
+    A request body whose client disconnects after the first read.
+    """
+
+    def __init__(self, data):
+        self.reads = iter([data])
+
+    def read(self, size):
+        try:
+            return next(self.reads)
+        except StopIteration:
+            raise UnreadablePostError("connection reset")
+
+
+def test_dropped_connection_keeps_the_bytes_received(session):
+    received = UploadSessionViewSet().write_chunk(session, 0, DroppedStream(CONTENT[:30]), len(CONTENT))
+
+    assert received == 30
+    with open(session.part_path, "rb") as part:
+        assert part.read() == CONTENT[:30]
+
+
+class FullDisk(io.BytesIO):
+    def write(self, data):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+def test_write_errors_are_raised(session, monkeypatch):
+    monkeypatch.setattr(upload_session, "open", lambda path, mode: FullDisk(), raising=False)
+
+    with pytest.raises(OSError):
+        UploadSessionViewSet().write_chunk(session, 0, io.BytesIO(CONTENT), len(CONTENT))
+
+
+def test_complete_attaches_the_file(api_client, session, make_repair):
+    repair = make_repair()
+    send_chunk(api_client, session, 0, CONTENT)
+
+    response = api_client.post(
+        f"/api/repairs/uploads/{session.pk}/complete/", {"repair": repair.pk, "field": "file"}
+    )
+
+    assert response.status_code == 200
+    repair.refresh_from_db()
+    assert repair.file.read() == CONTENT
+    session.refresh_from_db()
+    assert session.completed_at is not None
+
+
+def test_complete_refuses_a_partial_upload(api_client, session, make_repair):
+    send_chunk(api_client, session, 0, CONTENT[:40])
+
+    response = api_client.post(
+        f"/api/repairs/uploads/{session.pk}/complete/", {"repair": make_repair().pk, "field": "file"}
+    )
+
+    assert response.status_code == 400
@@ -5,8 +5,22 @@ from .views import (
     IssueViewSet, 
     RepairIssueViewSet, 
     PartQualityTierViewSet, 
-    ServicePricingViewSet
+    ServicePricingViewSet,
+    RepairDashboardViewSet,
+    UploadSessionViewSet,
+    RepricingJobViewSet,
 )
+from .views.repair_events import repair_events
+from apps.tech.async_views import AsyncReadView
+
+# Nested serializer relations of issues, loaded up front for the async read views
+ISSUE_RELATIONS = ('device_types', 'service_pricing', 'associated_part__brand', 'associated_part__model')
+
+async_repairs = AsyncReadView.for_viewset(
+    RepairViewSet,
+    prefetch_related=[f'repair_issues__issue__{relation}' for relation in ISSUE_RELATIONS],
+)
+async_issues = AsyncReadView.for_viewset(IssueViewSet, prefetch_related=ISSUE_RELATIONS)
 
 router = DefaultRouter()
 router.register(r'repairs', RepairViewSet)
@@ -14,7 +28,15 @@ router.register(r'issues', IssueViewSet)
 router.register(r'repair-issues', RepairIssueViewSet)
 router.register(r'part-quality-tiers', PartQualityTierViewSet)
 router.register(r'service-pricing', ServicePricingViewSet)
+router.register(r'dashboard', RepairDashboardViewSet, basename='repair-dashboard')
+router.register(r'uploads', UploadSessionViewSet)
+router.register(r'repricing-jobs', RepricingJobViewSet)
 
 urlpatterns = [
+    path('events/', repair_events, name='repair-events'),
+    path('async/repairs/', async_repairs, name='repair-async-list'),
+    path('async/repairs/<int:pk>/', async_repairs, name='repair-async-detail'),
+    path('async/issues/', async_issues, name='issue-async-list'),
+    path('async/issues/<int:pk>/', async_issues, name='issue-async-detail'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
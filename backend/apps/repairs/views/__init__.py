@@ -1,5 +1,8 @@
 from .repair_viewset import RepairViewSet
 from .issue import IssueViewSet, PartQualityTierViewSet, ServicePricingViewSet
 from .repair_issue import RepairIssueViewSet
+from .repair_dashboard import RepairDashboardViewSet
+from .upload_session import UploadSessionViewSet
+from .repricing_job import RepricingJobViewSet
 
-__all__ = ["RepairViewSet", "IssueViewSet", "RepairIssueViewSet", "PartQualityTierViewSet", "ServicePricingViewSet"]
+__all__ = ["RepairViewSet", "IssueViewSet", "RepairIssueViewSet", "PartQualityTierViewSet", "ServicePricingViewSet", "RepairDashboardViewSet", "UploadSessionViewSet", "RepricingJobViewSet"]
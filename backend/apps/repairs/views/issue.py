@@ -7,9 +7,13 @@ from apps.repairs.models import Issue
 from apps.repairs.models.part_quality_tier import PartQualityTier
 from apps.repairs.models.service_pricing import ServicePricing
 from apps.repairs.serializers.issue import IssueSerializer
+from apps.repairs.serializers import QuoteSerializer
 from apps.repairs.serializers.part_quality_tier import PartQualityTierSerializer
 from apps.repairs.serializers.service_pricing import ServicePricingSerializer
+from django.core.cache import cache
 from django.db.models import Q
+from apps.repairs.catalog import catalog_etag, catalog_key, catalog_version
+from apps.tech.versioned_cache import VERSIONED_CACHE_TIMEOUT, etag_matches
 
 
 class IssueFilter(filters.FilterSet):
@@ -26,13 +30,33 @@ class IssueFilter(filters.FilterSet):
 
 
 class IssueViewSet(viewsets.ModelViewSet):
-    queryset = Issue.objects.all()
+    queryset = Issue.objects.select_related(
+        'associated_part__brand', 'associated_part__model'
+    ).prefetch_related('device_types', 'service_pricing')
     serializer_class = IssueSerializer
     filter_backends = [filters.DjangoFilterBackend, drf_filters.SearchFilter]
     filterset_class = IssueFilter
     search_fields = ['name']
     pagination_class = None  # Disable pagination for issues to return all at once
 
+    def list(self, request, *args, **kwargs):
+        """
+        The full catalog, served from the cache of the current catalog version.
+        The ETag is a hash of the content; a matching If-None-Match gets a 304.
+        """
+        key = catalog_key(catalog_version(), request.query_params)
+        cached = cache.get(key)
+        if cached is None:
+            data = list(super().list(request, *args, **kwargs).data)
+            cached = (catalog_etag(data), data)
+            cache.set(key, cached, VERSIONED_CACHE_TIMEOUT)
+
+        etag, data = cached
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, headers=headers)
+
     @action(detail=True, methods=['get'])
     def pricing_options(self, request, pk=None):
         """
@@ -50,9 +74,10 @@ class IssueViewSet(viewsets.ModelViewSet):
             serializer = PartQualityTierSerializer(quality_tiers, many=True)
             return Response(serializer.data)
         elif issue.category_type == 'service_based':
-            # For service-based issues, return service pricing
-            service_pricing = ServicePricing.objects.filter(issue=issue)
-            if service_pricing.exists():
+            # For service-based issues, return service pricing; prefetched with
+            # the issue, which each pricing serializes again
+            service_pricing = issue.service_pricing.all()
+            if service_pricing:
                 serializer = ServicePricingSerializer(service_pricing, many=True)
                 return Response(serializer.data)
             else:
@@ -70,6 +95,17 @@ class IssueViewSet(viewsets.ModelViewSet):
                 'issue_id': issue.id
             })
 
+    @action(detail=False, methods=['post'])
+    def quote(self, request):
+        """
+        Pricing options and resolved prices of several issues in one request:
+        {"product_model": id, "issues": [id, {"issue_id": id, "quality_tier_id": id, "custom_price": "0.00"}, ...]}
+        replaces one pricing_options call per selected issue.
+        """
+        serializer = QuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.quote())
+
     @action(detail=False, methods=['get'])
     def by_device_type(self, request):
         """
@@ -78,7 +114,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         device_type_slug = request.query_params.get('device_type_slug', None)
         
         if device_type_slug:
-            issues = Issue.objects.filter(device_types__slug=device_type_slug)
+            issues = self.get_queryset().filter(device_types__slug=device_type_slug)
             serializer = self.get_serializer(issues, many=True)
             return Response(serializer.data)
         else:
@@ -87,6 +123,7 @@ class IssueViewSet(viewsets.ModelViewSet):
 
 
 class PartQualityTierViewSet(viewsets.ModelViewSet):
+    # PartQualityTierSerializer only outputs the part id
     queryset = PartQualityTier.objects.all()
     serializer_class = PartQualityTierSerializer
     filter_backends = [filters.DjangoFilterBackend]
@@ -94,7 +131,10 @@ class PartQualityTierViewSet(viewsets.ModelViewSet):
 
 
 class ServicePricingViewSet(viewsets.ModelViewSet):
-    queryset = ServicePricing.objects.all()
+    # Each pricing nests the full IssueSerializer
+    queryset = ServicePricing.objects.select_related(
+        'issue__associated_part__brand', 'issue__associated_part__model'
+    ).prefetch_related('issue__device_types', 'issue__service_pricing')
     serializer_class = ServicePricingSerializer
     filter_backends = [filters.DjangoFilterBackend]
     filterset_fields = ['issue', 'pricing_type', 'complexity_level']
\ No newline at end of file
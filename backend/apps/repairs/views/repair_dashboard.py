@@ -0,0 +1,108 @@
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+import django_filters
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets
+from rest_framework.response import Response
+
+from apps.repairs.models import RepairDailyRollup
+
+
+class RepairDailyRollupFilter(django_filters.FilterSet):
+    date_from = django_filters.DateFilter(field_name='day', lookup_expr='gte')
+    date_to = django_filters.DateFilter(field_name='day', lookup_expr='lte')
+    device_category = django_filters.CharFilter(field_name='device_type__category')
+
+    class Meta:
+        model = RepairDailyRollup
+        fields = ['status', 'brand', 'device_type']
+
+
+def empty_totals():
+    return {
+        'repairs': 0,
+        'revenue': Decimal('0.00'),
+        'card_total': Decimal('0.00'),
+        'cash_total': Decimal('0.00'),
+        'by_status': defaultdict(int),
+    }
+
+
+def add_rollup(totals, rollup):
+    totals['repairs'] += rollup.repair_count
+    totals['revenue'] += rollup.revenue
+    totals['card_total'] += rollup.card_total
+    totals['cash_total'] += rollup.cash_total
+    totals['by_status'][rollup.status] += rollup.repair_count
+
+
+def serialize_totals(totals, **extra):
+    return {
+        **extra,
+        'repairs': totals['repairs'],
+        'revenue': str(totals['revenue']),
+        'card_total': str(totals['card_total']),
+        'cash_total': str(totals['cash_total']),
+        'by_status': dict(totals['by_status']),
+    }
+
+
+class RepairDashboardViewSet(viewsets.GenericViewSet):
+    """
+    Repair KPIs read from the daily rollups: totals, status counts and takings
+    per day, brand and device type. Defaults to the last 30 days, local time.
+    """
+    queryset = RepairDailyRollup.objects.select_related('brand', 'device_type')
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = RepairDailyRollupFilter
+    pagination_class = None
+    default_days = 30
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+        if 'date_from' not in params and 'date_to' not in params:
+            today = timezone.localdate()
+            queryset = queryset.filter(day__gt=today - timedelta(days=self.default_days), day__lte=today)
+        return queryset
+
+    def list(self, request):
+        totals = empty_totals()
+        days = defaultdict(empty_totals)
+        brands = defaultdict(empty_totals)
+        device_types = defaultdict(empty_totals)
+        brand_names = {}
+        device_type_names = {}
+
+        for rollup in self.filter_queryset(self.get_queryset()):
+            add_rollup(totals, rollup)
+            add_rollup(days[rollup.day], rollup)
+            add_rollup(brands[rollup.brand_id], rollup)
+            add_rollup(device_types[rollup.device_type_id], rollup)
+            if rollup.brand_id is not None:
+                brand_names[rollup.brand_id] = getattr(rollup.brand, 'name', None)
+            if rollup.device_type_id is not None:
+                device_type_names[rollup.device_type_id] = getattr(rollup.device_type, 'name', None)
+
+        return Response({
+            'totals': serialize_totals(totals),
+            'days': [
+                serialize_totals(day_totals, day=day)
+                for day, day_totals in sorted(days.items())
+            ],
+            'brands': [
+                serialize_totals(brand_totals, brand_id=brand_id, brand_name=brand_names.get(brand_id))
+                for brand_id, brand_totals in brands.items()
+            ],
+            'device_types': [
+                serialize_totals(
+                    device_type_totals,
+                    device_type_id=device_type_id,
+                    device_type_name=device_type_names.get(device_type_id),
+                )
+                for device_type_id, device_type_totals in device_types.items()
+            ],
+        })
@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+from django.http import StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from apps.repairs.events import broker
+
+# Seconds between comments keeping idle streams open through proxies
+KEEPALIVE_INTERVAL = 15
+# Milliseconds the browser waits before reconnecting a dropped stream
+RETRY_INTERVAL = 5000
+
+
+async def stream_repair_events():
+    queue = broker.subscribe()
+    try:
+        yield f'retry: {RETRY_INTERVAL}\n\n'
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            event = json.loads(payload)['event']
+            yield f'event: {event}\ndata: {payload}\n\n'
+    finally:
+        broker.unsubscribe(queue)
+
+
+@require_GET
+async def repair_events(request):
+    """
+    Server-Sent Events stream of repair changes (created, updated, status_changed,
+    deleted), so the repairs board can patch its rows instead of polling the list.
+    """
+    response = StreamingHttpResponse(stream_repair_events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -1,8 +1,13 @@
-from rest_framework import viewsets
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from django_filters import rest_framework as filters
 from rest_framework import filters as drf_filters
+from apps.repairs.models import StockReservation
 from apps.repairs.models.repair import RepairIssue
+from apps.repairs.serializers import StockReservationSerializer
 from apps.repairs.serializers.repair_issue import RepairIssueSerializer
+from apps.tech.models import InsufficientStock
 
 
 class RepairIssueFilter(filters.FilterSet):
@@ -18,8 +23,24 @@ class RepairIssueFilter(filters.FilterSet):
 
 
 class RepairIssueViewSet(viewsets.ModelViewSet):
-    queryset = RepairIssue.objects.all()
+    # The nested issue and quality tier, and get_price, read these relations
+    queryset = RepairIssue.objects.select_related(
+        'issue__associated_part__brand', 'issue__associated_part__model', 'quality_tier'
+    ).prefetch_related('issue__device_types', 'issue__service_pricing')
     serializer_class = RepairIssueSerializer
     filter_backends = [filters.DjangoFilterBackend, drf_filters.SearchFilter]
     filterset_class = RepairIssueFilter
-    search_fields = ['notes']
\ No newline at end of file
+    search_fields = ['notes']
+
+    @action(detail=True, methods=['post'])
+    def reserve(self, request, pk=None):
+        """
+        Reserve the part of a part-based repair issue, e.g. once stock missing
+        when it was saved has been received. Returns its active reservations.
+        """
+        repair_issue = self.get_object()
+        try:
+            reservations = StockReservation.objects.reserve_for(repair_issue)
+        except InsufficientStock as e:
+            raise serializers.ValidationError({'quality_tier_id': str(e)})
+        return Response(StockReservationSerializer(reservations, many=True).data)
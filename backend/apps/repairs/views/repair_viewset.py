@@ -1,63 +1,120 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 import django_filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters as drf_filters
-from apps.repairs.models import Repair
-from apps.repairs.serializers import RepairSerializer
+from django.db.models import Q
+from django.template import loader
+from apps.repairs.models import Repair, RepairListEntry
+from apps.repairs.exports import EXPORT_CONTENT_TYPES, export_response
+from apps.repairs.serializers import RepairSerializer, RepairListEntrySerializer
+from apps.tech.models import DeviceType
+from apps.tech.pagination import OptionalCursorPagination
 
 
 class RepairFilter(django_filters.FilterSet):
-    # Map frontend device types to backend device type slugs
+    # Frontend device types resolve to a DeviceType category, stored on the repair
     device_type = django_filters.CharFilter(method='filter_by_device_type')
 
+    # Frontend names of the device categories
+    DEVICE_CATEGORY_ALIASES = {
+        'laptop': 'computer',
+        'pc': 'computer',
+    }
+
     def filter_by_device_type(self, queryset, name, value):
-        # Handle device type filtering - account for both simple slugs and CSV-imported slugs
         if not value:
             return queryset
 
         value_lower = value.lower()
+        category = self.DEVICE_CATEGORY_ALIASES.get(value_lower, value_lower)
+        if category in dict(DeviceType.CATEGORY_CHOICES):
+            return queryset.filter(device_category=category)
 
-        # Different strategies based on the value requested
-        if value_lower == 'smartphone':
-            # Look for slugs containing 'smartphone' or 'phone' (case-insensitive partial match)
-            return queryset.filter(
-                product_model__series__device_type__slug__icontains='smartphone'
-            ) | queryset.filter(
-                product_model__series__device_type__slug__icontains='phone'
-            )
-        elif value_lower == 'computer' or value_lower == 'laptop' or value_lower == 'pc':
-            # Handle multiple possible terms for computers
-            return queryset.filter(
-                product_model__series__device_type__slug__icontains='laptop'
-            ) | queryset.filter(
-                product_model__series__device_type__slug__icontains='pc'
-            ) | queryset.filter(
-                product_model__series__device_type__slug__icontains='desktop'
-            )
-        elif value_lower == 'tablet':
-            # Look for slugs containing 'tablet'
-            return queryset.filter(
-                product_model__series__device_type__slug__icontains='tablet'
-            )
-        elif value_lower == 'watch':
-            # Look for slugs containing 'watch'
-            return queryset.filter(
-                product_model__series__device_type__slug__icontains='watch'
-            )
-        else:
-            # For any other device type, try a case-insensitive partial match
-            return queryset.filter(product_model__series__device_type__slug__icontains=value_lower)
+        # Any other value is taken as the slug of a device type
+        return queryset.filter(product_model__series__device_type__slug=value_lower)
 
     class Meta:
         model = Repair
         fields = ['status', 'client', 'date']
 
 
+class RepairSearchFilter(drf_filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter on repairs. Matches ?search= against the
+    indexed Repair.search_vector (prefix full-text) and the trigram-indexed
+    Repair.search_document (substrings and typos), ranked by relevance.
+    The columns searched are those of RepairQuerySet.refresh_search, views
+    declare no search_fields. Ranked results are paged by page number, even
+    with ?pagination=cursor (see OptionalCursorPagination).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        return queryset.search(self.get_search_terms(request))
+
+    def to_html(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        context = {'param': self.search_param, 'term': terms[0] if terms else ''}
+        return loader.get_template(self.template).render(context)
+
+
+class RepairListEntryFilter(django_filters.FilterSet):
+    search = django_filters.CharFilter(method='filter_by_search')
+
+    def filter_by_search(self, queryset, name, value):
+        query = Q()
+        for term in value.split():
+            query &= (
+                Q(uid__icontains=term) | Q(client_name__icontains=term)
+                | Q(brand_name__icontains=term) | Q(model_name__icontains=term)
+            )
+        return queryset.filter(query)
+
+    class Meta:
+        model = RepairListEntry
+        fields = ['status', 'client', 'date']
+
+
 class RepairViewSet(viewsets.ModelViewSet):
     queryset = Repair.objects.select_related(
         'client', 'client__profile', 'product_model__brand', 'product_model__series__device_type'
     ).prefetch_related('repair_issues__issue', 'repair_issues__quality_tier')
     serializer_class = RepairSerializer
-    filter_backends = [DjangoFilterBackend, drf_filters.SearchFilter]
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-date', 'pk')
+    filter_backends = [DjangoFilterBackend, RepairSearchFilter]
     filterset_class = RepairFilter
-    search_fields = ['uid', 'description', 'client__username', 'client__first_name', 'client__last_name', 'product_model__brand__name', 'product_model__name']
+
+    @action(detail=False, methods=['get'])
+    def board(self, request):
+        """
+        Repairs board list read only from the RepairListEntry projection:
+        one indexed scan per page, however many issues each repair carries.
+        """
+        filterset = RepairListEntryFilter(
+            request.query_params, queryset=RepairListEntry.objects.all(), request=request
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        queryset = filterset.qs
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = RepairListEntrySerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = RepairListEntrySerializer(queryset, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the filtered repairs as CSV or NDJSON (?export_format=csv|ndjson).
+        Accepts the same filter and search parameters as the list.
+        """
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError({'export_format': f"Must be one of: {', '.join(EXPORT_CONTENT_TYPES)}."})
+        return export_response(request, self.filter_queryset(self.get_queryset()), export_format)
@@ -0,0 +1,14 @@
+from rest_framework import viewsets
+from django_filters import rest_framework as filters
+from apps.repairs.models import RepricingJob
+from apps.repairs.serializers import RepricingJobSerializer
+
+
+class RepricingJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Progress of the background repricing of open repairs after price changes.
+    """
+    queryset = RepricingJob.objects.all()
+    serializer_class = RepricingJobSerializer
+    filter_backends = [filters.DjangoFilterBackend]
+    filterset_fields = ['status']
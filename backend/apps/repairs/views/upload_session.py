@@ -0,0 +1,139 @@
+import os
+
+from django.core.files import File
+from django.db import transaction
+from django.http import Http404, UnreadablePostError
+from django.utils import timezone
+from PIL import Image
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.repairs.models import UploadSession
+from apps.repairs.models.upload_session import upload_sessions_dir
+from apps.repairs.serializers import RepairSerializer, UploadSessionCompleteSerializer, UploadSessionSerializer
+
+# Largest chunk accepted by one request, in bytes
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+# Bytes copied from the request body to the part file at a time
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+class UploadSessionViewSet(mixins.CreateModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.DestroyModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    Chunked, resumable upload of repair attachments:
+
+    1. POST /uploads/ with filename, size and content_type opens a session.
+    2. PATCH /uploads/{id}/chunk/ with an Upload-Offset header and the raw bytes
+       as body appends a chunk. A mismatching offset answers 409 with the offset
+       to resume from, which GET /uploads/{id}/ also returns.
+    3. POST /uploads/{id}/complete/ with repair and field attaches the file.
+
+    Chunks are streamed to disk; neither the request body nor the file is held in memory.
+    """
+    queryset = UploadSession.objects.all()
+    serializer_class = UploadSessionSerializer
+
+    def perform_destroy(self, instance):
+        instance.delete_part()
+        instance.delete()
+
+    def get_locked_session(self, pk):
+        session = UploadSession.objects.select_for_update().filter(pk=pk).first()
+        if session is None:
+            raise Http404
+        return session
+
+    @action(detail=True, methods=['patch'], parser_classes=[])
+    def chunk(self, request, pk=None):
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            raise ValidationError({'Upload-Offset': 'The byte offset of the chunk is required.'})
+        length = int(request.headers.get('Content-Length') or 0)
+        if length <= 0:
+            raise ValidationError({'detail': 'The chunk is empty.'})
+        if length > MAX_CHUNK_SIZE:
+            raise ValidationError({'detail': f'Chunks are limited to {MAX_CHUNK_SIZE} bytes.'})
+
+        with transaction.atomic():
+            # Locked so that two retries of the same chunk cannot interleave their writes
+            session = self.get_locked_session(pk)
+            if session.completed_at is not None:
+                raise ValidationError({'detail': 'This upload is already complete.'})
+            if offset != session.offset:
+                return Response(
+                    {'offset': session.offset, 'detail': 'The offset does not match the bytes received.'},
+                    status=status.HTTP_409_CONFLICT,
+                    headers={'Upload-Offset': str(session.offset)},
+                )
+            if offset + length > session.size:
+                raise ValidationError({'detail': 'The chunk goes past the declared size.'})
+
+            session.offset += self.write_chunk(session, offset, request.stream, length)
+            session.save(update_fields=['offset', 'updated_at'])
+
+        return Response(self.get_serializer(session).data, headers={'Upload-Offset': str(session.offset)})
+
+    def write_chunk(self, session, offset, stream, length):
+        """
+        Copy the request body into the part file at offset. Bytes received before
+        a dropped connection are kept, the client resumes after them.
+        """
+        os.makedirs(upload_sessions_dir(), exist_ok=True)
+        received = 0
+        mode = 'r+b' if os.path.exists(session.part_path) else 'wb'
+        with open(session.part_path, mode) as part:
+            # Drop whatever an interrupted write left past the recorded offset
+            part.seek(offset)
+            part.truncate()
+            while received < length:
+                try:
+                    data = stream.read(min(COPY_BUFFER_SIZE, length - received))
+                except UnreadablePostError:
+                    # The client went away; write errors are not caught, the chunk fails instead
+                    break
+                if not data:
+                    break
+                part.write(data)
+                received += len(data)
+        return received
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        serializer = UploadSessionCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        repair = serializer.validated_data['repair']
+        field = serializer.validated_data['field']
+
+        with transaction.atomic():
+            session = self.get_locked_session(pk)
+            if session.completed_at is not None:
+                raise ValidationError({'detail': 'This upload is already complete.'})
+            if not session.is_complete:
+                raise ValidationError({'detail': f'Only {session.offset} of {session.size} bytes were received.'})
+            if field == 'device_photo':
+                self.validate_image(session)
+
+            with open(session.part_path, 'rb') as part:
+                getattr(repair, field).save(session.filename, File(part), save=False)
+            repair.save(update_fields=[field, 'updated_at'])
+
+            session.repair = repair
+            session.field = field
+            session.completed_at = timezone.now()
+            session.save(update_fields=['repair', 'field', 'completed_at', 'updated_at'])
+            transaction.on_commit(session.delete_part)
+
+        return Response(RepairSerializer(repair, context=self.get_serializer_context()).data)
+
+    def validate_image(self, session):
+        try:
+            with Image.open(session.part_path) as image:
+                image.verify()
+        except Exception:
+            raise ValidationError({'field': 'The uploaded file is not a valid image.'})
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db import transaction
 
 from .models import (
     Brand,
@@ -9,15 +10,139 @@ from .models import (
     Location,
     Supplier,
     StockItem,
+    StockLevel,
+    StockMovement,
     StoreOrder,
 )
+from .pagination import EstimatedCountPaginator
 
-admin.site.register(Brand)
-admin.site.register(Part)
-admin.site.register(ProductModel)
-admin.site.register(Series)
-admin.site.register(DeviceType)
-admin.site.register(Location)
-admin.site.register(Supplier)
-admin.site.register(StockItem)
-admin.site.register(StoreOrder)
\ No newline at end of file
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist settings for tables with many rows: planner-estimated counts and
+    no second COUNT(*) of the unfiltered table next to filtered results.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+
+@admin.register(Brand)
+class BrandAdmin(admin.ModelAdmin):
+    list_display = ["name", "updated_at"]
+    search_fields = ["name"]
+
+
+@admin.register(DeviceType)
+class DeviceTypeAdmin(admin.ModelAdmin):
+    list_display = ["name", "slug", "category", "domain", "is_active"]
+    list_filter = ["category", "is_active"]
+    search_fields = ["name", "slug"]
+    prepopulated_fields = {"slug": ["name"]}
+
+
+@admin.register(Series)
+class SeriesAdmin(admin.ModelAdmin):
+    list_display = ["name", "brand", "device_type", "market_segment"]
+    list_select_related = ["brand", "device_type"]
+    list_filter = ["device_type"]
+    search_fields = ["name", "brand__name"]
+    autocomplete_fields = ["brand", "device_type"]
+
+
+@admin.register(ProductModel)
+class ProductModelAdmin(LargeTableAdmin):
+    list_display = ["name", "brand", "series", "is_popular"]
+    # __str__ of the product model shows its brand
+    list_select_related = ["brand", "series"]
+    list_filter = ["is_popular"]
+    search_fields = ["name", "brand__name"]
+    autocomplete_fields = ["brand", "series"]
+
+
+@admin.register(Part)
+class PartAdmin(LargeTableAdmin):
+    list_display = ["name", "sku", "ean13", "brand", "model", "price", "repair_price"]
+    list_select_related = ["brand", "model__brand"]
+    # Barcodes and SKUs are matched exactly against their unique indexes
+    search_fields = ["=sku", "=ean13", "name"]
+    autocomplete_fields = ["brand", "model"]
+    ordering = ["name", "id"]
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ["name", "type"]
+    search_fields = ["name"]
+
+
+@admin.register(Supplier)
+class SupplierAdmin(admin.ModelAdmin):
+    list_display = ["name", "contact_name", "email", "phone"]
+    search_fields = ["name", "contact_name"]
+
+
+@admin.register(StockItem)
+class StockItemAdmin(LargeTableAdmin):
+    list_display = ["part", "location", "quantity", "serial_number", "created_at"]
+    list_select_related = ["part", "location"]
+    list_filter = ["location"]
+    search_fields = ["=serial_number", "=part__sku", "=part__ean13"]
+    autocomplete_fields = ["part", "location"]
+    ordering = ["-created_at", "id"]
+
+    # Quantity changes are recorded in the stock movement ledger
+    def save_model(self, request, obj, form, change):
+        if change:
+            StockItem.objects.change(obj)
+        else:
+            with transaction.atomic():
+                obj.save()
+                StockItem.objects.record_receipts([obj])
+
+    def delete_model(self, request, obj):
+        StockItem.objects.remove(obj)
+
+    def delete_queryset(self, request, queryset):
+        for obj in queryset:
+            StockItem.objects.remove(obj)
+
+
+@admin.register(StockMovement)
+class StockMovementAdmin(LargeTableAdmin):
+    list_display = ["created_at", "part", "location", "quantity", "reason", "reference"]
+    list_select_related = ["part", "location"]
+    list_filter = ["reason", "location"]
+    search_fields = ["=part__sku", "=part__ean13", "=reference"]
+    ordering = ["-created_at", "id"]
+
+    # The ledger is append-only and movements go through StockMovement.objects.record
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(StockLevel)
+class StockLevelAdmin(LargeTableAdmin):
+    list_display = ["part", "location", "on_hand", "reserved", "updated_at"]
+    list_select_related = ["part", "location"]
+    list_filter = ["location"]
+    search_fields = ["=part__sku", "=part__ean13"]
+    readonly_fields = ["part", "location", "on_hand", "reserved"]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(StoreOrder)
+class StoreOrderAdmin(LargeTableAdmin):
+    list_display = ["__str__", "supplier", "status", "order_date", "expected_delivery_date"]
+    list_select_related = ["supplier"]
+    list_filter = ["status"]
+    search_fields = ["supplier__name"]
+    autocomplete_fields = ["supplier"]
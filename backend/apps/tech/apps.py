@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_migrate
 
 
 class TechConfig(AppConfig):
@@ -7,3 +8,9 @@ class TechConfig(AppConfig):
 
     class Meta:
         app_label = "tech"
+
+    def ready(self):
+        import apps.tech.signals  # noqa
+
+        pre_migrate.connect(apps.tech.signals.install_search_extensions, sender=self)
+        post_migrate.connect(apps.tech.signals.backfill_stock_levels, sender=self)
@@ -0,0 +1,126 @@
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from django.views import View
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.tech.pagination import OptionalCursorPagination
+
+
+class AsyncReadView(View):
+    """
+    Async list and retrieve of a DRF ViewSet, served from the event loop.
+
+    The viewset still provides the queryset, filters, pagination and serializer;
+    only the database round trips go through the async ORM (acount, async
+    iteration, aget). Authentication, permissions and filter validation may run
+    queries of their own and are done in one sync_to_async call. Serializers
+    must not query the database, so the view adds the select_related and
+    prefetch_related needed by the nested serializers.
+
+    Keyset pages and other paginators than page-number pagination are delegated
+    to the paginator in a worker thread.
+    """
+    viewset_class = None
+    select_related = ()
+    prefetch_related = ()
+
+    @classmethod
+    def for_viewset(cls, viewset_class, select_related=(), prefetch_related=()):
+        view_class = type(f'Async{viewset_class.__name__}', (cls,), {
+            'viewset_class': viewset_class,
+            'select_related': tuple(select_related),
+            'prefetch_related': tuple(prefetch_related),
+        })
+        return view_class.as_view()
+
+    async def get(self, request, pk=None):
+        viewset = self.viewset_class(
+            action_map={'get': 'list' if pk is None else 'retrieve'},
+            args=(),
+            kwargs={} if pk is None else {'pk': pk},
+            format_kwarg=None,
+            # The browsable API renders forms that query the database
+            renderer_classes=[JSONRenderer],
+        )
+        viewset.headers = {}
+        drf_request = viewset.initialize_request(request)
+        viewset.request = drf_request
+
+        try:
+            queryset = await sync_to_async(self.prepare)(viewset, drf_request)
+            if pk is None:
+                response = await self.list(viewset, drf_request, queryset)
+            else:
+                response = await self.retrieve(viewset, drf_request, queryset, pk)
+        except Exception as exc:
+            response = viewset.handle_exception(exc)
+
+        response = viewset.finalize_response(drf_request, response)
+        return response.render()
+
+    def prepare(self, viewset, request):
+        viewset.initial(request)
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+    async def list(self, viewset, request, queryset):
+        paginator = viewset.paginator
+        if paginator is None:
+            objects = [obj async for obj in queryset]
+            return Response(viewset.get_serializer(objects, many=True).data)
+
+        if not isinstance(paginator, PageNumberPagination) or (
+            isinstance(paginator, OptionalCursorPagination) and paginator.keyset_requested(request)
+        ):
+            page = await sync_to_async(paginator.paginate_queryset)(queryset, request, view=viewset)
+            return paginator.get_paginated_response(viewset.get_serializer(page, many=True).data)
+
+        page_size = paginator.get_page_size(request)
+        count = await queryset.acount()
+        page_number = request.query_params.get(paginator.page_query_param) or 1
+        if page_number in paginator.last_page_strings:
+            page_number = max(1, -(-count // page_size))
+        try:
+            page_number = int(page_number)
+            if page_number < 1 or (page_number - 1) * page_size >= max(count, 1):
+                raise InvalidPage
+        except (TypeError, ValueError, InvalidPage):
+            raise NotFound(paginator.invalid_page_message.format(page_number=page_number, message='Invalid page.'))
+
+        offset = (page_number - 1) * page_size
+        objects = [obj async for obj in queryset[offset:offset + page_size]]
+
+        url = request.build_absolute_uri()
+        next_link = None
+        if offset + page_size < count:
+            next_link = replace_query_param(url, paginator.page_query_param, page_number + 1)
+        previous_link = None
+        if page_number == 2:
+            previous_link = remove_query_param(url, paginator.page_query_param)
+        elif page_number > 2:
+            previous_link = replace_query_param(url, paginator.page_query_param, page_number - 1)
+
+        return Response({
+            'count': count,
+            'next': next_link,
+            'previous': previous_link,
+            'results': viewset.get_serializer(objects, many=True).data,
+        })
+
+    async def retrieve(self, viewset, request, queryset, pk):
+        lookup_field = viewset.lookup_field
+        try:
+            obj = await queryset.aget(**{lookup_field: pk})
+        except queryset.model.DoesNotExist:
+            raise NotFound()
+        # Object permissions run in the event loop: they must not query the database
+        viewset.check_object_permissions(request, obj)
+        return Response(viewset.get_serializer(obj).data)
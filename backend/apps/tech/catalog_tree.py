@@ -0,0 +1,72 @@
+"""
+Snapshot of the device catalog tree: device types, their brands, series and
+product models, as one JSON document.
+
+The snapshot is built in four queries, stored in the cache as JSON and gzip
+bytes under the catalog tree version, and rebuilt on the first request after
+a catalog model changes. Product models without a series are not reachable
+from a device type and are left out, as in the product model filters.
+"""
+import gzip
+import json
+from collections import defaultdict
+
+from django.core.cache import cache
+
+from apps.tech.models import Brand, DeviceType, ProductModel, Series
+from apps.tech.versioned_cache import VERSIONED_CACHE_TIMEOUT, bump_cache_version, cache_version, content_etag
+
+CATALOG_TREE_NAME = 'catalog-tree'
+
+
+def build_catalog_tree():
+    brands = {brand['id']: brand for brand in Brand.objects.values('id', 'name')}
+
+    models_by_series = defaultdict(list)
+    for product_model in ProductModel.objects.filter(series__isnull=False).order_by('name').values(
+        'id', 'name', 'is_popular', 'series_id'
+    ):
+        models_by_series[product_model.pop('series_id')].append(product_model)
+
+    # device type -> brand -> series
+    series_tree = defaultdict(lambda: defaultdict(list))
+    for series in Series.objects.order_by('name').values('id', 'name', 'market_segment', 'brand_id', 'device_type_id'):
+        series['models'] = models_by_series[series['id']]
+        series_tree[series.pop('device_type_id')][series.pop('brand_id')].append(series)
+
+    device_types = []
+    for device_type in DeviceType.objects.filter(is_active=True).values('id', 'name', 'slug', 'icon', 'category', 'domain'):
+        series_by_brand = series_tree[device_type['id']]
+        device_type['brands'] = [
+            {**brands[brand_id], 'series': series_by_brand[brand_id]}
+            for brand_id in sorted(series_by_brand, key=lambda brand_id: brands[brand_id]['name'])
+        ]
+        device_types.append(device_type)
+    return {'device_types': device_types}
+
+
+class CatalogTreeSnapshot:
+    def __init__(self, content):
+        self.content = content
+        # mtime fixed so the same tree always compresses to the same bytes
+        self.compressed = gzip.compress(content, mtime=0)
+        # Each encoding is a different representation, with its own ETag
+        self.etag = content_etag(content)
+        self.compressed_etag = content_etag(self.compressed)
+
+    @classmethod
+    def build(cls):
+        return cls(json.dumps(build_catalog_tree(), separators=(',', ':')).encode())
+
+
+def catalog_tree_snapshot():
+    key = f'{CATALOG_TREE_NAME}:{cache_version(CATALOG_TREE_NAME)}'
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = CatalogTreeSnapshot.build()
+        cache.set(key, snapshot, VERSIONED_CACHE_TIMEOUT)
+    return snapshot
+
+
+def bump_catalog_tree_version():
+    bump_cache_version(CATALOG_TREE_NAME)
@@ -0,0 +1,112 @@
+"""
+Resized derivatives of uploaded images.
+
+Each image gets fixed-size WebP (JPEG when Pillow lacks WebP) copies stored next
+to it under derivatives/, named after the original so their URLs can be built
+without a database lookup. They are rendered in a process pool once the
+transaction that saved the image commits; generate_image_derivatives backfills
+existing media.
+"""
+import logging
+import os
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# Derivative name -> bounding box, the aspect ratio is kept
+DERIVATIVE_SIZES = {
+    'thumbnail': (320, 320),
+    'medium': (1280, 1280),
+}
+DERIVATIVE_FORMAT = 'WEBP' if features.check('webp') else 'JPEG'
+DERIVATIVE_EXTENSION = 'webp' if DERIVATIVE_FORMAT == 'WEBP' else 'jpg'
+DERIVATIVE_QUALITY = 80
+DERIVATIVES_DIR = 'derivatives'
+
+# Image fields that get derivatives, as (app_label.Model, field name)
+IMAGE_FIELDS = [
+    ('repairs.Repair', 'device_photo'),
+    ('accounts.Profile', 'profile_picture'),
+]
+
+_pool = None
+
+
+def derivative_name(name, size):
+    directory, filename = posixpath.split(name)
+    # The source extension is kept, so photo.jpg and photo.png get different derivatives
+    return posixpath.join(directory, DERIVATIVES_DIR, f'{filename}_{size}.{DERIVATIVE_EXTENSION}')
+
+
+def derivative_urls(fieldfile):
+    if not fieldfile:
+        return None
+    return {size: fieldfile.storage.url(derivative_name(fieldfile.name, size)) for size in DERIVATIVE_SIZES}
+
+
+def render_derivatives(source_path, targets):
+    """
+    Write the resized copies of source_path. Runs in a worker process and only
+    depends on Pillow. targets is a list of (path, (width, height)).
+    """
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        mode = 'RGBA' if has_alpha and DERIVATIVE_FORMAT == 'WEBP' else 'RGB'
+        if image.mode != mode:
+            image = image.convert(mode)
+        for target_path, box in targets:
+            derivative = image.copy()
+            derivative.thumbnail(box, Image.Resampling.LANCZOS)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            # Written under a temporary name so readers never see a partial file
+            temporary_path = f'{target_path}.tmp'
+            derivative.save(temporary_path, DERIVATIVE_FORMAT, quality=DERIVATIVE_QUALITY)
+            os.replace(temporary_path, target_path)
+    return source_path
+
+
+def derivative_targets(storage, name, force=False):
+    """
+    (path, box) of the derivatives of a stored image that still have to be
+    rendered. Empty for storages without local paths and for missing sources.
+    """
+    try:
+        source_path = storage.path(name)
+    except NotImplementedError:
+        return None, []
+    if not os.path.exists(source_path):
+        return source_path, []
+    targets = []
+    for size, box in DERIVATIVE_SIZES.items():
+        target_path = storage.path(derivative_name(name, size))
+        if force or not os.path.exists(target_path):
+            targets.append((target_path, box))
+    return source_path, targets
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=getattr(settings, 'IMAGE_DERIVATIVE_WORKERS', 2))
+    return _pool
+
+
+def log_failure(future):
+    if future.exception() is not None:
+        logger.error('Could not render image derivatives', exc_info=future.exception())
+
+
+def schedule_derivatives(fieldfile):
+    if not fieldfile:
+        return
+    source_path, targets = derivative_targets(fieldfile.storage, fieldfile.name)
+    if targets:
+        transaction.on_commit(
+            lambda: get_pool().submit(render_derivatives, source_path, targets).add_done_callback(log_failure)
+        )
@@ -0,0 +1,42 @@
+# backend/apps/tech/management/commands/assign_device_categories.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.tech.models import DeviceType
+
+
+class Command(BaseCommand):
+    help = 'Assigns the canonical category (smartphone, computer, tablet, watch) of device types from their name and slug'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute the category of device types that already have one'
+        )
+
+    def handle(self, *args, **options):
+        device_types = DeviceType.objects.all()
+        if not options['force']:
+            device_types = device_types.filter(category='')
+
+        updated_count = 0
+        unmatched = []
+
+        with transaction.atomic():
+            for device_type in device_types:
+                category = DeviceType.category_for(device_type.name) or DeviceType.category_for(device_type.slug)
+                if not category:
+                    unmatched.append(device_type.name)
+                    continue
+                if category != device_type.category:
+                    device_type.category = category
+                    # Saving refreshes the device category stored on the repairs of this type
+                    device_type.save(update_fields=['category', 'updated_at'])
+                    updated_count += 1
+
+        for name in unmatched:
+            self.stdout.write(self.style.WARNING(f'No category found for DeviceType: {name}'))
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Device categories assigned. Updated: {updated_count}, Unmatched: {len(unmatched)}')
+        )
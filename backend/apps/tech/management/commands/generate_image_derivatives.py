@@ -0,0 +1,60 @@
+# backend/apps/tech/management/commands/generate_image_derivatives.py
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from apps.tech.images import IMAGE_FIELDS, derivative_targets, render_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Renders the missing thumbnail and medium derivatives of uploaded images in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of worker processes (default: 4)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Render the derivatives again even if they exist'
+        )
+
+    def handle(self, *args, **options):
+        rendered_count = 0
+        skipped_count = 0
+        failed_count = 0
+
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            futures = {}
+            for model_label, field_name in IMAGE_FIELDS:
+                model = apps.get_model(model_label)
+                storage = model._meta.get_field(field_name).storage
+                names = model.objects.exclude(**{f'{field_name}__isnull': True}).exclude(
+                    **{field_name: ''}
+                ).values_list(field_name, flat=True).iterator()
+
+                for name in names:
+                    source_path, targets = derivative_targets(storage, name, force=options['force'])
+                    if not targets:
+                        # Already rendered, or the source file is missing
+                        skipped_count += 1
+                        continue
+                    futures[executor.submit(render_derivatives, source_path, targets)] = name
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed_count += 1
+                    self.stderr.write(self.style.WARNING(f'Could not render derivatives of {name}: {e}'))
+                else:
+                    rendered_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Image derivatives complete. Rendered: {rendered_count}, Skipped: {skipped_count}, Failed: {failed_count}'
+            )
+        )
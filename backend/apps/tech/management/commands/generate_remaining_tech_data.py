@@ -144,6 +144,8 @@ class Command(BaseCommand):
 
             if unique_parts:
                 self.Part.objects.bulk_create(unique_parts)
+                # bulk_create skips post_save, which fills the typeahead search text
+                self.Part.objects.filter(search_text="").refresh_search()
                 self.stdout.write(
                     self.style.SUCCESS(f"{len(unique_parts)} new parts generated.")
                 )
@@ -234,6 +236,7 @@ class Command(BaseCommand):
 
         if stock_items:
             self.StockItem.objects.bulk_create(stock_items)
+            self.StockItem.objects.record_receipts(stock_items)
             self.stdout.write(self.style.SUCCESS(f"{len(stock_items)} stock items generated."))
 
     def generate_store_orders(self):
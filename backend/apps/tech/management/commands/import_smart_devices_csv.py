@@ -63,6 +63,7 @@ class Command(BaseCommand):
                         'description': f'Device type from CSV import for {device_category}',
                         'icon': self._get_icon_for_device_category(device_category),
                         'domain': self._get_domain_for_device_category(device_category),
+                        'category': DeviceType.category_for(device_category),
                         'is_active': True,
                     }
                 )
@@ -70,6 +71,11 @@ class Command(BaseCommand):
                     self.stdout.write(
                         self.style.NOTICE(f'Created DeviceType: {device_type.name}')
                     )
+                elif not device_type.category:
+                    # Device types imported before categories existed
+                    device_type.category = DeviceType.category_for(device_category)
+                    if device_type.category:
+                        device_type.save(update_fields=['category', 'updated_at'])
 
                 # Create or get Brand (only name from CSV, no extra fields needed)
                 brand, b_created = Brand.objects.get_or_create(
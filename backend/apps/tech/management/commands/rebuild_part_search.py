@@ -0,0 +1,25 @@
+# backend/apps/tech/management/commands/rebuild_part_search.py
+from django.core.management.base import BaseCommand
+from apps.tech.models import Part
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the search text of parts read by the part typeahead, e.g. after bulk imports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of parts updated per statement (default: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        part_ids = list(Part.objects.order_by('pk').values_list('pk', flat=True))
+        batch_size = options['batch_size']
+
+        updated_count = 0
+        for start in range(0, len(part_ids), batch_size):
+            updated_count += Part.objects.filter(pk__in=part_ids[start:start + batch_size]).refresh_search()
+
+        self.stdout.write(self.style.SUCCESS(f'Part search text rebuilt. Updated: {updated_count}'))
@@ -0,0 +1,26 @@
+# backend/apps/tech/management/commands/rebuild_stock_levels.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.tech.models import StockMovement
+
+
+class Command(BaseCommand):
+    help = 'Recomputes stock levels from the stock movement ledger, optionally opening the ledger from stock items first'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--open-from-stock-items',
+            action='store_true',
+            help='Record an opening adjustment per part and location from stock item quantities, '
+                 'for parts without any movement yet'
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['open_from_stock_items']:
+                movements = StockMovement.objects.open_from_stock_items()
+                self.stdout.write(f'Opening movements recorded: {len(movements)}')
+
+            levels = StockMovement.objects.rebuild_levels()
+
+        self.stdout.write(self.style.SUCCESS(f'Stock levels rebuilt. Levels: {len(levels)}'))
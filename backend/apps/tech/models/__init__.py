@@ -1,4 +1,5 @@
 from .brand import Brand
+from .cache_version import CacheVersion
 from .device_type import DeviceType
 from .part import Part
 from .product_model import ProductModel
@@ -6,6 +7,7 @@ from .series import Series
 from .location import Location
 from .supplier import Supplier
 from .stock_item import StockItem
+from .stock_movement import InsufficientStock, StockLevel, StockMovement
 from .store_order import StoreOrder
 
 __all__ = [
@@ -17,5 +19,9 @@ __all__ = [
     "Location",
     "Supplier",
     "StockItem",
+    "StockLevel",
+    "StockMovement",
+    "InsufficientStock",
     "StoreOrder",
+    "CacheVersion",
 ]
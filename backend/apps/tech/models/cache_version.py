@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class CacheVersion(models.Model):
+    """
+    Version of a cached resource (see apps.tech.versioned_cache). Kept in the
+    database so bumps made by any worker or management command reach every
+    process, whatever the cache backend.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Cache Version"
+        verbose_name_plural = "Cache Versions"
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
@@ -8,6 +8,21 @@ class DeviceType(models.Model):
         ("PHONES", "Phones"),
     ]
 
+    CATEGORY_CHOICES = [
+        ("smartphone", "Smartphone"),
+        ("computer", "Computer"),
+        ("tablet", "Tablet"),
+        ("watch", "Watch"),
+    ]
+
+    # Keywords of a device type name or slug mapping it to a category, checked in order
+    CATEGORY_KEYWORDS = [
+        ("smartphone", ("smartphone", "phone", "mobile")),
+        ("computer", ("laptop", "desktop", "computer", "pc")),
+        ("tablet", ("tablet",)),
+        ("watch", ("watch",)),
+    ]
+
     name = models.CharField(max_length=50, unique=True)
     slug = models.SlugField(max_length=50, unique=True)
     description = models.TextField(blank=True)
@@ -17,6 +32,7 @@ class DeviceType(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     domain = models.CharField(max_length=50, choices=DOMAIN_CHOICES)
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, blank=True, db_index=True)
 
     class Meta:
         verbose_name = "Device Type"
@@ -25,3 +41,19 @@ class DeviceType(models.Model):
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        if not self.category:
+            self.category = self.category_for(self.name) or self.category_for(self.slug)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def category_for(cls, text):
+        """
+        Canonical category of a free-form device type name or slug, '' when none matches.
+        """
+        text = (text or "").lower()
+        for category, keywords in cls.CATEGORY_KEYWORDS:
+            if any(keyword in text for keyword in keywords):
+                return category
+        return ""
@@ -1,11 +1,32 @@
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models import OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Lower
 
 from .brand import Brand
 from .product_model import ProductModel
 
 
+class PartQuerySet(models.QuerySet):
+    def refresh_search(self):
+        """
+        Rebuild search_text of the selected parts in one UPDATE, pulling the
+        brand and product model names through subqueries.
+        """
+        brand_name = Subquery(Brand.objects.filter(pk=OuterRef('brand_id')).values('name')[:1])
+        model_name = Subquery(ProductModel.objects.filter(pk=OuterRef('model_id')).values('name')[:1])
+        return self.update(search_text=Lower(Concat(
+            'name', Value(' '),
+            Coalesce('sku', Value('')), Value(' '),
+            Coalesce('ean13', Value('')), Value(' '),
+            Coalesce(brand_name, Value(''), output_field=TextField()), Value(' '),
+            Coalesce(model_name, Value(''), output_field=TextField()),
+            output_field=TextField(),
+        )))
+
+
 class Part(models.Model):
     """
     Represents a spare part or inventory item for inventory and sale.
@@ -69,10 +90,21 @@ class Part(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Lowercased name, sku, barcode, brand and model names, maintained by
+    # PartQuerySet.refresh_search for the trigram-indexed typeahead
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    objects = PartQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Part"
         verbose_name_plural = "Parts"
         ordering = ["name"]
+        indexes = [
+            # Keyset pagination order of the parts list
+            models.Index(fields=["name", "id"], name="part_name_id_idx"),
+            GinIndex(fields=["search_text"], name="part_search_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
 
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -1,6 +1,68 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
+from .stock_movement import StockMovement
+
+
+class StockItemManager(models.Manager):
+    """
+    Stock item writes that change quantities, each recorded in the stock
+    movement ledger in the same transaction so the stock levels follow.
+    """
+    def receive(self, **fields):
+        with transaction.atomic(using=self.db):
+            item = self.create(**fields)
+            self.record_receipts([item])
+            return item
+
+    def record_receipts(self, items):
+        """
+        Receipt movements of items already saved, e.g. by bulk_create.
+        """
+        for item in items:
+            if item.quantity:
+                StockMovement.objects.db_manager(self.db).record(
+                    item.part, item.quantity, "receipt", location=item.location, reference=item.reference
+                )
+
+    def change(self, item, **fields):
+        """
+        Update item with fields. The quantity, part and location it held are
+        read under a row lock, so concurrent changes each record the difference
+        from the previous one and none is lost.
+        """
+        with transaction.atomic(using=self.db):
+            held = self.select_for_update(of=("self",)).select_related("part", "location").get(pk=item.pk)
+            for name, value in fields.items():
+                setattr(item, name, value)
+            item.save()
+
+            movements = StockMovement.objects.db_manager(self.db)
+            if (held.part_id, held.location_id) == (item.part_id, item.location_id):
+                if item.quantity != held.quantity:
+                    movements.record(
+                        item.part, item.quantity - held.quantity, "adjustment",
+                        location=item.location, reference=item.reference,
+                    )
+            else:
+                reason = "transfer" if held.part_id == item.part_id else "adjustment"
+                if held.quantity:
+                    movements.record(
+                        held.part, -held.quantity, reason, location=held.location, reference=item.reference
+                    )
+                if item.quantity:
+                    movements.record(item.part, item.quantity, reason, location=item.location, reference=item.reference)
+            return item
+
+    def remove(self, item):
+        with transaction.atomic(using=self.db):
+            held = self.select_for_update(of=("self",)).select_related("part", "location").get(pk=item.pk)
+            if held.quantity:
+                StockMovement.objects.db_manager(self.db).record(
+                    held.part, -held.quantity, "adjustment", location=held.location, reference=item.reference
+                )
+            item.delete()
+
 
 class StockItem(models.Model):
     part = models.ForeignKey(
@@ -24,9 +86,20 @@ class StockItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StockItemManager()
+
     class Meta:
         verbose_name = _("stock item")
         verbose_name_plural = _("stock items")
+        indexes = [
+            # Keyset pagination order of the stock items list
+            models.Index(fields=["-created_at", "id"], name="stockitem_created_id_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.part} - {self.location}"
\ No newline at end of file
+        return f"{self.part} - {self.location}"
+
+    @property
+    def reference(self):
+        # Reference of the stock movements of this item
+        return f"stock item {self.pk}"
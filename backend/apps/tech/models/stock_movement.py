@@ -0,0 +1,195 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Now
+from django.utils.translation import gettext_lazy as _
+
+
+class InsufficientStock(Exception):
+    """
+    An outgoing movement asked for more than is on hand at its location.
+    """
+
+
+class StockLevel(models.Model):
+    """
+    On-hand quantity of a part at a location (null: unassigned stock), kept by
+    StockMovement.objects.record with atomic increments. reserved counts the
+    units promised to repairs (see repairs.StockReservation); the rest is
+    available to promise.
+    """
+    part = models.ForeignKey(
+        "tech.Part",
+        on_delete=models.CASCADE,
+        related_name="stock_levels",
+        verbose_name=_("part"),
+    )
+    location = models.ForeignKey(
+        "tech.Location",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="stock_levels",
+        verbose_name=_("location"),
+    )
+    on_hand = models.IntegerField(_("on hand"), default=0)
+    reserved = models.IntegerField(_("reserved"), default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("stock level")
+        verbose_name_plural = _("stock levels")
+        indexes = [
+            # Levels changed since the last check of the part scan cache
+            models.Index(fields=["updated_at"], name="stocklevel_updated_at_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["part", "location"], name="stocklevel_part_location_uniq", nulls_distinct=False
+            ),
+            models.CheckConstraint(condition=models.Q(on_hand__gte=0), name="stocklevel_on_hand_gte_0"),
+            models.CheckConstraint(
+                condition=models.Q(reserved__gte=0, reserved__lte=F("on_hand")),
+                name="stocklevel_reserved_within_on_hand",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.part_id}@{self.location_id}: {self.on_hand} ({self.reserved} reserved)"
+
+    @property
+    def available(self):
+        return self.on_hand - self.reserved
+
+
+class StockMovementManager(models.Manager):
+    def record(self, part, quantity, reason, location=None, reference="", note="", reserved=0):
+        """
+        Append a movement and apply it to the stock level of its part and
+        location in the same transaction. The level is changed with a single
+        conditional UPDATE, never read and written back, so concurrent
+        movements cannot lose each other's counts. An outgoing movement may
+        only take stock that is not reserved, besides the reserved units it
+        consumes itself (reserved); otherwise InsufficientStock is raised.
+        """
+        with transaction.atomic(using=self.db):
+            levels = StockLevel.objects.using(self.db).filter(part=part, location=location)
+            if quantity < 0:
+                levels = levels.filter(on_hand__gte=F("reserved") - reserved - quantity, reserved__gte=reserved)
+            updated = levels.update(
+                on_hand=F("on_hand") + quantity, reserved=F("reserved") - reserved, updated_at=Now()
+            )
+
+            if not updated:
+                if quantity < 0:
+                    part_id = getattr(part, "pk", part)
+                    raise InsufficientStock(f"Not enough stock of part {part_id} to take {-quantity}.")
+                try:
+                    # First movement of the part at this location
+                    with transaction.atomic(using=self.db):
+                        StockLevel.objects.using(self.db).create(part=part, location=location, on_hand=quantity)
+                except IntegrityError:
+                    # Created by a concurrent movement meanwhile
+                    levels.update(on_hand=F("on_hand") + quantity, updated_at=Now())
+
+            return self.create(
+                part=part, location=location, quantity=quantity, reason=reason, reference=reference, note=note
+            )
+
+    def open_from_stock_items(self):
+        """
+        Record an opening adjustment per part and location from the stock item
+        quantities of parts without any movement yet, e.g. stock entered
+        before the ledger existed. Levels are not updated, see rebuild_levels.
+        """
+        from .stock_item import StockItem
+
+        opening = StockItem.objects.using(self.db).exclude(
+            part__in=self.values("part")
+        ).values("part", "location").annotate(quantity=Sum("quantity")).filter(quantity__gt=0)
+        return self.bulk_create(
+            self.model(
+                part_id=row["part"],
+                location_id=row["location"],
+                quantity=row["quantity"],
+                reason="adjustment",
+                note="Opening balance from stock items",
+            )
+            for row in opening
+        )
+
+    def rebuild_levels(self):
+        """
+        Recompute the on-hand stock levels from the ledger, keeping reserved counts.
+        """
+        with transaction.atomic(using=self.db):
+            totals = self.values("part", "location").annotate(on_hand=Sum("quantity"))
+            levels = StockLevel.objects.using(self.db)
+            # Locked while rebuilt, movements recorded meanwhile wait for the new levels
+            list(levels.select_for_update().values_list("pk", flat=True))
+            rebuilt = levels.bulk_create(
+                [StockLevel(part_id=row["part"], location_id=row["location"], on_hand=row["on_hand"]) for row in totals],
+                update_conflicts=True,
+                unique_fields=["part", "location"],
+                update_fields=["on_hand", "updated_at"],
+            )
+            levels.exclude(pk__in=[level.pk for level in rebuilt]).update(on_hand=0, updated_at=Now())
+            return rebuilt
+
+    def transfer(self, part, quantity, from_location, to_location, reference="", note=""):
+        """
+        Move quantity of part between two locations, as an outgoing and an incoming movement.
+        """
+        with transaction.atomic(using=self.db):
+            return (
+                self.record(part, -quantity, "transfer", location=from_location, reference=reference, note=note),
+                self.record(part, quantity, "transfer", location=to_location, reference=reference, note=note),
+            )
+
+
+class StockMovement(models.Model):
+    """
+    Append-only ledger of stock changes; StockLevel holds their running totals.
+    """
+    REASON_CHOICES = [
+        ("receipt", _("Receipt")),
+        ("sale", _("Sale")),
+        ("repair", _("Repair")),
+        ("return", _("Return")),
+        ("transfer", _("Transfer")),
+        ("adjustment", _("Adjustment")),
+    ]
+
+    part = models.ForeignKey(
+        "tech.Part",
+        on_delete=models.PROTECT,
+        related_name="stock_movements",
+        verbose_name=_("part"),
+    )
+    location = models.ForeignKey(
+        "tech.Location",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="stock_movements",
+        verbose_name=_("location"),
+    )
+    quantity = models.IntegerField(_("quantity"), help_text=_("Positive for incoming stock, negative for outgoing"))
+    reason = models.CharField(_("reason"), max_length=20, choices=REASON_CHOICES)
+    reference = models.CharField(_("reference"), max_length=255, blank=True, help_text=_("e.g. repair uid or order number"))
+    note = models.TextField(_("note"), blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = StockMovementManager()
+
+    class Meta:
+        verbose_name = _("stock movement")
+        verbose_name_plural = _("stock movements")
+        indexes = [
+            # History of a part
+            models.Index(fields=["part", "-created_at"], name="stockmovement_part_created_idx"),
+            # Keyset pagination order of the ledger
+            models.Index(fields=["-created_at", "id"], name="stockmovement_created_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_reason_display()} {self.quantity:+d} of part {self.part_id}"
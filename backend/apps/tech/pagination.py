@@ -1,4 +1,45 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from datetime import date, datetime
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+def estimate_count(queryset):
+    """
+    Row count estimated by the PostgreSQL planner, without running COUNT(*).
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator (admin changelists) counting large tables with the
+    planner estimate instead of COUNT(*); small results are counted exactly.
+    """
+    # Below this many estimated rows an exact count is cheap enough
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate < self.exact_count_threshold:
+            return self.object_list.count()
+        return estimate
 
 
 class LargeResultsSetPagination(PageNumberPagination):
@@ -7,6 +48,153 @@ class LargeResultsSetPagination(PageNumberPagination):
     max_page_size = 1000
 
 
+def keyset_filter(ordering, values):
+    """
+    Rows after values in ordering, a sequence of field names with an optional
+    '-' prefix whose last field is unique: the row comparison
+    (a, b) > (x, y) expanded to a > x OR (a = x AND b > y), since directions
+    may be mixed, and led by a >= x so the index on the ordering is range-scanned.
+    """
+    fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+    after = Q()
+    for position, (name, descending) in enumerate(fields):
+        term = Q(**{f"{name}__{'lt' if descending else 'gt'}": values[position]})
+        for previous, (previous_name, _) in enumerate(fields[:position]):
+            term &= Q(**{previous_name: values[previous]})
+        after |= term
+    first, descending = fields[0]
+    return Q(**{f"{first}__{'lte' if descending else 'gte'}": values[0]}) & after
+
+
+def reverse_ordering(ordering):
+    return tuple(name[1:] if name.startswith('-') else f'-{name}' for name in ordering)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination on a composite ordering such as ('-date', 'pk'):
+    the cursor holds the ordering values of the row it continues from, and the
+    next page is the rows after them (see keyset_filter), whatever the number
+    of rows sharing a date. The total is reported on demand:
+    ?count=exact runs a COUNT(*), ?count=estimate asks the planner.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, ordering):
+        self.ordering = tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode == 'exact':
+            self.count = queryset.count()
+        elif count_mode == 'estimate':
+            self.count = estimate_count(queryset)
+        else:
+            self.count = None
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor[1]
+        # Previous pages are read backwards from the first row of the current one
+        ordering = reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            queryset = queryset.filter(keyset_filter(ordering, cursor[0]))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            return min(max(int(request.query_params[self.page_size_query_param]), 1), self.max_page_size)
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def row_values(self, row):
+        values = []
+        for name in self.ordering:
+            value = getattr(row, name.lstrip('-'))
+            values.append(value.isoformat() if isinstance(value, (date, datetime)) else value)
+        return values
+
+    def encode_cursor(self, row, reverse):
+        cursor = base64.urlsafe_b64encode(json.dumps([self.row_values(row), reverse], default=str).encode())
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor.decode())
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values, reverse = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, bool(reverse)
+
+    def get_next_link(self):
+        return self.encode_cursor(self.page[-1], False) if self.has_next and self.page else None
+
+    def get_previous_link(self):
+        return self.encode_cursor(self.page[0], True) if self.has_previous and self.page else None
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Page-number pagination unless the client opts in to keyset pagination with
+    ?pagination=cursor (or follows a ?cursor= link). Keyset pages cost the same at
+    any depth and skip the COUNT(*); the view declares the order to page through
+    with `cursor_ordering`, which should be backed by a matching index.
+    Querysets explicitly ordered otherwise, e.g. search results ranked by
+    relevance, keep page numbers, since keyset pages would reorder them.
+    """
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+
+    def keyset_requested(self, request):
+        return (request.query_params.get(self.mode_query_param) == 'cursor'
+                or self.cursor_query_param in request.query_params)
+
+    def keyset_ordered(self, queryset, ordering):
+        return not queryset.query.order_by or tuple(queryset.query.order_by) == tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        ordering = getattr(view, 'cursor_ordering', ('-pk',))
+        if self.keyset_requested(request) and self.keyset_ordered(queryset, ordering):
+            self.keyset = KeysetPagination(ordering)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
 class NoPagination:
     """
     A pagination class that returns all results without pagination.
@@ -15,10 +203,9 @@ class NoPagination:
         return None
 
     def get_paginated_response(self, data):
-        from rest_framework.response import Response
         return Response({
             'results': data
         })
 
     def to_representation(self, instance):
-        return instance
\ No newline at end of file
+        return instance
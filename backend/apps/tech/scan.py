@@ -0,0 +1,130 @@
+"""
+Barcode scan lookups.
+
+Scanned EAN-13 and SKU codes resolve to compact part records with their
+current stock, kept in a per-process LRU. Codes missing from the LRU are
+resolved together in one query, and cached codes cost none: the LRU is only
+checked against the database once per PART_SCAN_CHECK_INTERVAL. A check drops
+every record when the part-scan version of apps.tech.versioned_cache changed,
+which part, brand and product model writes bump, and otherwise only the
+records of parts whose stock levels were updated since the previous check.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.tech.models import Part, StockLevel
+from apps.tech.serializers.part import PartScanSerializer
+from apps.tech.versioned_cache import bump_cache_version, cache_version
+
+PART_SCAN_NAME = 'part-scan'
+PART_SCAN_CACHE_SIZE = getattr(settings, 'PART_SCAN_CACHE_SIZE', 4096)
+# Seconds a worker serves its LRU before checking it against the database
+PART_SCAN_CHECK_INTERVAL = getattr(settings, 'PART_SCAN_CHECK_INTERVAL', 2)
+# Stock levels updated this long before a check are looked at again by the
+# next one, for transactions that were still open and clock skew
+PART_SCAN_STOCK_LAG = timedelta(seconds=60)
+# Marks codes known to match no part, so repeated unknown scans are not queried again
+NOT_FOUND = object()
+
+
+class PartScanCache:
+    def __init__(self, maxsize=PART_SCAN_CACHE_SIZE, check_interval=PART_SCAN_CHECK_INTERVAL):
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = None
+        self.next_check = 0
+        self.records = OrderedDict()
+        self.lock = threading.Lock()
+
+    def lookup(self, codes):
+        """
+        Records of codes, None for unknown codes, in the order of codes.
+        """
+        self.check()
+        with self.lock:
+            version = self.version
+            found = {}
+            for code in codes:
+                if code in self.records:
+                    self.records.move_to_end(code)
+                    found[code] = self.records[code]
+
+        missing = [code for code in dict.fromkeys(codes) if code not in found]
+        if missing:
+            fetched = fetch_part_records(missing)
+            with self.lock:
+                # Records read under an older version are returned but not kept
+                if version == self.version:
+                    for code in missing:
+                        self.records[code] = found[code] = fetched.get(code, NOT_FOUND)
+                        self.records.move_to_end(code)
+                    while len(self.records) > self.maxsize:
+                        self.records.popitem(last=False)
+                else:
+                    for code in missing:
+                        found[code] = fetched.get(code, NOT_FOUND)
+
+        return [None if found[code] is NOT_FOUND else found[code] for code in codes]
+
+    def check(self):
+        """
+        Drop the records changed since the previous check, once per check interval.
+        """
+        with self.lock:
+            if time.monotonic() < self.next_check:
+                return
+            # Other threads keep serving the LRU while this one checks
+            self.next_check = time.monotonic() + self.check_interval
+            since = self.checked_at
+
+        checked_at = timezone.now()
+        version = cache_version(PART_SCAN_NAME)
+        changed_part_ids = set()
+        if version == self.version and since is not None:
+            changed_part_ids = set(
+                StockLevel.objects.filter(updated_at__gte=since - PART_SCAN_STOCK_LAG).values_list('part_id', flat=True)
+            )
+
+        with self.lock:
+            if version != self.version:
+                self.records.clear()
+                self.version = version
+            elif changed_part_ids:
+                for code, record in list(self.records.items()):
+                    if record is not NOT_FOUND and record['id'] in changed_part_ids:
+                        del self.records[code]
+            self.checked_at = checked_at
+
+
+def fetch_part_records(codes):
+    codes = set(codes)
+    stock = StockLevel.objects.filter(part=OuterRef('pk')).order_by().values('part').annotate(
+        total=Sum('on_hand')
+    ).values('total')
+    parts = Part.objects.filter(Q(ean13__in=codes) | Q(sku__in=codes)).select_related('brand', 'model').annotate(
+        stock=Coalesce(Subquery(stock, output_field=IntegerField()), 0)
+    )
+
+    records = {}
+    for part in parts:
+        record = dict(PartScanSerializer(part).data)
+        for code in (part.ean13, part.sku):
+            # An EAN-13 wins over a SKU spelled the same
+            if code in codes and (code not in records or code == part.ean13):
+                records[code] = record
+    return records
+
+
+def bump_part_scan_version():
+    bump_cache_version(PART_SCAN_NAME)
+
+
+part_scan_cache = PartScanCache()
@@ -1,21 +1,28 @@
 from .brand import BrandSerializer
 from .device_type import DeviceTypeSerializer
-from .part import PartSerializer
+from .part import PartSerializer, PartTypeaheadSerializer, PartScanSerializer
 from .product_model import ProductModelSerializer
 from .series import SeriesSerializer
 from .location import LocationSerializer
 from .supplier import SupplierSerializer
 from .stock_item import StockItemSerializer
+from .stock_movement import StockLevelSerializer, StockMovementSerializer
 from .store_order import StoreOrderSerializer
+from .image_derivatives import ImageDerivativesField
 
 __all__ = [
     "BrandSerializer",
     "DeviceTypeSerializer",
     "PartSerializer",
+    "PartTypeaheadSerializer",
+    "PartScanSerializer",
     "ProductModelSerializer",
     "SeriesSerializer",
     "LocationSerializer",
     "SupplierSerializer",
     "StockItemSerializer",
+    "StockMovementSerializer",
+    "StockLevelSerializer",
     "StoreOrderSerializer",
+    "ImageDerivativesField",
 ]
\ No newline at end of file
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+from apps.tech.images import derivative_urls
+
+
+class ImageDerivativesField(serializers.Field):
+    """
+    Read-only URLs of the resized copies of an image field, keyed by size
+    (see apps.tech.images.DERIVATIVE_SIZES). Absolute when the request is known,
+    like DRF's ImageField.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        urls = derivative_urls(value)
+        if urls is None:
+            return None
+        request = self.context.get('request')
+        if request is not None:
+            urls = {size: request.build_absolute_uri(url) for size, url in urls.items()}
+        return urls
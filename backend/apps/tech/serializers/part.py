@@ -13,4 +13,20 @@ class PartSerializer(serializers.ModelSerializer):
             'price', 'repair_price', 'special_price', 'other_price',
             'brand', 'brand_name', 'model', 'model_name',
             'created_at', 'updated_at'
-        ]
\ No newline at end of file
+        ]
+
+
+class PartTypeaheadSerializer(serializers.ModelSerializer):
+    brand_name = serializers.CharField(source='brand.name', read_only=True, default=None)
+    model_name = serializers.CharField(source='model.name', read_only=True, default=None)
+
+    class Meta:
+        model = Part
+        fields = ['id', 'name', 'sku', 'ean13', 'brand_name', 'model_name', 'price', 'repair_price']
+
+
+class PartScanSerializer(PartTypeaheadSerializer):
+    stock = serializers.IntegerField(read_only=True)
+
+    class Meta(PartTypeaheadSerializer.Meta):
+        fields = PartTypeaheadSerializer.Meta.fields + ['stock']
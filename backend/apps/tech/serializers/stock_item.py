@@ -1,6 +1,6 @@
 from apps.tech.serializers.part import PartSerializer
 from rest_framework import serializers
-from ..models import StockItem
+from ..models import InsufficientStock, StockItem
 
 class StockItemSerializer(serializers.ModelSerializer):
     part = PartSerializer(read_only=True)
@@ -8,4 +8,14 @@ class StockItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = StockItem
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+
+    # Quantity changes are recorded in the stock movement ledger
+    def create(self, validated_data):
+        return StockItem.objects.receive(**validated_data)
+
+    def update(self, instance, validated_data):
+        try:
+            return StockItem.objects.change(instance, **validated_data)
+        except InsufficientStock as e:
+            raise serializers.ValidationError({"quantity": str(e)})
@@ -0,0 +1,35 @@
+from rest_framework import serializers
+from ..models import InsufficientStock, StockLevel, StockMovement
+
+
+class StockMovementSerializer(serializers.ModelSerializer):
+    part_name = serializers.CharField(source="part.name", read_only=True)
+    location_name = serializers.CharField(source="location.name", read_only=True, default=None)
+
+    class Meta:
+        model = StockMovement
+        fields = [
+            "id", "part", "part_name", "location", "location_name", "quantity",
+            "reason", "reference", "note", "created_at",
+        ]
+        read_only_fields = ["created_at"]
+
+    def validate_quantity(self, value):
+        if value == 0:
+            raise serializers.ValidationError("A movement must change the stock.")
+        return value
+
+    def create(self, validated_data):
+        try:
+            return StockMovement.objects.record(**validated_data)
+        except InsufficientStock as e:
+            raise serializers.ValidationError({"quantity": str(e)})
+
+
+class StockLevelSerializer(serializers.ModelSerializer):
+    location_name = serializers.CharField(source="location.name", read_only=True, default=None)
+    available = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = StockLevel
+        fields = ["id", "part", "location", "location_name", "on_hand", "reserved", "available", "updated_at"]
@@ -0,0 +1,78 @@
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.tech.catalog_tree import bump_catalog_tree_version
+from apps.tech.models import Brand, DeviceType, Part, ProductModel, Series, StockLevel, StockMovement
+from apps.tech.scan import bump_part_scan_version
+
+# Models of the catalog tree snapshot
+CATALOG_TREE_MODELS = [DeviceType, Brand, Series, ProductModel]
+# Models read by part scan records, brand and model for their names; stock
+# changes are picked up per part from the stock levels (see apps.tech.scan)
+PART_SCAN_MODELS = [Part, Brand, ProductModel]
+# Part fields copied into Part.search_text
+PART_SEARCH_FIELDS = {"name", "sku", "ean13", "brand", "brand_id", "model", "model_id"}
+
+
+def install_search_extensions(sender, using, **kwargs):
+    # Trigram indexes need pg_trgm before the first migration creating them runs
+    with connections[using].cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def backfill_stock_levels(sender, using, **kwargs):
+    # Stock entered as stock items before the ledger existed opens it, so the
+    # stock levels read by scans and reservations start from it
+    if StockLevel._meta.db_table not in connections[using].introspection.table_names():
+        return
+    with transaction.atomic(using=using):
+        if StockMovement.objects.db_manager(using).open_from_stock_items():
+            StockMovement.objects.db_manager(using).rebuild_levels()
+
+
+@receiver(post_save, sender=Part)
+def refresh_part_search(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not PART_SEARCH_FIELDS & set(update_fields)):
+        return
+    Part.objects.filter(pk=instance.pk).refresh_search()
+
+
+@receiver(post_save, sender=Brand)
+def refresh_brand_part_search(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        Part.objects.filter(brand=instance).refresh_search()
+
+
+@receiver(post_save, sender=ProductModel)
+def refresh_product_model_part_search(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        Part.objects.filter(model=instance).refresh_search()
+
+
+def invalidate_catalog_tree(sender, raw=False, **kwargs):
+    if not raw:
+        bump_catalog_tree_version()
+
+
+for catalog_tree_model in CATALOG_TREE_MODELS:
+    post_save.connect(
+        invalidate_catalog_tree, sender=catalog_tree_model, dispatch_uid=f"catalog_tree_save_{catalog_tree_model.__name__}"
+    )
+    post_delete.connect(
+        invalidate_catalog_tree, sender=catalog_tree_model, dispatch_uid=f"catalog_tree_delete_{catalog_tree_model.__name__}"
+    )
+
+
+def invalidate_part_scans(sender, raw=False, **kwargs):
+    if not raw:
+        bump_part_scan_version()
+
+
+for part_scan_model in PART_SCAN_MODELS:
+    post_save.connect(
+        invalidate_part_scans, sender=part_scan_model, dispatch_uid=f"part_scan_save_{part_scan_model.__name__}"
+    )
+    post_delete.connect(
+        invalidate_part_scans, sender=part_scan_model, dispatch_uid=f"part_scan_delete_{part_scan_model.__name__}"
+    )
@@ -0,0 +1,32 @@
+"""
+The catalog tree is served gzip-encoded or not, each encoding with its own ETag.
+"""
+import gzip
+import json
+
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/tech/catalog-tree/"
+
+
+def test_encodings_have_their_own_etag(client):
+    identity = client.get(URL)
+    compressed = client.get(URL, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert "Content-Encoding" not in identity
+    assert compressed["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed.content)) == json.loads(identity.content)
+    assert compressed["ETag"] != identity["ETag"]
+    assert "Accept-Encoding" in compressed["Vary"] and "Accept-Encoding" in identity["Vary"]
+
+
+def test_etag_of_the_other_encoding_does_not_match(client):
+    identity = client.get(URL)
+    compressed = client.get(URL, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert client.get(URL, HTTP_IF_NONE_MATCH=identity["ETag"]).status_code == 304
+    assert client.get(URL, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=compressed["ETag"]).status_code == 304
+    assert client.get(URL, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=identity["ETag"]).status_code == 200
+    assert client.get(URL, HTTP_IF_NONE_MATCH=compressed["ETag"]).status_code == 200
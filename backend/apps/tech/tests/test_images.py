@@ -0,0 +1,19 @@
+"""
+Derivative names of uploaded images.
+"""
+from apps.tech.images import DERIVATIVE_EXTENSION, DERIVATIVE_SIZES, derivative_name
+
+
+def test_derivatives_are_stored_next_to_the_source():
+    assert derivative_name("repairs/photo.jpg", "thumbnail") == (
+        f"repairs/derivatives/photo.jpg_thumbnail.{DERIVATIVE_EXTENSION}"
+    )
+
+
+def test_sources_differing_by_extension_do_not_share_derivatives():
+    names = {
+        derivative_name(source, size)
+        for source in ["repairs/photo.jpg", "repairs/photo.png", "repairs/photo"]
+        for size in DERIVATIVE_SIZES
+    }
+    assert len(names) == 3 * len(DERIVATIVE_SIZES)
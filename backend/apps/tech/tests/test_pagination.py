@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import User
+from apps.repairs.models import Repair
+
+
+@pytest.fixture
+def repairs(db):
+    """
+    25 repairs on the same day and 5 on the day before.
+    """
+    client = User.objects.create(username="client")
+    days = [date(2025, 1, 2)] * 25 + [date(2025, 1, 1)] * 5
+    return [
+        Repair.objects.create(uid=f"R{n}", date=day, client=client, description="Ecran")
+        for n, day in enumerate(days)
+    ]
+
+
+def follow(api_client, url, link):
+    ids, pages = [], 0
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        ids.extend(row["id"] for row in response.json()["results"])
+        url = response.json()[link]
+        pages += 1
+    return ids, pages
+
+
+def test_keyset_pages_through_rows_sharing_a_date(api_client, repairs):
+    ids, pages = follow(api_client, "/api/repairs/repairs/?pagination=cursor&page_size=4", "next")
+
+    expected = sorted(repairs, key=lambda repair: (-repair.date.toordinal(), repair.pk))
+    assert ids == [repair.pk for repair in expected]
+    assert pages == 8
+
+
+def test_keyset_previous_links_return_the_same_pages(api_client, repairs):
+    url = "/api/repairs/repairs/?pagination=cursor&page_size=4"
+    for _ in range(7):
+        url = api_client.get(url).json()["next"]
+    last_page = api_client.get(url).json()
+
+    ids, _ = follow(api_client, last_page["previous"], "previous")
+
+    expected = sorted(repairs, key=lambda repair: (-repair.date.toordinal(), repair.pk))
+    assert ids == [repair.pk for page in reversed(range(7)) for repair in expected[page * 4:page * 4 + 4]]
+
+
+def test_keyset_filters_on_every_ordering_column(api_client, repairs):
+    first_page = api_client.get("/api/repairs/repairs/?pagination=cursor&page_size=4").json()
+
+    with CaptureQueriesContext(connection) as queries:
+        api_client.get(first_page["next"])
+
+    sql = next(query["sql"] for query in queries.captured_queries if 'FROM "repairs_repair"' in query["sql"])
+    assert "OFFSET" not in sql
+    assert '"repairs_repair"."date" <=' in sql and '"repairs_repair"."id" >' in sql
+
+
+def test_invalid_cursor(api_client, repairs):
+    assert api_client.get("/api/repairs/repairs/?cursor=nonsense").status_code == 404
@@ -0,0 +1,62 @@
+"""
+List endpoints run a fixed number of queries per page, whatever the page size.
+"""
+import pytest
+
+from apps.tech.models import Brand, Location, Part, ProductModel, StockItem, StoreOrder, Supplier
+
+# Page sizes compared by every test, the second a full page
+PAGE_SIZES = [1, 9]
+
+
+@pytest.fixture
+def make_parts(db):
+    def make_parts(count):
+        brand = Brand.objects.create(name="Apple")
+        product_model = ProductModel.objects.create(name="iPhone 14", brand=brand)
+        return [
+            Part.objects.create(name=f"Ecran {n}", sku=f"SKU{n}", ean13=f"{n:013d}", brand=brand, model=product_model)
+            for n in range(count)
+        ]
+    return make_parts
+
+
+@pytest.mark.parametrize("size", PAGE_SIZES)
+def test_part_list(api_client, make_parts, django_assert_num_queries, size):
+    make_parts(size)
+    # COUNT and the rows with their brand and model
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/tech/parts/")
+    assert len(response.json()["results"]) == size
+
+
+@pytest.mark.parametrize("size", PAGE_SIZES)
+def test_stock_item_list(api_client, make_parts, django_assert_num_queries, size):
+    location = Location.objects.create(name="Boutique")
+    for part in make_parts(size):
+        StockItem.objects.create(part=part, location=location, quantity=1)
+    # COUNT and the rows with their part, its brand and model, and location
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/tech/stock-items/")
+    assert len(response.json()["results"]) == size
+
+
+@pytest.mark.parametrize("size", PAGE_SIZES)
+def test_store_order_list(api_client, django_assert_num_queries, size, db):
+    for n in range(size):
+        StoreOrder.objects.create(supplier=Supplier.objects.create(name=f"Supplier {n}"))
+    # COUNT and the rows with their supplier
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/tech/store-orders/")
+    assert len(response.json()["results"]) == size
+
+
+@pytest.mark.parametrize("size", PAGE_SIZES)
+def test_product_model_list(api_client, django_assert_num_queries, size, db):
+    brand = Brand.objects.create(name="Samsung")
+    for n in range(size):
+        ProductModel.objects.create(name=f"Galaxy S{n}", brand=brand)
+    # Not paginated; only foreign key ids are serialized
+    with django_assert_num_queries(1):
+        response = api_client.get(f"/api/tech/product-models/?brand={brand.pk}")
+    assert len(response.json()) == size
@@ -0,0 +1,65 @@
+"""
+The part scan cache answers repeated scans without queries and drops only the
+records that changed.
+"""
+import pytest
+
+from apps.tech.models import Location, Part, StockMovement
+from apps.tech.scan import PartScanCache
+
+
+@pytest.fixture
+def parts(db):
+    location = Location.objects.create(name="Boutique")
+    parts = [Part.objects.create(name=f"Ecran {n}", sku=f"SKU{n}", ean13=f"{n:013d}") for n in range(2)]
+    for part in parts:
+        StockMovement.objects.record(part, 3, "receipt", location=location)
+    return parts
+
+
+def stock(records):
+    return [record["stock"] if record else None for record in records]
+
+
+def test_cached_scans_run_no_query(parts, django_assert_num_queries):
+    cache = PartScanCache(check_interval=60)
+    cache.lookup(["SKU0"])
+
+    with django_assert_num_queries(0):
+        records = cache.lookup(["SKU0", "SKU0"])
+    assert [record["id"] for record in records] == [parts[0].pk, parts[0].pk]
+
+
+def test_missing_codes_are_fetched_in_one_query(parts, django_assert_num_queries):
+    cache = PartScanCache(check_interval=60)
+    cache.lookup(["SKU0"])
+
+    with django_assert_num_queries(1):
+        records = cache.lookup(["SKU0", "0000000000001", "UNKNOWN"])
+    assert stock(records) == [3, 3, None]
+    # Unknown codes are remembered too
+    with django_assert_num_queries(0):
+        assert cache.lookup(["UNKNOWN"]) == [None]
+
+
+def test_stock_changes_drop_only_their_part(parts, django_assert_num_queries):
+    cache = PartScanCache(check_interval=0)
+    cache.lookup(["SKU0", "SKU1"])
+
+    StockMovement.objects.record(parts[0], -1, "sale", location=Location.objects.get())
+
+    # The version and the changed stock levels, then the changed part
+    with django_assert_num_queries(3):
+        records = cache.lookup(["SKU0", "SKU1"])
+    assert stock(records) == [2, 3]
+
+
+def test_part_changes_drop_every_record(parts, django_capture_on_commit_callbacks):
+    cache = PartScanCache(check_interval=0)
+    cache.lookup(["SKU0", "SKU2"])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Part.objects.create(name="Batterie", sku="SKU2")
+
+    records = cache.lookup(["SKU0", "SKU2"])
+    assert [record["name"] for record in records] == ["Ecran 0", "Batterie"]
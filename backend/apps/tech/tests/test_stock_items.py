@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+from django.db import connections
+from django.db.models import Sum
+
+from apps.tech.models import Location, Part, StockItem, StockLevel, StockMovement
+from apps.tech.signals import backfill_stock_levels
+
+
+@pytest.fixture
+def part(db):
+    return Part.objects.create(name="Ecran", sku="SKU1", ean13="0000000000001")
+
+
+@pytest.fixture
+def location(db):
+    return Location.objects.create(name="Boutique")
+
+
+def on_hand(part, location):
+    return StockLevel.objects.get(part=part, location=location).on_hand
+
+
+def test_received_item_is_recorded(part, location):
+    StockItem.objects.receive(part=part, location=location, quantity=5)
+
+    assert on_hand(part, location) == 5
+    assert StockMovement.objects.get().reason == "receipt"
+
+
+def test_quantity_edits_are_recorded(api_client, part, location):
+    item = StockItem.objects.receive(part=part, location=location, quantity=5)
+
+    response = api_client.patch(f"/api/tech/stock-items/{item.pk}/", {"quantity": 3}, format="json")
+
+    assert response.status_code == 200
+    assert on_hand(part, location) == 3
+    assert list(StockMovement.objects.order_by("pk").values_list("quantity", flat=True)) == [5, -2]
+
+
+def test_moved_item_is_transferred(api_client, part, location):
+    depot = Location.objects.create(name="Depot")
+    item = StockItem.objects.receive(part=part, location=location, quantity=5)
+
+    api_client.patch(f"/api/tech/stock-items/{item.pk}/", {"location": depot.pk}, format="json")
+
+    assert (on_hand(part, location), on_hand(part, depot)) == (0, 5)
+
+
+def test_deleted_item_is_recorded(api_client, part, location):
+    item = StockItem.objects.receive(part=part, location=location, quantity=5)
+
+    assert api_client.delete(f"/api/tech/stock-items/{item.pk}/").status_code == 204
+    assert on_hand(part, location) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_edits_keep_the_ledger_in_step(part, location):
+    item = StockItem.objects.receive(part=part, location=location, quantity=10)
+
+    def change(quantity):
+        try:
+            StockItem.objects.change(StockItem.objects.get(pk=item.pk), quantity=quantity)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=change, args=(quantity,)) for quantity in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    item.refresh_from_db()
+    assert StockMovement.objects.aggregate(total=Sum("quantity"))["total"] == item.quantity
+    assert on_hand(part, location) == item.quantity
+
+
+def test_stock_items_without_movements_are_backfilled(api_client, part, location):
+    StockItem.objects.bulk_create([StockItem(part=part, location=location, quantity=4)])
+
+    backfill_stock_levels(sender=None, using="default")
+
+    assert on_hand(part, location) == 4
+    assert api_client.get(f"/api/tech/parts/scan/?code={part.sku}").json()["stock"] == 4
@@ -7,9 +7,13 @@ from .views import (
     LocationViewSet,
     SupplierViewSet,
     StockItemViewSet,
+    StockMovementViewSet,
+    StockLevelViewSet,
     StoreOrderViewSet,
     DeviceTypeViewSet,
 )
+from .views.catalog_tree import catalog_tree
+from .async_views import AsyncReadView
 
 router = DefaultRouter()
 router.register(r'parts', PartViewSet)
@@ -18,9 +22,19 @@ router.register(r'product-models', ProductModelViewSet)
 router.register(r'locations', LocationViewSet)
 router.register(r'suppliers', SupplierViewSet)
 router.register(r'stock-items', StockItemViewSet)
+router.register(r'stock-movements', StockMovementViewSet)
+router.register(r'stock-levels', StockLevelViewSet)
 router.register(r'store-orders', StoreOrderViewSet)
 router.register(r'device-types', DeviceTypeViewSet)
 
+async_brands = AsyncReadView.for_viewset(BrandViewSet)
+async_product_models = AsyncReadView.for_viewset(ProductModelViewSet)
+
 urlpatterns = [
+    path('catalog-tree/', catalog_tree, name='catalog-tree'),
+    path('async/brands/', async_brands, name='brand-async-list'),
+    path('async/brands/<int:pk>/', async_brands, name='brand-async-detail'),
+    path('async/product-models/', async_product_models, name='productmodel-async-list'),
+    path('async/product-models/<int:pk>/', async_product_models, name='productmodel-async-detail'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Cache entries invalidated by version.
+
+Each cached resource has a version number in the database (CacheVersion);
+entries are stored in the cache under keys including the version, so bumping
+it makes every entry of the resource unreachable at once. Reading the version
+costs a primary key lookup, but bumps made by management commands or other
+workers are seen by every process even with a per-process cache backend.
+Versions are bumped after the writing transaction commits, otherwise a
+concurrent read could cache the old rows under the new version.
+"""
+import hashlib
+import time
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Now
+
+from apps.tech.models import CacheVersion
+
+# Entries of old versions expire on their own
+VERSIONED_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def cache_version(name):
+    # 0 until the first bump
+    return CacheVersion.objects.filter(name=name).values_list('version', flat=True).first() or 0
+
+
+def _bump_cache_version(name):
+    if CacheVersion.objects.filter(name=name).update(version=F('version') + 1, updated_at=Now()):
+        return
+    try:
+        with transaction.atomic():
+            # Seeded from the clock so a recreated row never reuses an older version
+            CacheVersion.objects.create(name=name, version=time.time_ns())
+    except IntegrityError:
+        # Created by a concurrent bump
+        CacheVersion.objects.filter(name=name).update(version=F('version') + 1, updated_at=Now())
+
+
+def bump_cache_version(name):
+    transaction.on_commit(lambda: _bump_cache_version(name))
+
+
+def content_etag(content):
+    return f'"{hashlib.sha256(content).hexdigest()}"'
+
+
+def etag_matches(request, etag):
+    if_none_match = request.headers.get('If-None-Match', '')
+    return if_none_match.strip() == '*' or etag in (tag.strip() for tag in if_none_match.split(','))
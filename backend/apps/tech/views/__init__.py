@@ -4,6 +4,7 @@ from .product_model import ProductModelViewSet
 from .location_viewset import LocationViewSet
 from .supplier_viewset import SupplierViewSet
 from .stock_item_viewset import StockItemViewSet
+from .stock_movement_viewset import StockLevelViewSet, StockMovementViewSet
 from .store_order_viewset import StoreOrderViewSet
 from .device_type import DeviceTypeViewSet
 from .series import SeriesViewSet
@@ -15,6 +16,8 @@ __all__ = [
     "LocationViewSet",
     "SupplierViewSet",
     "StockItemViewSet",
+    "StockMovementViewSet",
+    "StockLevelViewSet",
     "StoreOrderViewSet",
     "DeviceTypeViewSet",
     "SeriesViewSet",
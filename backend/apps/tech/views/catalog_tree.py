@@ -0,0 +1,33 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_GET
+
+from apps.tech.catalog_tree import catalog_tree_snapshot
+from apps.tech.versioned_cache import etag_matches
+
+# Seconds browsers reuse the snapshot before revalidating it
+CATALOG_TREE_MAX_AGE = 300
+
+
+@require_GET
+def catalog_tree(request):
+    """
+    The whole device catalog (device types > brands > series > product models)
+    in one prebuilt document, gzip-encoded for clients accepting it, so model
+    selection at intake needs no further requests.
+    """
+    snapshot = catalog_tree_snapshot()
+    gzipped = 'gzip' in request.headers.get('Accept-Encoding', '')
+    etag = snapshot.compressed_etag if gzipped else snapshot.etag
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    elif gzipped:
+        response = HttpResponse(snapshot.compressed, content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(snapshot.content, content_type='application/json')
+
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={CATALOG_TREE_MAX_AGE}'
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
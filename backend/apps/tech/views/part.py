@@ -1,7 +1,21 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Case, FloatField, Q, Value, When
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
 from django_filters import rest_framework as filters
 from apps.tech.models import Part
-from apps.tech.serializers.part import PartSerializer
+from apps.tech.scan import part_scan_cache
+from apps.tech.pagination import OptionalCursorPagination
+from apps.tech.serializers.part import PartSerializer, PartTypeaheadSerializer
+
+# Trigrams need three characters; shorter input would scan the whole index
+TYPEAHEAD_MIN_LENGTH = 3
+TYPEAHEAD_LIMIT = 10
+TYPEAHEAD_MAX_LIMIT = 25
+# Codes accepted by one batch scan
+SCAN_MAX_CODES = 200
 
 
 class PartFilter(filters.FilterSet):
@@ -17,7 +31,68 @@ class PartFilter(filters.FilterSet):
 
 
 class PartViewSet(viewsets.ModelViewSet):
-    queryset = Part.objects.all()
+    queryset = Part.objects.select_related('brand', 'model')
     serializer_class = PartSerializer
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('name', 'pk')
     filter_backends = (filters.DjangoFilterBackend,)
-    filterset_class = PartFilter
\ No newline at end of file
+    filterset_class = PartFilter
+
+    @action(detail=False, methods=['get'])
+    def typeahead(self, request):
+        """
+        Parts matching ?q= as typed, for incremental search at the counter:
+        substring or fuzzy matches of name, sku, barcode, brand and model names
+        on the trigram index of Part.search_text, best matches first, at most ?limit= results.
+        """
+        text = ' '.join(request.query_params.get('q', '').lower().split())
+        if len(text) < TYPEAHEAD_MIN_LENGTH:
+            return Response([])
+        try:
+            limit = min(int(request.query_params.get('limit', TYPEAHEAD_LIMIT)), TYPEAHEAD_MAX_LIMIT)
+        except ValueError:
+            limit = TYPEAHEAD_LIMIT
+
+        # Every word must appear, as typed or misspelled, in any order
+        matches = Q()
+        for word in text.split():
+            matches &= Q(search_text__contains=word) | Q(search_text__trigram_word_similar=word)
+
+        parts = Part.objects.filter(matches).select_related('brand', 'model').annotate(
+            rank=TrigramWordSimilarity(text, 'search_text') + Case(
+                # A scanned or typed code wins, then names starting with the input
+                When(Q(sku__iexact=text) | Q(ean13=text), then=Value(1.0)),
+                When(name__istartswith=text, then=Value(0.5)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        ).order_by('-rank', 'name', 'pk')[:max(limit, 1)]
+        return Response(PartTypeaheadSerializer(parts, many=True).data)
+
+    @action(detail=False, methods=['get', 'post'])
+    def scan(self, request):
+        """
+        Parts by scanned EAN-13 or SKU, with their current stock.
+        GET ?code= resolves one code (404 when unknown); POST {"codes": [...]}
+        resolves a burst of scans, answering one record or null per code, in order.
+        """
+        if request.method == 'GET':
+            code = request.query_params.get('code', '').strip()
+            if not code:
+                raise ValidationError({'code': 'A code to look up is required.'})
+            record = part_scan_cache.lookup([code])[0]
+            if record is None:
+                raise NotFound(f'No part with code {code}.')
+            return Response(record)
+
+        codes = request.data.get('codes')
+        if not isinstance(codes, list) or not codes:
+            raise ValidationError({'codes': 'A list of codes is required.'})
+        if len(codes) > SCAN_MAX_CODES:
+            raise ValidationError({'codes': f'At most {SCAN_MAX_CODES} codes can be scanned at once.'})
+        codes = [str(code).strip() for code in codes]
+        records = part_scan_cache.lookup(codes)
+        return Response({
+            'results': [{'code': code, 'part': record} for code, record in zip(codes, records)],
+            'missing': [code for code, record in zip(codes, records) if record is None],
+        })
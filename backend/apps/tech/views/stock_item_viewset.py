@@ -1,8 +1,18 @@
-from rest_framework import viewsets
-from apps.tech.models import StockItem
+from rest_framework import serializers, viewsets
+from apps.tech.models import InsufficientStock, StockItem
+from apps.tech.pagination import OptionalCursorPagination
 from apps.tech.serializers import StockItemSerializer
 
 
 class StockItemViewSet(viewsets.ModelViewSet):
-    queryset = StockItem.objects.all()
+    # The nested part shows its brand and model names
+    queryset = StockItem.objects.select_related('part__brand', 'part__model', 'location')
     serializer_class = StockItemSerializer
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-created_at', 'pk')
+
+    def perform_destroy(self, instance):
+        try:
+            StockItem.objects.remove(instance)
+        except InsufficientStock as e:
+            raise serializers.ValidationError({'quantity': str(e)})
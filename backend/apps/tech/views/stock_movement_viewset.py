@@ -0,0 +1,77 @@
+from django.db.models import F, Sum
+from django_filters import rest_framework as filters
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from apps.tech.models import InsufficientStock, Location, Part, StockLevel, StockMovement
+from apps.tech.pagination import OptionalCursorPagination
+from apps.tech.serializers import StockLevelSerializer, StockMovementSerializer
+
+
+class StockTransferSerializer(serializers.Serializer):
+    part = serializers.PrimaryKeyRelatedField(queryset=Part.objects.all())
+    quantity = serializers.IntegerField(min_value=1)
+    from_location = serializers.PrimaryKeyRelatedField(queryset=Location.objects.all(), allow_null=True)
+    to_location = serializers.PrimaryKeyRelatedField(queryset=Location.objects.all(), allow_null=True)
+    reference = serializers.CharField(required=False, allow_blank=True, default="")
+    note = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class StockMovementViewSet(mixins.CreateModelMixin,
+                           mixins.ListModelMixin,
+                           mixins.RetrieveModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    Append-only stock ledger. Creating a movement applies it to the stock level
+    of its part and location; movements are never edited or deleted, mistakes
+    are corrected by an adjustment.
+    """
+    queryset = StockMovement.objects.select_related('part', 'location')
+    serializer_class = StockMovementSerializer
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-created_at', 'pk')
+    filter_backends = [filters.DjangoFilterBackend]
+    filterset_fields = ['part', 'location', 'reason']
+
+    @action(detail=False, methods=['post'])
+    def transfer(self, request):
+        serializer = StockTransferSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            movements = StockMovement.objects.transfer(**serializer.validated_data)
+        except InsufficientStock as e:
+            raise serializers.ValidationError({'quantity': str(e)})
+        return Response(StockMovementSerializer(movements, many=True).data, status=status.HTTP_201_CREATED)
+
+
+class StockLevelViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    On-hand stock per part and location, maintained by the stock ledger, and
+    the units of it reserved for repairs.
+    """
+    queryset = StockLevel.objects.select_related('location').order_by('part', 'location')
+    serializer_class = StockLevelSerializer
+    filter_backends = [filters.DjangoFilterBackend]
+    filterset_fields = ['part', 'location']
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """
+        On-hand, reserved and available-to-promise stock per part across
+        locations; ?part= may be repeated.
+        """
+        levels = StockLevel.objects.order_by('part')
+        part_ids = request.query_params.getlist('part')
+        if part_ids:
+            try:
+                levels = levels.filter(part__in=[int(part_id) for part_id in part_ids])
+            except ValueError:
+                raise serializers.ValidationError({'part': 'Part ids must be integers.'})
+        totals = levels.values('part').annotate(on_hand=Sum('on_hand'), reserved=Sum('reserved')).annotate(
+            available=F('on_hand') - F('reserved')
+        )
+
+        page = self.paginate_queryset(totals)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(totals))
@@ -4,5 +4,5 @@ from apps.tech.serializers import StoreOrderSerializer
 
 
 class StoreOrderViewSet(viewsets.ModelViewSet):
-    queryset = StoreOrder.objects.all()
+    queryset = StoreOrder.objects.select_related('supplier')
     serializer_class = StoreOrderSerializer
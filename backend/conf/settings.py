@@ -41,6 +41,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -136,6 +137,16 @@ DATABASES = {
     }
 }
 
+# =========================================
+# CACHE CONFIGURATION
+# =========================================
+# Cached catalogs are versioned in the database, so a per-process cache only
+# costs each worker its own copy; a shared backend avoids that, e.g.
+# CACHE_URL=rediscache://redis:6379/1
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
 
 # =========================================
 # ELASTICSEARCH CONFIGURATION
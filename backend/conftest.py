@@ -0,0 +1,16 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def api_client(admin_user):
+    client = APIClient()
+    client.force_authenticate(admin_user)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cached catalogs and versions must not leak between tests
+    cache.clear()